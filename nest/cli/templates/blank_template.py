@@ -9,7 +9,7 @@ class BlankTemplate(BaseTemplate, ABC):
         super().__init__(module_name)
 
     def app_file(self):
-        return f"""from nest.core import PyNestFactory, Module
+        return f"""from nest.core import BootstrapMode, Module, PyNestFactory
         
 from .app_controller import AppController
 from .app_service import AppService
@@ -22,6 +22,7 @@ class AppModule:
 
 app = PyNestFactory.create(
     AppModule,
+    bootstrap=BootstrapMode.LIFESPAN,
     description="This is my PyNest app.",
     title="PyNest Application",
     version="1.0.0",
@@ -13,7 +13,7 @@ class ORMTemplate(BaseTemplate, ABC):
         self.db_type = db_type
 
     def app_file(self):
-        return f"""from nest.core import PyNestFactory, Module
+        return f"""from nest.core import BootstrapMode, Module, PyNestFactory
 from .config import config
 from .app_controller import AppController
 from .app_service import AppService
@@ -26,6 +26,7 @@ class AppModule:
 
 app = PyNestFactory.create(
     AppModule,
+    bootstrap=BootstrapMode.LIFESPAN,
     description="This is my PyNest app.",
     title="PyNest Application",
     version="1.0.0",
@@ -207,7 +208,7 @@ config:
 
 class AsyncORMTemplate(ORMTemplate, ABC):
     def app_file(self):
-        return f"""from nest.core import PyNestFactory, Module
+        return f"""from nest.core import BootstrapMode, Module, PyNestFactory
 from .config import config
 from .app_controller import AppController
 from .app_service import AppService
@@ -220,6 +221,7 @@ class AppModule:
 
 app = PyNestFactory.create(
     AppModule,
+    bootstrap=BootstrapMode.LIFESPAN,
     description="This is my Async PyNest app.",
     title="PyNest Application",
     version="1.0.0",
@@ -30,4 +30,5 @@ from nest.common.interfaces import (
     OnApplicationShutdown,
     OnModuleDestroy,
     OnModuleInit,
+    OnRequestDestroy,
 )
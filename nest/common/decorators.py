@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import keyword
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Tuple
+from typing import Any, Awaitable, Callable, FrozenSet, Optional, Tuple
 
 from fastapi import Body as FastAPIBody
-from fastapi import Depends
 from fastapi import Header as FastAPIHeader
 from fastapi import Path as FastAPIPath
 from fastapi import Query as FastAPIQuery
 from fastapi import Request, Response
 from pydantic import TypeAdapter
 
+from nest.common.tracing import phase
+
 
 _MISSING = object()
 
@@ -112,211 +114,303 @@ def has_param_decorators(endpoint: Callable) -> bool:
     )
 
 
-def wrap_param_decorators(endpoint: Callable) -> Callable:
+def wrap_param_decorators(
+    endpoint: Callable,
+    exception_handler: Optional[Callable[[Exception, Request], Awaitable[Any]]] = None,
+) -> Callable:
+    """Compile the decorated parameters of ``endpoint`` into one argument plan.
+
+    The plan is built once, at route registration. FastAPI sees a single flat
+    signature holding every source value the plan needs, and each request
+    runs the precompiled extractors in one pass before calling ``endpoint``.
+
+    When ``exception_handler`` is given, the same generated call also guards
+    argument resolution and the handler itself: any exception is passed to
+    ``exception_handler(exc, request)``, which returns the response or
+    re-raises. This keeps a filtered route at a single wrapper layer.
+    """
+    plan = compile_argument_plan(
+        endpoint, require_request=exception_handler is not None
+    )
+    steps = plan.steps
+    synthetic_names = plan.synthetic_names
+    request_name = plan.request_name
+
+    async def wrapper(*args, **kwargs):
+        request = kwargs[request_name] if request_name is not None else None
+        try:
+            with phase("params"):
+                call_kwargs = {
+                    name: value
+                    for name, value in kwargs.items()
+                    if name not in synthetic_names
+                }
+                for step in steps:
+                    value = step.extract(kwargs)
+                    if step.is_async and inspect.isawaitable(value):
+                        value = await value
+                    for pipe in step.pipes:
+                        value = pipe(value)
+                        if inspect.isawaitable(value):
+                            value = await value
+                    if step.coerce is not None:
+                        value = step.coerce(value)
+                    call_kwargs[step.target] = value
+            result = endpoint(*args, **call_kwargs)
+            if inspect.isawaitable(result):
+                return await result
+            return result
+        except Exception as exc:
+            if exception_handler is None:
+                raise
+            return await exception_handler(exc, request)
+
+    wrapper.__name__ = getattr(endpoint, "__name__", "param_decorator_wrapper")
+    wrapper.__signature__ = plan.signature
+    return wrapper
+
+
+@dataclass(frozen=True)
+class ArgumentStep:
+    """Resolves one decorated handler parameter from the kwargs FastAPI passes.
+
+    ``pipes`` hold bound pipe callables and ``coerce`` a prebuilt validator, so
+    no pipe instance or pydantic schema is created while serving a request.
+    """
+
+    target: str
+    extract: Callable[[dict], Any]
+    pipes: Tuple[Callable[[Any], Any], ...] = ()
+    coerce: Optional[Callable[[Any], Any]] = None
+    is_async: bool = False
+
+
+@dataclass(frozen=True)
+class ArgumentPlan:
+    """Registration-time plan for the decorated parameters of one route handler.
+
+    ``signature`` is the signature FastAPI binds against and ``steps`` produce
+    the handler arguments. The source fields and synthetic request/response
+    parameters in ``synthetic_names`` only feed the steps and are not passed
+    to the handler. ``request_name`` is the keyword the request arrives under,
+    or ``None`` when the plan does not need it.
+    """
+
+    signature: inspect.Signature
+    steps: Tuple[ArgumentStep, ...]
+    synthetic_names: FrozenSet[str]
+    request_name: Optional[str] = None
+
+
+_REQUEST_ARG = "pynest_request"
+_RESPONSE_ARG = "pynest_response"
+
+
+def compile_argument_plan(
+    endpoint: Callable, require_request: bool = False
+) -> ArgumentPlan:
     signature = inspect.signature(endpoint)
-    wrapped_parameters = []
+    request_name = _find_special_parameter(signature, Request)
+    response_name = _find_special_parameter(signature, Response)
+    # Decorated names are taken too: a source field must never share its name
+    # with a handler parameter, or one would shadow the other.
+    taken = set(signature.parameters)
+    request_arg = _claim_name(_REQUEST_ARG, taken)
+    response_arg = _claim_name(_RESPONSE_ARG, taken)
+
+    parameters = []
+    source_parameters = []
+    context_parameters = []
+    steps = []
+    pipe_instances: dict = {}
+    needs_request = require_request
+    needs_response = False
 
     for parameter in signature.parameters.values():
-        if isinstance(parameter.default, ParamMetadata):
-            dependency = _build_dependency(parameter)
-            wrapped_parameters.append(
-                parameter.replace(
-                    annotation=inspect.Parameter.empty,
-                    default=Depends(dependency),
-                )
+        metadata = parameter.default
+        if not isinstance(metadata, ParamMetadata):
+            parameters.append(parameter)
+            continue
+
+        if _reads_source_value(metadata):
+            source_name = _claim_name(
+                _source_parameter_name(metadata.name or parameter.name), taken
+            )
+            source_parameters.append(
+                _source_parameter(source_name, parameter, metadata)
             )
+            extract = _kwarg_extractor(source_name)
         else:
-            wrapped_parameters.append(parameter)
+            needs_request = needs_request or metadata.source != "response"
+            needs_response = needs_response or metadata.source in {"response", "custom"}
+            extract = _build_extractor(
+                metadata,
+                request_name or request_arg,
+                response_name or response_arg,
+            )
 
-    wrapper_signature = signature.replace(parameters=wrapped_parameters)
-    handler_param_names = set(signature.parameters)
+        steps.append(
+            ArgumentStep(
+                target=parameter.name,
+                extract=extract,
+                pipes=_compile_pipes(metadata.pipes, pipe_instances),
+                coerce=_compile_coercer(parameter.annotation),
+                is_async=metadata.source == "custom",
+            )
+        )
 
-    async def wrapper(*args, **kwargs):
-        call_kwargs = {k: v for k, v in kwargs.items() if k in handler_param_names}
-        result = endpoint(*args, **call_kwargs)
-        if inspect.isawaitable(result):
-            return await result
-        return result
+    if needs_request and request_name is None:
+        context_parameters.append(_special_parameter(request_arg, Request))
+    if needs_response and response_name is None:
+        context_parameters.append(_special_parameter(response_arg, Response))
 
-    wrapper.__name__ = getattr(endpoint, "__name__", "param_decorator_wrapper")
-    wrapper.__signature__ = wrapper_signature
-    return wrapper
+    return ArgumentPlan(
+        signature=signature.replace(
+            parameters=_merge_parameters(
+                parameters, source_parameters + context_parameters
+            )
+        ),
+        steps=tuple(steps),
+        synthetic_names=frozenset(
+            p.name for p in source_parameters + context_parameters
+        ),
+        request_name=request_name or (request_arg if needs_request else None),
+    )
 
 
-def _build_dependency(parameter: inspect.Parameter) -> Callable:
-    metadata = parameter.default
-    annotation = parameter.annotation
-
-    async def dependency(**kwargs):
-        value = await _resolve_value(metadata, kwargs)
-        value = await _apply_pipes(value, metadata.pipes)
-        return _coerce_value(value, annotation)
-
-    dependency.__name__ = f"resolve_{parameter.name}_{metadata.source}"
-    dependency.__signature__ = _dependency_signature(parameter, metadata)
-    return dependency
-
-
-async def _resolve_value(metadata: ParamMetadata, kwargs: dict) -> Any:
-    request = kwargs.get("request")
-    response = kwargs.get("response")
-
-    if metadata.source == "request":
-        return request
-    if metadata.source == "response":
-        return response
-    if metadata.source == "param" and metadata.name is None:
-        return dict(request.path_params)
-    if metadata.source == "query" and metadata.name is None:
-        return dict(request.query_params)
-    if metadata.source == "headers" and metadata.name is None:
-        return dict(request.headers)
-    if metadata.source == "ip":
-        return request.client.host if request.client else None
-    if metadata.source == "host":
-        if metadata.name:
-            return request.path_params.get(metadata.name)
-        return request.url.hostname
-    if metadata.source == "custom":
-        context = ExecutionContext(request, response)
-        result = metadata.factory(metadata.data, context)
-        if inspect.isawaitable(result):
-            return await result
-        return result
+def _reads_source_value(metadata: ParamMetadata) -> bool:
+    if metadata.source == "body":
+        return True
+    return metadata.source in {"param", "query", "headers"} and metadata.name is not None
 
-    return _first_source_value(kwargs)
 
+def _kwarg_extractor(name: str) -> Callable[[dict], Any]:
+    def extract(kwargs: dict) -> Any:
+        return kwargs[name]
 
-def _dependency_signature(
-    parameter: inspect.Parameter,
+    return extract
+
+
+def _build_extractor(
     metadata: ParamMetadata,
-) -> inspect.Signature:
+    request_name: str,
+    response_name: str,
+) -> Callable[[dict], Any]:
+    """Select the extractor for a request-derived source once, up front."""
     source = metadata.source
-    annotation = parameter.annotation
 
     if source == "request":
-        return inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    "request",
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=Request,
-                )
-            ]
-        )
-
+        return _kwarg_extractor(request_name)
     if source == "response":
-        return inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    "response",
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=Response,
-                )
-            ]
-        )
-
-    if source in {"param", "query", "headers"} and metadata.name is None:
-        return _request_only_signature()
+        return _kwarg_extractor(response_name)
+    if source == "param":
+        return lambda kwargs: dict(kwargs[request_name].path_params)
+    if source == "query":
+        return lambda kwargs: dict(kwargs[request_name].query_params)
+    if source == "headers":
+        return lambda kwargs: dict(kwargs[request_name].headers)
+    if source == "ip":
 
-    if source in {"ip", "host"}:
-        return _request_only_signature()
+        def extract_ip(kwargs: dict) -> Any:
+            client = kwargs[request_name].client
+            return client.host if client else None
 
+        return extract_ip
+    if source == "host":
+        if metadata.name:
+            name = metadata.name
+            return lambda kwargs: kwargs[request_name].path_params.get(name)
+        return lambda kwargs: kwargs[request_name].url.hostname
     if source == "custom":
-        return inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    "request",
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=Request,
-                ),
-                inspect.Parameter(
-                    "response",
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=Response,
-                ),
-            ]
-        )
+        factory = metadata.factory
+        data = metadata.data
+
+        def extract_custom(kwargs: dict) -> Any:
+            context = ExecutionContext(kwargs[request_name], kwargs[response_name])
+            return factory(data, context)
+
+        return extract_custom
+
+    raise ValueError(f"Unknown parameter source {source!r}")
 
-    if source == "body":
-        name = _source_parameter_name(metadata.name or parameter.name)
-        default = _default_value(metadata)
-        fastapi_default = FastAPIBody(
-            default,
-            alias=metadata.name,
+
+def _source_parameter(
+    name: str,
+    parameter: inspect.Parameter,
+    metadata: ParamMetadata,
+) -> inspect.Parameter:
+    source_name = metadata.name or parameter.name
+    if metadata.source == "body":
+        marker = FastAPIBody(
+            _default_value(metadata),
+            alias=source_name,
             embed=metadata.name is not None,
         )
-        return inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name,
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=annotation,
-                    default=fastapi_default,
-                )
-            ]
+    elif metadata.source == "param":
+        marker = FastAPIPath(..., alias=source_name)
+    elif metadata.source == "headers":
+        marker = FastAPIHeader(
+            _default_value(metadata), alias=_header_alias(source_name)
         )
+    else:
+        marker = FastAPIQuery(_default_value(metadata), alias=source_name)
+
+    return inspect.Parameter(
+        name,
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=parameter.annotation,
+        default=marker,
+    )
 
-    if source == "param":
-        name = _source_parameter_name(metadata.name or parameter.name)
-        alias = None if name == (metadata.name or parameter.name) else metadata.name
-        fastapi_default = FastAPIPath(..., alias=alias)
-        return inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name,
-                    inspect.Parameter.KEYWORD_ONLY,
-                    annotation=annotation,
-                    default=fastapi_default,
-                )
-            ]
-        )
 
-    if source == "query":
-        return _simple_source_signature(
-            parameter,
-            metadata,
-            lambda default, alias: FastAPIQuery(default, alias=alias),
-        )
+def _special_parameter(name: str, annotation: type) -> inspect.Parameter:
+    return inspect.Parameter(
+        name,
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=annotation,
+    )
 
-    if source == "headers":
-        return _simple_source_signature(
-            parameter,
-            metadata,
-            lambda default, alias: FastAPIHeader(default, alias=alias),
-        )
 
-    return inspect.Signature()
+def _find_special_parameter(
+    signature: inspect.Signature, annotation: type
+) -> Optional[str]:
+    """Return the name of an undecorated handler parameter typed as ``annotation``.
 
+    FastAPI only injects one Request/Response parameter per endpoint, so the
+    plan reuses the handler's own parameter when it already declares one.
+    """
+    for parameter in signature.parameters.values():
+        if isinstance(parameter.default, ParamMetadata):
+            continue
+        if inspect.isclass(parameter.annotation) and issubclass(
+            parameter.annotation, annotation
+        ):
+            return parameter.name
+    return None
 
-def _simple_source_signature(parameter, metadata, marker_factory) -> inspect.Signature:
-    source_name = metadata.name or parameter.name
-    name = _source_parameter_name(source_name)
-    alias = source_name if name != source_name or metadata.name else None
-    fastapi_default = marker_factory(_default_value(metadata), alias)
-
-    return inspect.Signature(
-        parameters=[
-            inspect.Parameter(
-                name,
-                inspect.Parameter.KEYWORD_ONLY,
-                annotation=parameter.annotation,
-                default=fastapi_default,
-            )
-        ]
-    )
 
+def _claim_name(name: str, taken: set) -> str:
+    candidate = name
+    suffix = 1
+    while candidate in taken:
+        candidate = f"{name}_{suffix}"
+        suffix += 1
+    taken.add(candidate)
+    return candidate
+
+
+def _merge_parameters(parameters, source_parameters):
+    # Keyword-only parameters must stay ahead of a trailing **kwargs.
+    var_keyword = [p for p in parameters if p.kind == inspect.Parameter.VAR_KEYWORD]
+    regular = [p for p in parameters if p.kind != inspect.Parameter.VAR_KEYWORD]
+    return regular + list(source_parameters) + var_keyword
 
-def _request_only_signature() -> inspect.Signature:
-    return inspect.Signature(
-        parameters=[
-            inspect.Parameter(
-                "request",
-                inspect.Parameter.KEYWORD_ONLY,
-                annotation=Request,
-            )
-        ]
-    )
+
+def _header_alias(name: str) -> str:
+    # Mirror FastAPI's underscore conversion for names that are valid identifiers.
+    if _source_parameter_name(name) == name:
+        return name.replace("_", "-")
+    return name
 
 
 def _normalize_name_and_pipes(name: Any, pipes: Tuple[Any, ...]):
@@ -337,30 +431,61 @@ def _default_value(metadata: ParamMetadata) -> Any:
     return metadata.default
 
 
-def _first_source_value(kwargs: dict) -> Any:
-    for key, value in kwargs.items():
-        if key not in {"request", "response"}:
-            return value
-    return None
-
-
-async def _apply_pipes(value: Any, pipes: Tuple[Any, ...]) -> Any:
+def _compile_pipes(pipes: Tuple[Any, ...], instances: dict) -> Tuple[Callable, ...]:
+    compiled = []
     for pipe in pipes:
-        pipe_instance = pipe() if inspect.isclass(pipe) else pipe
+        if inspect.isclass(pipe):
+            if pipe not in instances:
+                instances[pipe] = pipe()
+            pipe_instance = instances[pipe]
+        else:
+            pipe_instance = pipe
         if hasattr(pipe_instance, "transform"):
-            value = pipe_instance.transform(value)
+            compiled.append(pipe_instance.transform)
         elif callable(pipe_instance):
-            value = pipe_instance(value)
+            compiled.append(pipe_instance)
         else:
             raise TypeError("Pipe must be callable or expose a transform method")
-        if inspect.isawaitable(value):
-            value = await value
-    return value
+    return tuple(compiled)
+
+
+def _compile_coercer(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return None
+
+    try:
+        validate = _type_adapter(annotation).validate_python
+    except Exception:
+        # Types pydantic cannot build a schema for (Request, Response, ...) are
+        # only usable when the value already matches, as before.
+        def validate(value):
+            return TypeAdapter(annotation).validate_python(value)
+
+    if inspect.isclass(annotation):
+
+        def coerce(value: Any) -> Any:
+            if value is None or isinstance(value, annotation):
+                return value
+            return validate(value)
+
+    else:
+
+        def coerce(value: Any) -> Any:
+            if value is None:
+                return value
+            return validate(value)
+
+    return coerce
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_type_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
 
 
-def _coerce_value(value: Any, annotation: Any) -> Any:
-    if value is None or annotation in {inspect.Parameter.empty, Any}:
-        return value
-    if inspect.isclass(annotation) and isinstance(value, annotation):
-        return value
-    return TypeAdapter(annotation).validate_python(value)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    try:
+        return _cached_type_adapter(annotation)
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated metadata) cannot be cached.
+        return TypeAdapter(annotation)
@@ -32,6 +32,20 @@ class ProviderNotExportedException(Exception):
         super().__init__(message)
 
 
+class ModuleTokenCollisionException(Exception):
+    """Raised when two different dynamic module configurations hash to the same token."""
+
+    def __init__(self, message: str = "Dynamic module fingerprint collision"):
+        super().__init__(message)
+
+
+class LifecycleHookTimeoutException(Exception):
+    """Raised when a startup lifecycle hook exceeds the configured hook timeout."""
+
+    def __init__(self, message: str = "Lifecycle hook timed out"):
+        super().__init__(message)
+
+
 class HttpException(Exception):
     def __init__(self, message: str = "Internal Server Error", status_code: int = 500):
         self.message = message
@@ -26,3 +26,8 @@ class OnModuleDestroy(Protocol):
 @runtime_checkable
 class OnApplicationShutdown(Protocol):
     def on_application_shutdown(self, signal: Optional[str]) -> Any: ...
+
+
+@runtime_checkable
+class OnRequestDestroy(Protocol):
+    def on_request_destroy(self) -> Any: ...
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import hashlib
-import random
-import string
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, List, Type
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
+from nest.common.exceptions import ModuleTokenCollisionException
+
+MODULE_TOKEN = "__module_token__"
+
 @dataclass
 class CompiledModule:
     """The result of compiling a @Module-decorated class. Immutable snapshot used by the container."""
@@ -17,6 +19,50 @@ class CompiledModule:
     controllers: List[Type] = field(default_factory=list)
     exports: List[Any] = field(default_factory=list)
     provider_descriptors: List[Any] = field(default_factory=list)
+    import_tokens: List[str] = field(default_factory=list)
+    is_global: bool = False
+
+
+@dataclass
+class DynamicModule:
+    """
+    A module configured at import time, NestJS ``forRoot``/``forFeature`` style.
+
+    The metadata is added to the static ``@Module`` metadata of ``module``.
+    Each distinct configuration is compiled once and registered under its own
+    token; equal configurations share a single module instance.
+
+    Usage:
+        @Module(providers=[Repository], exports=[Repository])
+        class DatabaseModule:
+            @staticmethod
+            def for_root(url: str) -> DynamicModule:
+                return DynamicModule(
+                    module=DatabaseModule,
+                    providers=[ProviderDescriptor(provide=DB_URL, use_value=url)],
+                    exports=[DB_URL],
+                )
+    """
+    module: Type
+    imports: List[Any] = field(default_factory=list)
+    controllers: List[Type] = field(default_factory=list)
+    providers: List[Any] = field(default_factory=list)
+    exports: List[Any] = field(default_factory=list)
+    is_global: bool = False
+
+    def dynamic_metadata(self) -> Optional[dict]:
+        metadata = {
+            name: value
+            for name, value in (
+                ("imports", self.imports),
+                ("controllers", self.controllers),
+                ("providers", self.providers),
+                ("exports", self.exports),
+                ("is_global", self.is_global),
+            )
+            if value
+        }
+        return metadata or None
 
 
 class ModulesContainer(dict):
@@ -132,59 +178,79 @@ class Module:
 
 
 class ModuleTokenFactory:
+    """
+    Derives module tokens from the module's qualified name, plus a SHA-256
+    fingerprint of the dynamic metadata when there is some. Tokens are stable
+    across processes, and a static token is computed once and stored on the
+    module class.
+
+    Dynamic configurations are told apart by equality of their metadata, not
+    by its ``repr``: distinct configurations that render alike (secrets, for
+    instance) get suffixed tokens, the way same-named classes do.
+    """
+
     def __init__(self):
-        self.module_token_cache = {}
-        self.module_ids_cache = {}
+        self._token_owners = {}
+        # fingerprinted token -> [(rendered metadata, metadata)] in token order
+        self._dynamic_owners: Dict[str, List[Tuple[str, Any]]] = {}
 
     def create(self, metatype, dynamic_module_metadata=None) -> str:
-        module_id = self.get_module_id(metatype)
-
+        static_token = self.get_static_module_token(metatype)
         if dynamic_module_metadata is None:
-            return self.get_static_module_token(
-                module_id, self.get_module_name(metatype)
-            )
-
-        opaque_token = {
-            "id": module_id,
-            "module": self.get_module_name(metatype),
-            "dynamic": dynamic_module_metadata,
-        }
-        opaque_token_string = self.stringify_opaque_token(opaque_token)
-
-        return self.hash_string(opaque_token_string)
-
-    def get_static_module_token(self, module_id, module_name):
-        key = f"{module_id}_{module_name}"
-        if key in self.module_token_cache:
-            return self.module_token_cache[key]
-
-        hash_value = self.hash_string(key)
-        self.module_token_cache[key] = hash_value
-        return hash_value
+            return static_token
+
+        opaque = self.stringify_opaque_token(dynamic_module_metadata)
+        fingerprint = hashlib.sha256(opaque.encode()).hexdigest()[:16]
+        token = f"{static_token}:{fingerprint}"
+        owners = self._dynamic_owners.setdefault(token, [])
+        for index, (owner_opaque, owner_metadata) in enumerate(owners):
+            if owner_opaque != opaque:
+                raise ModuleTokenCollisionException(
+                    f"Dynamic configurations of {metatype.__name__} share the "
+                    f"fingerprint {fingerprint}"
+                )
+            if _same_metadata(owner_metadata, dynamic_module_metadata):
+                return token if index == 0 else f"{token}@{index}"
+        owners.append((opaque, dynamic_module_metadata))
+        index = len(owners) - 1
+        return token if index == 0 else f"{token}@{index}"
+
+    def get_static_module_token(self, metatype) -> str:
+        token = metatype.__dict__.get(MODULE_TOKEN)
+        if token is None:
+            token = self.get_module_id(metatype)
+            setattr(metatype, MODULE_TOKEN, token)
+
+        # Two distinct classes sharing a qualified name (e.g. built by the same
+        # function) must not collapse into one module.
+        owner = self._token_owners.setdefault(token, metatype)
+        if owner is not metatype:
+            token = f"{token}@{id(metatype):x}"
+            self._token_owners.setdefault(token, metatype)
+        return token
 
     @staticmethod
     def stringify_opaque_token(opaque_token):
         return str(opaque_token)
 
-    def get_module_id(self, metatype):
-        if metatype in self.module_ids_cache:
-            return self.module_ids_cache[metatype]
-
-        module_id = self.random_string_generator()
-        self.module_ids_cache[metatype] = module_id
-        return module_id
+    @staticmethod
+    def get_module_id(metatype):
+        return f"{metatype.__module__}.{metatype.__qualname__}"
 
     @staticmethod
     def get_module_name(metatype):
         return metatype.__name__
 
-    @staticmethod
-    def random_string_generator(length=10):
-        return "".join(random.choice(string.ascii_letters) for _ in range(length))
 
-    @staticmethod
-    def hash_string(value):
-        return hashlib.sha256(value.encode()).hexdigest()
+def _same_metadata(left: Any, right: Any) -> bool:
+    if left is right:
+        return True
+    try:
+        return bool(left == right)
+    except Exception:
+        # Values that cannot be compared are only the same configuration
+        # when they are the same objects.
+        return False
 
 
 class ModuleFactory:
@@ -195,31 +261,61 @@ class ModuleFactory:
 
 
 class ModuleCompiler:
-    def __init__(self, module_token_factory: ModuleTokenFactory = ModuleTokenFactory()):
-        self.module_token_factory = module_token_factory
+    def __init__(self, module_token_factory: Optional[ModuleTokenFactory] = None):
+        self.module_token_factory = module_token_factory or ModuleTokenFactory()
+        self._compiled: Dict[str, CompiledModule] = {}
 
-    def compile(self, metatype: Type[Any]) -> CompiledModule:
+    def compile(self, module: Union[Type[Any], DynamicModule]) -> CompiledModule:
+        """Compile a module class or DynamicModule; each token is compiled only once."""
         from nest.common.provider import normalize_provider  # local import avoids circular
 
+        metatype, dynamic = self.split_dynamic(module)
         if not self.has_module_metadata(metatype):
             raise Exception(f"{metatype.__name__} has no metadata found")
 
-        raw_providers = getattr(metatype, "providers", []) or []
-        controllers = getattr(metatype, "controllers", []) or []
-        imports = getattr(metatype, "imports", []) or []
-        exports = getattr(metatype, "exports", []) or []
-
-        provider_descriptors = [normalize_provider(p) for p in raw_providers]
-        token = self.module_token_factory.create(metatype)
-
-        return CompiledModule(
+        token = self.get_token(module)
+        compiled = self._compiled.get(token)
+        if compiled is not None:
+            return compiled
+
+        raw_providers = list(getattr(metatype, "providers", []) or [])
+        controllers = list(getattr(metatype, "controllers", []) or [])
+        imports = list(getattr(metatype, "imports", []) or [])
+        exports = list(getattr(metatype, "exports", []) or [])
+        is_global = getattr(metatype, "__is_global__", False)
+        if dynamic is not None:
+            raw_providers += dynamic.providers
+            controllers += dynamic.controllers
+            imports += dynamic.imports
+            exports += dynamic.exports
+            is_global = is_global or dynamic.is_global
+
+        compiled = CompiledModule(
             token=token,
             metatype=metatype,
-            imports=list(imports),
-            controllers=list(controllers),
-            exports=list(exports),
-            provider_descriptors=provider_descriptors,
+            imports=imports,
+            controllers=controllers,
+            exports=exports,
+            provider_descriptors=[normalize_provider(p) for p in raw_providers],
+            import_tokens=[self.get_token(imported) for imported in imports],
+            is_global=is_global,
         )
+        self._compiled[token] = compiled
+        return compiled
+
+    def get_token(self, module: Union[Type[Any], DynamicModule]) -> str:
+        metatype, dynamic = self.split_dynamic(module)
+        if dynamic is None:
+            return self.module_token_factory.create(metatype)
+        return self.module_token_factory.create(metatype, dynamic.dynamic_metadata())
+
+    @staticmethod
+    def split_dynamic(
+        module: Union[Type[Any], DynamicModule]
+    ) -> Tuple[Type[Any], Optional[DynamicModule]]:
+        if isinstance(module, DynamicModule):
+            return module.module, module
+        return module, None
 
     def extract_metadata(self, metatype) -> dict:
         # Kept for backward compat with PyNestApplicationContext.select()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 
 class Scope(str, Enum):
@@ -39,6 +39,9 @@ class ProviderDescriptor:
     use_existing: Optional[Union[Type, InjectionToken]] = None
     scope: Scope = Scope.SINGLETON
     inject: List[Any] = field(default_factory=list)
+    # Constructor keys of ``use_class`` by parameter name, when they differ
+    # from its annotations (set by the container for module-scoped bindings).
+    dependencies: Optional[Dict[str, Any]] = None
 
 
 def normalize_provider(
@@ -79,4 +82,8 @@ def normalize_provider(
         raise ValueError(
             f"Provider must be a class, dict, or ProviderDescriptor, got {provider!r}"
         )
-    return ProviderDescriptor(provide=provider, use_class=provider, scope=Scope.SINGLETON)
+    return ProviderDescriptor(
+        provide=provider,
+        use_class=provider,
+        scope=getattr(provider, "__injectable_scope__", Scope.SINGLETON),
+    )
@@ -1,30 +1,62 @@
 from __future__ import annotations
 
 import inspect
-from typing import TYPE_CHECKING, Any
-
-from fastapi import APIRouter, FastAPI, Request
+import typing
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI, Request, Response, WebSocket
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.utils import is_body_allowed_for_status_code
 from nest.common.decorators import has_param_decorators, wrap_param_decorators
+from nest.common.exceptions import ArgumentsHost
+from nest.common.tracing import PhaseTracer, TracedAPIRoute, phase
 
 if TYPE_CHECKING:
+    from nest.core.metrics import RouteMetrics
     from nest.core.pynest_container import PyNestContainer
 
 
+class ExceptionFilterMode(str, Enum):
+    """Where route-scoped exception filters are applied.
+
+    ``ENDPOINT`` catches exceptions raised by parameter pipes and the handler
+    itself, inside the endpoint FastAPI calls. ``ROUTER`` leaves the endpoint
+    untouched and catches in the route's request handler instead, so request
+    validation and guard errors reach the filters as well.
+    """
+
+    ENDPOINT = "endpoint"
+    ROUTER = "router"
+
+
 class RoutesResolver:
     """
     Walks the module graph, resolves controller and gateway instances from the
     container, and registers their bound methods on the FastAPI app.
     """
 
-    def __init__(self, container: "PyNestContainer", app_ref: FastAPI) -> None:
+    def __init__(
+        self,
+        container: "PyNestContainer",
+        app_ref: FastAPI,
+        exception_filter_mode: ExceptionFilterMode = ExceptionFilterMode.ENDPOINT,
+        metrics: Optional["RouteMetrics"] = None,
+        tracer: Optional[PhaseTracer] = None,
+    ) -> None:
         self.container = container
         self.app_ref = app_ref
+        self.exception_filter_mode = ExceptionFilterMode(exception_filter_mode)
+        self.metrics = metrics
+        self.tracer = tracer
 
     def register_routes(self) -> None:
         seen_controllers: set = set()
         seen_gateways: set = set()
 
-        for module_ref in self.container.modules.values():
+        # Resolving a controller can load a lazy module and add to the modules.
+        for module_ref in list(self.container.modules.values()):
             for controller_class in module_ref.compiled.controllers:
                 if controller_class in seen_controllers:
                     continue
@@ -40,11 +72,24 @@ class RoutesResolver:
                 if gateway_class in seen_gateways:
                     continue
                 seen_gateways.add(gateway_class)
-                gateway_instance = self.container.get(provider.provide)
-                self._register_gateway(gateway_class, gateway_instance)
+                if self.container.lifecycle_initialized:
+                    gateway_instance = self.container.get(provider.provide)
+                    self._register_gateway(gateway_class, gateway_instance)
+                else:
+                    # Like controllers, resolved on first use once bootstrapped.
+                    self._register_deferred_gateway(
+                        gateway_class, self.container.get_resolver(provider.provide)
+                    )
 
     def _register_controller(self, controller_class: type) -> None:
-        instance = self.container.get_controller_instance(controller_class)
+        if self.container.is_request_scoped(controller_class) or (
+            not self.container.lifecycle_initialized
+        ):
+            # Resolved per call (request scope) or on first use, once the
+            # container has bootstrapped.
+            instance = None
+        else:
+            instance = self.container.get_controller_instance(controller_class)
         tag = getattr(controller_class, "__controller_tag__", None)
         prefix = getattr(controller_class, "__route_prefix__", None) or ""
 
@@ -55,7 +100,12 @@ class RoutesResolver:
         ):
             if not hasattr(unbound, "__http_method__"):
                 continue
-            bound = getattr(instance, method_name)
+            if instance is None:
+                bound = _deferred_endpoint(
+                    self.container.get_resolver(controller_class), unbound
+                )
+            else:
+                bound = getattr(instance, method_name)
             self._add_route(router, bound, unbound, controller_class, prefix)
 
         self.app_ref.include_router(router)
@@ -68,6 +118,23 @@ class RoutesResolver:
             metadata=getattr(gateway_class, "__websocket_gateway__"),
         ).register(self.app_ref)
 
+    def _register_deferred_gateway(
+        self, gateway_class: type, resolve_instance: Callable[[], Any]
+    ) -> None:
+        from nest.websockets.gateway import NativeWebSocketGateway
+
+        metadata = getattr(gateway_class, "__websocket_gateway__")
+        gateways: List[NativeWebSocketGateway] = []
+
+        async def endpoint(websocket: WebSocket):
+            if not gateways:
+                gateways.append(
+                    NativeWebSocketGateway(gateway=resolve_instance(), metadata=metadata)
+                )
+            await gateways[0].handle_connection(websocket)
+
+        self.app_ref.add_api_websocket_route(metadata["namespace"], endpoint)
+
     def _add_route(
         self,
         router: APIRouter,
@@ -76,7 +143,8 @@ class RoutesResolver:
         cls: type,
         prefix: str,
     ) -> None:
-        from nest.core.decorators.controller import _collect_guards
+        from nest.core.decorators.controller import _collect_guard_groups
+        from nest.core.decorators.guards import GuardPolicy, guard_group_dependency
         from nest.core.decorators.http_method import HTTPMethod
 
         path = getattr(original_method, "__route_path__", "/")
@@ -95,69 +163,232 @@ class RoutesResolver:
             **extra_kwargs,
         }
 
-        if has_param_decorators(bound_method):
-            route_kwargs["endpoint"] = wrap_param_decorators(bound_method)
-
         if hasattr(original_method, "status_code"):
             route_kwargs["status_code"] = original_method.status_code
 
-        guards = _collect_guards(cls, original_method)
-        if guards:
-            route_kwargs["dependencies"] = [g.as_dependency() for g in guards]
-
+        if self.tracer is not None:
+            span_attributes = {
+                "http.method": http_method.value,
+                "http.route": full_path,
+                "pynest.controller": cls.__name__,
+            }
+            bound_method = _traced_endpoint(bound_method, span_attributes)
+            route_kwargs["endpoint"] = bound_method
+
+        dependencies = []
+        for policy, guards in _collect_guard_groups(cls, original_method):
+            resolved = [(g, self.container.get_enhancer_factory(g)) for g in guards]
+            if policy == GuardPolicy.SEQUENTIAL or len(resolved) == 1:
+                dependencies.extend(g.as_dependency(f) for g, f in resolved)
+            else:
+                dependencies.append(guard_group_dependency(resolved, policy))
+        if dependencies:
+            route_kwargs["dependencies"] = dependencies
+
+        dispatcher = None
         route_filters = list(getattr(original_method, "__filters__", []))
         controller_filters = list(getattr(cls, "__filters__", []))
         if route_filters or controller_filters:
-            route_kwargs["endpoint"] = _wrap_with_filters(
-                route_kwargs["endpoint"], route_filters + controller_filters
+            dispatcher = ExceptionFilterDispatcher(
+                (f, self.container.get_enhancer_factory(f))
+                for f in route_filters + controller_filters
             )
 
-        router.add_api_route(**route_kwargs)
+        if dispatcher is not None and (
+            self.exception_filter_mode == ExceptionFilterMode.ROUTER
+        ):
+            route_kwargs["route_class_override"] = FilteredAPIRoute.bind(dispatcher)
+            dispatcher = None
 
+        if dispatcher is not None:
+            route_kwargs["endpoint"] = wrap_param_decorators(
+                bound_method, exception_handler=dispatcher.dispatch
+            )
+        elif has_param_decorators(bound_method):
+            route_kwargs["endpoint"] = wrap_param_decorators(bound_method)
 
-def _wrap_with_filters(endpoint, filters) -> callable:
-    """Wrap a bound-method endpoint with exception filter logic."""
-    from nest.common.exceptions import ArgumentsHost
+        if self.tracer is not None:
+            route_kwargs["route_class_override"] = TracedAPIRoute.bind(
+                self.tracer,
+                span_attributes,
+                route_kwargs.get("route_class_override", APIRoute),
+            )
 
-    original_sig = inspect.signature(endpoint)
-    existing_params = list(original_sig.parameters.values())
-    has_request = any(p.name == "request" for p in existing_params)
+        if self.metrics is not None:
+            from nest.core.metrics import MeteredAPIRoute
+
+            stats = self.metrics.route(cls.__name__, http_method.value, full_path)
+            route_kwargs["route_class_override"] = MeteredAPIRoute.bind(
+                stats, route_kwargs.get("route_class_override", APIRoute)
+            )
+
+        router.add_api_route(**route_kwargs)
 
-    if not has_request:
-        request_param = inspect.Parameter(
-            "request",
-            inspect.Parameter.KEYWORD_ONLY,
-            annotation=Request,
-        )
-        wrapper_sig = original_sig.replace(parameters=existing_params + [request_param])
-    else:
-        wrapper_sig = original_sig
 
-    orig_param_names = {p.name for p in existing_params}
+class ExceptionFilterDispatcher:
+    """
+    Maps an exception type to the first filter, in declaration order, that
+    catches it. Filter instances are resolved once at route registration and
+    the lookup for each exception type is computed once and then cached, so
+    the error path does no filter instantiation or linear isinstance scan.
+    """
+
+    def __init__(self, filters: Iterable[Tuple[Any, Callable[[], Any]]]) -> None:
+        self._filters = tuple(
+            (tuple(getattr(raw_filter, "__caught_exceptions__", ())), factory)
+            for raw_filter, factory in filters
+        )
+        self._dispatch: Dict[type, Optional[Callable[[], Any]]] = {}
+        for caught, _ in self._filters:
+            for exc_type in caught:
+                self.resolve(exc_type)
 
-    async def filter_wrapper(*args, **kwargs):
-        request = kwargs.get("request")
-        call_kwargs = {k: v for k, v in kwargs.items() if k in orig_param_names}
+    def resolve(self, exc_type: type) -> Optional[Callable[[], Any]]:
+        """Return the factory of the filter handling ``exc_type``, if any."""
         try:
-            result = endpoint(*args, **call_kwargs)
+            return self._dispatch[exc_type]
+        except KeyError:
+            pass
+        match = None
+        for caught, factory in self._filters:
+            if not caught or issubclass(exc_type, caught):
+                match = factory
+                break
+        self._dispatch[exc_type] = match
+        return match
+
+    async def dispatch(self, exc: Exception, request: Optional[Request]) -> Any:
+        """Run the filter that handles ``exc``; re-raise it when none does."""
+        factory = self.resolve(type(exc))
+        if factory is None:
+            raise exc
+        with phase("filter", {"pynest.exception": type(exc).__name__}):
+            result = factory().catch(exc, ArgumentsHost(request=request))
             if inspect.isawaitable(result):
-                result = await result
+                return await result
             return result
-        except Exception as exc:
-            host = ArgumentsHost(request=request)
-            for raw_filter in filters:
-                f = raw_filter() if isinstance(raw_filter, type) else raw_filter
-                caught = getattr(f, "__caught_exceptions__", ())
-                if not caught or isinstance(exc, caught):
-                    result = f.catch(exc, host)
-                    if inspect.isawaitable(result):
-                        return await result
+
+
+class FilteredAPIRoute(APIRoute):
+    """
+    Route whose request handler applies exception filters directly, so the
+    endpoint keeps its own signature and no per-call wrapper is generated.
+
+    The dispatcher is a class attribute because ``include_router`` rebuilds
+    each route from ``type(route)``; ``bind`` derives one subclass per route.
+    """
+
+    exception_dispatcher: ExceptionFilterDispatcher
+
+    @classmethod
+    def bind(cls, dispatcher: ExceptionFilterDispatcher) -> type:
+        return type(cls.__name__, (cls,), {"exception_dispatcher": dispatcher})
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        dispatch = self.exception_dispatcher.dispatch
+
+        async def filtered_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except Exception as exc:
+                result = await dispatch(exc, request)
+                if isinstance(result, Response):
                     return result
-            raise
+                return await self._serialize_filter_result(result)
+
+        return filtered_handler
+
+    async def _serialize_filter_result(self, result: Any) -> Response:
+        """
+        Render a filter's return value the way FastAPI renders the endpoint's,
+        with the route's response model, response class and status code.
+        """
+        content = await serialize_response(
+            field=self.response_field,
+            response_content=result,
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        response_args = {} if self.status_code is None else {"status_code": self.status_code}
+        response = response_class(content, **response_args)
+        if not is_body_allowed_for_status_code(response.status_code):
+            response.body = b""
+        return response
+
+
+def _deferred_endpoint(resolve_instance: Callable[[], Any], method: Callable) -> Callable:
+    """
+    Endpoint that looks up its controller instance on every call instead of
+    binding one at registration, e.g. for request-scoped controllers.
+    """
+    name = method.__name__
+
+    if inspect.iscoroutinefunction(method):
+
+        async def endpoint(*args, **kwargs):
+            return await getattr(resolve_instance(), name)(*args, **kwargs)
 
-    filter_wrapper.__name__ = getattr(endpoint, "__name__", "filter_wrapper")
-    filter_wrapper.__signature__ = wrapper_sig
-    return filter_wrapper
+    else:
+
+        def endpoint(*args, **kwargs):
+            return getattr(resolve_instance(), name)(*args, **kwargs)
+
+    return _copy_signature(method, endpoint, skip_self=True)
+
+
+def _traced_endpoint(method: Callable, attributes: Dict[str, Any]) -> Callable:
+    """
+    Endpoint recording a ``handler`` span around ``method``. A sync method
+    stays sync, so FastAPI still runs it in the threadpool.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        async def endpoint(*args, **kwargs):
+            with phase("handler", attributes):
+                return await method(*args, **kwargs)
+
+    else:
+
+        def endpoint(*args, **kwargs):
+            with phase("handler", attributes):
+                return method(*args, **kwargs)
+
+    return _copy_signature(method, endpoint)
+
+
+def _copy_signature(method: Callable, endpoint: Callable, skip_self: bool = False) -> Callable:
+    """
+    Give ``endpoint`` the name and signature of ``method``, with annotations
+    resolved against ``method``'s module so FastAPI reads the right types.
+    """
+    signature = inspect.signature(method)
+    try:
+        hints = typing.get_type_hints(method, include_extras=True)
+    except Exception:
+        hints = {}
+    parameters = list(signature.parameters.values())
+    if skip_self:
+        parameters = parameters[1:]
+    parameters = [
+        parameter.replace(annotation=hints.get(parameter.name, parameter.annotation))
+        for parameter in parameters
+    ]
+    endpoint.__name__ = method.__name__
+    endpoint.__qualname__ = method.__qualname__
+    endpoint.__doc__ = method.__doc__
+    endpoint.__signature__ = signature.replace(
+        parameters=parameters,
+        return_annotation=hints.get("return", signature.return_annotation),
+    )
+    return endpoint
 
 
 def _join_paths(prefix: str, path: str) -> str:
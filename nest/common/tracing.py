@@ -0,0 +1,367 @@
+"""Per-request spans for the phases PyNest runs around a route handler.
+
+A ``PhaseTracer`` passed to ``PyNestFactory.create`` samples requests. For a
+sampled request, the route opens a root ``request`` span and the guard,
+parameter resolution, handler and exception filter phases each record a
+child span. The active trace lives in a context variable, so the phases need
+no extra arguments, and unsampled requests cost a single lookup per phase.
+Durations are measured with ``time.monotonic_ns``.
+
+Finished traces are handed to an exporter. Exporters follow the shape of
+OpenTelemetry's ``SpanExporter`` (``export``, ``force_flush``, ``shutdown``)
+and spans carry OpenTelemetry's field names, so forwarding them to an
+OpenTelemetry pipeline only takes a small adapter.
+"""
+from __future__ import annotations
+
+import collections
+import contextvars
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+
+_logger = logging.getLogger("pynest.tracing")
+
+_active_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar(
+    "pynest_active_trace", default=None
+)
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+@dataclass
+class Span:
+    """One finished phase of a request; times are Unix epoch nanoseconds."""
+
+    name: str
+    trace_id: int
+    span_id: int
+    parent_span_id: Optional[int]
+    start_time_unix_nano: int
+    end_time_unix_nano: int
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_time_unix_nano - self.start_time_unix_nano
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_span_id": (
+                None if self.parent_span_id is None else f"{self.parent_span_id:016x}"
+            ),
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": self.end_time_unix_nano,
+            "attributes": self.attributes,
+            "status": {"code": "ERROR", "message": self.error}
+            if self.error
+            else {"code": "OK"},
+        }
+
+
+class SpanExporter:
+    """Receives the spans of every sampled request once it finishes."""
+
+    def export(self, spans: Sequence[Span]) -> None:
+        raise NotImplementedError
+
+    def force_flush(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the most recent ``max_spans`` spans in process."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self._spans: Deque[Span] = collections.deque(maxlen=max_spans)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        return list(self._spans)
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """
+    Appends one JSON object per span to the file at ``path``.
+
+    ``export`` only queues the spans: a background thread serializes and
+    writes them in batches, so requests never wait on the disk. At most
+    ``max_queue_size`` spans wait to be written; newer spans are dropped
+    beyond that. ``force_flush`` returns once the queue is written, and
+    ``shutdown`` writes what is left and closes the file.
+    """
+
+    def __init__(self, path: str, max_queue_size: int = 10_000) -> None:
+        self.path = path
+        self.max_queue_size = max_queue_size
+        self._queue: Deque[Span] = collections.deque()
+        self._condition = threading.Condition()
+        self._writing = False
+        self._closed = False
+        self._dropped = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            room = max(self.max_queue_size - len(self._queue), 0)
+            if len(spans) > room:
+                self._dropped += len(spans) - room
+                spans = spans[:room]
+            self._queue.extend(spans)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._write_batches, name="pynest-span-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def force_flush(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: not self._queue and not self._writing)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _write_batches(self) -> None:
+        try:
+            span_file = open(self.path, "a", encoding="utf-8")
+        except OSError:
+            _logger.exception(f"Cannot open {self.path}; spans will not be exported")
+            with self._condition:
+                self._closed = True
+                self._queue.clear()
+                self._condition.notify_all()
+            return
+        with span_file:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._queue or self._closed)
+                    if not self._queue:
+                        return
+                    batch = list(self._queue)
+                    self._queue.clear()
+                    dropped, self._dropped = self._dropped, 0
+                    self._writing = True
+                try:
+                    if dropped:
+                        _logger.warning(f"Span queue full; dropped {dropped} spans")
+                    span_file.write(
+                        "".join(json.dumps(span.to_dict()) + "\n" for span in batch)
+                    )
+                    span_file.flush()
+                except Exception:
+                    _logger.exception(f"Failed to write {len(batch)} spans; dropping them")
+                finally:
+                    with self._condition:
+                        self._writing = False
+                        self._condition.notify_all()
+
+
+class PhaseTracer:
+    """
+    Samples requests and exports the spans of their PyNest phases.
+
+    ``sample_rate`` is the fraction of requests traced. A request carrying a
+    W3C ``traceparent`` header keeps its trace id and parent span id.
+    """
+
+    def __init__(self, exporter: SpanExporter, sample_rate: float = 1.0) -> None:
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        # Spans are timed with the monotonic clock and reported in wall time
+        # relative to this pair of readings.
+        self._epoch_offset_ns = time.time_ns() - time.monotonic_ns()
+
+    def sample(self) -> bool:
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def start_trace(self, traceparent: Optional[str] = None) -> "Trace":
+        trace_id, parent_id = None, None
+        if traceparent:
+            match = _TRACEPARENT.match(traceparent.strip().lower())
+            if match:
+                trace_id, parent_id = int(match.group(1), 16), int(match.group(2), 16)
+        return Trace(self, trace_id or random.getrandbits(128), parent_id)
+
+    def finish(self, trace: "Trace") -> None:
+        try:
+            self.exporter.export(trace.spans)
+        except Exception:
+            _logger.exception("Span exporter failed; dropping the trace")
+
+    def shutdown(self) -> None:
+        self.exporter.force_flush()
+        self.exporter.shutdown()
+
+
+class Trace:
+    """Spans of one sampled request; the root ``request`` span comes last."""
+
+    __slots__ = ("tracer", "trace_id", "parent_id", "root_id", "spans")
+
+    def __init__(self, tracer: PhaseTracer, trace_id: int, parent_id: Optional[int]) -> None:
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+        self.root_id = random.getrandbits(64)
+        self.spans: List[Span] = []
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        end_ns: int,
+        attributes: Dict[str, Any],
+        error: Optional[str] = None,
+        root: bool = False,
+    ) -> None:
+        offset = self.tracer._epoch_offset_ns
+        self.spans.append(
+            Span(
+                name=name,
+                trace_id=self.trace_id,
+                span_id=self.root_id if root else random.getrandbits(64),
+                parent_span_id=self.parent_id if root else self.root_id,
+                start_time_unix_nano=start_ns + offset,
+                end_time_unix_nano=end_ns + offset,
+                attributes=attributes,
+                error=error,
+            )
+        )
+
+
+class _PhaseSpan:
+    __slots__ = ("trace", "name", "attributes", "start")
+
+    def __init__(self, trace: Trace, name: str, attributes: Dict[str, Any]) -> None:
+        self.trace = trace
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> "_PhaseSpan":
+        self.start = time.monotonic_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.trace.record(
+            self.name,
+            self.start,
+            time.monotonic_ns(),
+            self.attributes,
+            None if exc_type is None else exc_type.__name__,
+        )
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def phase(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """
+    Context manager timing one phase of the current request; a no-op when
+    the request is not sampled. ``attributes`` may be shared between calls
+    and must not be mutated afterwards.
+    """
+    trace = _active_trace.get()
+    if trace is None:
+        return _NO_SPAN
+    return _PhaseSpan(trace, name, attributes or {})
+
+
+class TracedAPIRoute(APIRoute):
+    """
+    Route whose request handler opens the root span of sampled requests.
+
+    Like ``FilteredAPIRoute``, the tracer is a class attribute so that it
+    survives ``include_router``; ``bind`` derives one subclass per route and
+    can stack on another route class.
+    """
+
+    phase_tracer: PhaseTracer
+    span_attributes: Dict[str, Any]
+
+    @classmethod
+    def bind(
+        cls, tracer: PhaseTracer, attributes: Dict[str, Any], base: type = APIRoute
+    ) -> type:
+        bases = (cls,) if base is APIRoute else (cls, base)
+        return type(
+            cls.__name__,
+            bases,
+            {"phase_tracer": tracer, "span_attributes": attributes},
+        )
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        tracer = self.phase_tracer
+        attributes = self.span_attributes
+        clock = time.monotonic_ns
+
+        async def traced_handler(request: Request) -> Response:
+            if not tracer.sample():
+                return await handler(request)
+            trace = tracer.start_trace(request.headers.get("traceparent"))
+            token = _active_trace.set(trace)
+            start = clock()
+            status, error = 500, None
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            except HTTPException as exc:
+                status = exc.status_code
+                raise
+            except Exception as exc:
+                error = type(exc).__name__
+                raise
+            finally:
+                _active_trace.reset(token)
+                trace.record(
+                    "request",
+                    start,
+                    clock(),
+                    {**attributes, "http.status_code": status},
+                    error,
+                    root=True,
+                )
+                tracer.finish(trace)
+
+        return traced_handler
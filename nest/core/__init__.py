@@ -12,7 +12,15 @@ from nest.common.decorators import (
     Res,
     createParamDecorator,
 )
+from nest.common.module import DynamicModule
 from nest.common.provider import InjectionToken, Scope
+from nest.common.route_resolver import ExceptionFilterMode
+from nest.common.tracing import (
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    PhaseTracer,
+    SpanExporter,
+)
 from nest.core.decorators import (
     Catch,
     Controller,
@@ -26,7 +34,8 @@ from nest.core.decorators import (
     Put,
     UseFilters,
 )
-from nest.core.decorators.guards import BaseGuard, UseGuards
-from nest.core.pynest_application import PyNestApp
+from nest.core.decorators.guards import BaseGuard, GuardPolicy, UseGuards
+from nest.core.metrics import RouteMetrics
+from nest.core.pynest_application import BootstrapMode, PyNestApp
 from nest.core.pynest_container import PyNestContainer
 from nest.core.pynest_factory import PyNestFactory
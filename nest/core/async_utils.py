@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    Run ``coro`` to completion from synchronous code.
+
+    Only valid when no event loop is running in this thread: work started
+    from inside a loop must be awaited on that loop, so that the resources it
+    creates stay bound to it.
+    """
+    if event_loop_running():
+        raise RuntimeError(
+            "run_sync cannot be used while an event loop is running; await the "
+            "coroutine instead"
+        )
+    return asyncio.run(coro)
+
+
+def event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -4,8 +4,15 @@ from typing import List, Optional, Type
 
 from injector import inject as injector_inject
 
+from nest.common.provider import Scope
 
-def Controller(prefix: Optional[str] = None, tag: Optional[str] = None):
+
+def Controller(
+    prefix: Optional[str] = None,
+    tag: Optional[str] = None,
+    *,
+    scope: Scope = Scope.SINGLETON,
+):
     """
     Marks a class as a PyNest controller.
 
@@ -16,6 +23,7 @@ def Controller(prefix: Optional[str] = None, tag: Optional[str] = None):
     Args:
         prefix: URL prefix for all routes in this controller (e.g. "/users")
         tag:    OpenAPI tag for Swagger docs
+        scope:  Scope.REQUEST resolves a controller instance per request
     """
 
     def wrapper(cls: Type) -> Type:
@@ -24,6 +32,7 @@ def Controller(prefix: Optional[str] = None, tag: Optional[str] = None):
         cls.__is_controller__ = True
         cls.__route_prefix__ = route_prefix
         cls.__controller_tag__ = tag
+        cls.__injectable_scope__ = scope
 
         # Mark constructor for injector auto-wiring (same guard as @Injectable)
         own_init = cls.__dict__.get("__init__")
@@ -47,7 +56,16 @@ def _process_prefix(route_prefix: Optional[str], tag_name: Optional[str]) -> Opt
     return route_prefix
 
 
-def _collect_guards(cls: Type, method) -> List:
-    guards = list(getattr(cls, "__guards__", []))
-    guards.extend(getattr(method, "__guards__", []))
-    return guards
+def _collect_guard_groups(cls: Type, method) -> List:
+    """Return ``(policy, guards)`` groups, controller groups first."""
+    return _guard_groups(cls) + _guard_groups(method)
+
+
+def _guard_groups(obj) -> List:
+    from nest.core.decorators.guards import GuardPolicy
+
+    groups = getattr(obj, "__guard_groups__", None)
+    if groups is None:
+        guards = tuple(getattr(obj, "__guards__", ()))
+        return [(GuardPolicy.SEQUENTIAL, guards)] if guards else []
+    return list(groups)
@@ -1,7 +1,107 @@
 from fastapi import Request, HTTPException, status, Security, Depends
 from fastapi.security.base import SecurityBase
-from typing import Optional
+from collections import OrderedDict
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import asyncio
+import hashlib
 import inspect
+import time
+
+from nest.common.tracing import phase
+
+
+class GuardPolicy(str, Enum):
+    """How the guards passed to one ``UseGuards`` call are executed.
+
+    ``SEQUENTIAL`` runs them one after another as separate dependencies.
+    ``ALL`` runs them concurrently and denies as soon as one denies.
+    ``ANY`` runs them concurrently and allows as soon as one allows.
+    """
+
+    SEQUENTIAL = "sequential"
+    ALL = "all"
+    ANY = "any"
+
+
+class GuardDecisionCache:
+    """Bounded TTL cache of guard decisions with single-flight deduplication.
+
+    Decisions are kept for ``ttl`` seconds and the least recently used entry is
+    evicted once ``max_size`` is exceeded. Concurrent checks for the same key
+    share one in-flight computation instead of each calling the guard.
+    Exceptions are never cached.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, bool]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> bool:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, decision = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                return decision
+            del self._entries[key]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The request that started the check went away; run it ourselves.
+                return await self.get_or_compute(key, compute)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            decision = bool(await compute())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # waiters re-raise it; mark it as retrieved
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        self._entries[key] = (self._clock() + self.ttl, decision)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        future.set_result(decision)
+        return decision
 
 
 class BaseGuard:
@@ -186,6 +286,14 @@ class BaseGuard:
     when ``can_activate`` returns ``False``. You can customize error handling
     by overriding the ``__call__`` method.
     
+    **Decision Cache:**
+    
+    Set ``decision_cache_ttl`` (seconds) to memoize ``can_activate`` results per
+    ``cache_key``. The cache is bounded by ``decision_cache_size`` with LRU
+    eviction, and concurrent checks for the same key run ``can_activate`` only
+    once. The cache lives on the guard instance, so transient guards do not
+    benefit from it.
+    
     **OpenAPI Documentation:**
     
     When using security schemes, guards automatically:
@@ -196,6 +304,8 @@ class BaseGuard:
     """
 
     security_scheme: Optional[SecurityBase] = None
+    decision_cache_ttl: Optional[float] = None
+    decision_cache_size: int = 1024
 
     def can_activate(self, request: Request, credentials=None) -> bool:
         """Determine if the request should be allowed to proceed.
@@ -232,34 +342,89 @@ class BaseGuard:
         """
         raise NotImplementedError("Subclasses must implement can_activate method")
 
+    def cache_key(self, request: Request, credentials=None) -> Optional[Hashable]:
+        """Key under which a ``can_activate`` decision is cached.
+        
+        Only used when ``decision_cache_ttl`` is set. The default keys on the
+        HTTP method, the route template and a hash of the credentials, and
+        skips caching when there are no credentials. Override it to cache on
+        something else, or return ``None`` to skip the cache for a request.
+        
+        Example:
+            ```python
+            class IntrospectionGuard(BaseGuard):
+                security_scheme = HTTPBearer()
+                decision_cache_ttl = 30.0
+                decision_cache_size = 10_000
+                
+                async def can_activate(self, request, credentials=None) -> bool:
+                    return await auth_service.introspect(credentials.credentials)
+            ```
+        """
+        if credentials is None:
+            return None
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or request.url.path
+        digest = hashlib.sha256(repr(credentials).encode()).hexdigest()
+        return (request.method, path, digest)
+
     async def __call__(self, request: Request, credentials=None):
         """Internal method that executes the guard logic.
         
         This method:
-        1. Calls can_activate() with request and credentials
+        1. Calls can_activate() with request and credentials, going through the
+           decision cache when ``decision_cache_ttl`` is set
         2. Handles both sync and async can_activate implementations
         3. Raises HTTPException(403) if access is denied
         
         You typically don't need to override this method unless you want
         custom error handling or logging.
         """
-        result = self.can_activate(request, credentials)
-        if inspect.isawaitable(result):
-            result = await result
+        if self.decision_cache_ttl is None:
+            result = await self._activate(request, credentials)
+        else:
+            key = self.cache_key(request, credentials)
+            if key is None:
+                result = await self._activate(request, credentials)
+            else:
+                result = await self._get_decision_cache().get_or_compute(
+                    key, lambda: self._activate(request, credentials)
+                )
         if not result:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, 
                 detail="Access denied: insufficient permissions"
             )
 
+    async def _activate(self, request: Request, credentials=None):
+        result = self.can_activate(request, credentials)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _get_decision_cache(self) -> GuardDecisionCache:
+        cache = getattr(self, "_BaseGuard__decision_cache", None)
+        if cache is None:
+            cache = GuardDecisionCache(
+                ttl=self.decision_cache_ttl, max_size=self.decision_cache_size
+            )
+            self.__decision_cache = cache
+        return cache
+
     @classmethod
-    def as_dependency(cls):
+    def as_dependency(cls, guard_factory: Optional[Callable[[], "BaseGuard"]] = None):
         """Convert the guard class to a FastAPI dependency function.
         
         This method is used internally by PyNest to integrate guards with
         FastAPI's dependency system. It creates the appropriate dependency
         function based on whether a security scheme is configured.
         
+        Args:
+            guard_factory: Callable returning the guard instance to run for a
+                request. PyNest passes one resolved through the container so
+                the guard is built once, with injected dependencies, and
+                reused. Defaults to instantiating the class on every request.
+        
         Returns:
             Callable: A dependency function that FastAPI can use
             
@@ -273,11 +438,16 @@ class BaseGuard:
         - Extract credentials automatically (if security_scheme is set)
         - Execute guard logic and raise 403 on failure
         """
+        if guard_factory is None:
+            guard_factory = cls
+        span_attributes = {"pynest.guard": cls.__name__}
+
         if cls.security_scheme is None:
             # No security scheme - simple request validation
             async def dependency(request: Request):
-                guard = cls()
-                await guard(request)
+                with phase("guard", span_attributes):
+                    guard = guard_factory()
+                    await guard(request)
 
             return Depends(dependency)
 
@@ -289,13 +459,14 @@ class BaseGuard:
             request: Request,
             credentials=Security(security_scheme)
         ):
-            guard = cls()
-            await guard(request, credentials)
+            with phase("guard", span_attributes):
+                guard = guard_factory()
+                await guard(request, credentials)
 
         return Depends(security_dependency)
 
 
-def UseGuards(*guards):
+def UseGuards(*guards, policy: Union[GuardPolicy, str] = GuardPolicy.SEQUENTIAL):
     """Decorator to apply guards to controllers or individual routes.
     
     Guards provide authentication and authorization for your API endpoints.
@@ -304,6 +475,8 @@ def UseGuards(*guards):
     
     Args:
         *guards: One or more guard classes (not instances) to apply
+        policy: How these guards run, see ``GuardPolicy``. Defaults to
+            sequential execution.
         
     **Usage Examples:**
     
@@ -341,6 +514,19 @@ def UseGuards(*guards):
     Guards are executed in the order they are specified. If any guard fails,
     subsequent guards are not executed and a 403 error is returned.
     
+    Independent I/O-bound guards can overlap instead of adding up:
+    
+    ```python
+    @UseGuards(TokenGuard, TenantGuard, QuotaGuard, policy=GuardPolicy.ALL)
+    def handler(self): ...       # concurrent, first denial cancels the rest
+    
+    @UseGuards(ApiKeyGuard, JwtGuard, policy=GuardPolicy.ANY)
+    def handler(self): ...       # concurrent, first allow wins
+    ```
+    
+    With ``ANY``, give security schemes ``auto_error=False`` so that a missing
+    credential for one guard does not reject the request before the others run.
+    
     **Combining with FastAPI Dependencies:**
     
     Guards work alongside FastAPI's native dependency system and can be
@@ -364,11 +550,109 @@ def UseGuards(*guards):
     Returns:
         Callable: Decorator function that applies guards to the target
     """
+    guard_policy = GuardPolicy(policy)
+
     def decorator(obj):
         # Get existing guards (if any) and append new ones
         existing_guards = list(getattr(obj, "__guards__", []))
         existing_guards.extend(guards)
         setattr(obj, "__guards__", existing_guards)
+        groups = list(getattr(obj, "__guard_groups__", []))
+        groups.append((guard_policy, tuple(guards)))
+        setattr(obj, "__guard_groups__", groups)
         return obj
 
     return decorator
+
+
+def guard_group_dependency(
+    guards: Sequence[Tuple[Any, Callable[[], BaseGuard]]],
+    policy: GuardPolicy,
+):
+    """Build one FastAPI dependency running a group of guards concurrently.
+
+    ``guards`` pairs each guard with the factory producing its instance. Every
+    guard with a security scheme contributes its own ``Security`` parameter,
+    so the group keeps the OpenAPI security requirements of its members.
+    """
+    parameters = [
+        inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+    ]
+    credential_names: List[Optional[str]] = []
+    for index, (guard, _) in enumerate(guards):
+        if guard.security_scheme is None:
+            credential_names.append(None)
+            continue
+        name = f"credentials_{index}"
+        credential_names.append(name)
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Security(guard.security_scheme),
+            )
+        )
+    factories = [factory for _, factory in guards]
+    run = _run_all if policy == GuardPolicy.ALL else _run_any
+    span_attributes = {
+        "pynest.guard": ",".join(guard.__name__ for guard, _ in guards),
+        "pynest.guard_policy": policy.value,
+    }
+
+    async def group_dependency(request: Request, **credentials):
+        with phase("guard", span_attributes):
+            await run(
+                [
+                    factory()(request, credentials[name] if name else None)
+                    for factory, name in zip(factories, credential_names)
+                ]
+            )
+
+    group_dependency.__signature__ = inspect.Signature(parameters)
+    return Depends(group_dependency)
+
+
+async def _run_all(checks: List[Awaitable[None]]) -> None:
+    tasks = [asyncio.ensure_future(check) for check in checks]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise task.exception()
+    finally:
+        _settle_tasks(tasks)
+
+
+async def _run_any(checks: List[Awaitable[None]]) -> None:
+    tasks = [asyncio.ensure_future(check) for check in checks]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            if any(task.exception() is None for task in done):
+                return
+        # Every guard denied: surface the first denial in declaration order.
+        raise tasks[0].exception()
+    finally:
+        _settle_tasks(tasks)
+
+
+def _settle_tasks(tasks: List[asyncio.Future]) -> None:
+    """
+    Cancel the guards still running and retrieve the outcome of every task,
+    so failures that are not propagated are not logged by asyncio as
+    "exception was never retrieved".
+    """
+    for task in tasks:
+        if task.done():
+            _consume_outcome(task)
+        else:
+            task.cancel()
+            task.add_done_callback(_consume_outcome)
+
+
+def _consume_outcome(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
@@ -10,6 +10,7 @@ class Module:
     exports: List[type] = dataclasses.field(default_factory=list)
     imports: List[type] = dataclasses.field(default_factory=list)
     is_global: bool = dataclasses.field(default=False)
+    lazy: bool = dataclasses.field(default=False)
 
     def __call__(self, cls):
         setattr(cls, ModuleMetadata.CONTROLLERS, self.controllers)
@@ -18,5 +19,6 @@ class Module:
         setattr(cls, ModuleMetadata.EXPORTS, self.exports)
         setattr(cls, "__is_module__", True)
         setattr(cls, "__is_global__", self.is_global)
+        setattr(cls, "__is_lazy__", self.lazy)
 
         return cls
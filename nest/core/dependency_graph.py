@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, List, Set
+from collections import deque
+from typing import Any, Dict, Iterable, List, Set
 
 
 class CycleError(Exception):
@@ -31,53 +32,152 @@ class DependencyGraph:
         self.add_node(dependency)
         self._edges[dependent].add(dependency)
 
+    def dependencies_of(self, node: Any) -> Set[Any]:
+        """Direct dependencies of ``node``."""
+        return set(self._edges.get(node, ()))
+
+    def strongly_connected_components(self) -> List[List[Any]]:
+        """
+        Return the strongly connected components (Tarjan), dependencies first.
+
+        Every node belongs to exactly one component; a component with more
+        than one node, or a node depending on itself, is a cycle. Iterative, so
+        deep graphs do not hit the recursion limit.
+        """
+        index: Dict[Any, int] = {}
+        lowlink: Dict[Any, int] = {}
+        stack: List[Any] = []
+        on_stack: Set[Any] = set()
+        components: List[List[Any]] = []
+
+        for root in self._edges:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._edges[root]))]
+            while work:
+                node, deps = work[-1]
+                for dep in deps:
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(self._edges[dep])))
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
     def detect_cycles(self) -> List[List[Any]]:
-        """Return a list of cycles (each cycle is a list of nodes). Empty list = no cycles."""
-        visited: Set[Any] = set()
-        path: List[Any] = []
-        path_set: Set[Any] = set()
+        """
+        Return one cycle per cyclic strongly connected component, as a closed
+        path (first node repeated at the end). Empty list = no cycles.
+        """
         cycles: List[List[Any]] = []
-
-        def dfs(node: Any) -> None:
-            visited.add(node)
-            path.append(node)
-            path_set.add(node)
-            for dep in self._edges.get(node, set()):
-                if dep not in visited:
-                    dfs(dep)
-                elif dep in path_set:
-                    idx = path.index(dep)
-                    cycles.append(list(path[idx:]) + [dep])
-            path.pop()
-            path_set.discard(node)
-
-        for node in list(self._edges.keys()):
-            if node not in visited:
-                dfs(node)
+        for component in self.strongly_connected_components():
+            if len(component) > 1 or component[0] in self._edges[component[0]]:
+                # The last member popped is the first one the search reached.
+                cycles.append(self._shortest_cycle(component[-1], set(component)))
         return cycles
 
     def topological_sort(self) -> List[Any]:
-        """Return nodes in initialization order: dependencies come before dependents."""
-        visited: Set[Any] = set()
-        result: List[Any] = []
-
-        def visit(node: Any) -> None:
-            if node in visited:
-                return
-            visited.add(node)
-            for dep in self._edges.get(node, set()):
-                visit(dep)
-            result.append(node)
-
-        for node in list(self._edges.keys()):
-            visit(node)
-        return result
+        """
+        Return nodes in initialization order: dependencies come before
+        dependents. Members of a cycle are kept together in arbitrary order.
+        """
+        return [
+            node
+            for component in self.strongly_connected_components()
+            for node in component
+        ]
+
+    def dependents_of(self, nodes: Iterable[Any]) -> Set[Any]:
+        """Return ``nodes`` plus every node that transitively depends on one of them."""
+        dependents: dict[Any, List[Any]] = {}
+        for node, deps in self._edges.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(node)
+
+        pending = list(nodes)
+        reached = set(pending)
+        while pending:
+            for dependent in dependents.get(pending.pop(), ()):
+                if dependent not in reached:
+                    reached.add(dependent)
+                    pending.append(dependent)
+        return reached
+
+    def levels(self) -> List[List[Any]]:
+        """
+        Group nodes into initialization levels: every node's dependencies sit
+        in earlier levels, so the nodes within one level are independent.
+        The members of a cycle share a level.
+        """
+        depth: Dict[Any, int] = {}
+        levels: List[List[Any]] = []
+        for component in self.strongly_connected_components():
+            members = set(component)
+            level = 1 + max(
+                (
+                    depth[dep]
+                    for node in component
+                    for dep in self._edges[node]
+                    if dep not in members
+                ),
+                default=-1,
+            )
+            if level == len(levels):
+                levels.append([])
+            for node in component:
+                depth[node] = level
+                levels[level].append(node)
+        return levels
+
+    def _shortest_cycle(self, start: Any, members: Set[Any]) -> List[Any]:
+        parent: Dict[Any, Any] = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for dep in self._edges[node]:
+                if dep == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path + [start]
+                if dep in members and dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        return [start, start]
 
     def validate(self) -> None:
         """Raise CycleError if any circular dependencies exist."""
         cycles = self.detect_cycles()
         if cycles:
-            chain = " → ".join(
-                getattr(n, "__name__", repr(n)) for n in cycles[0]
-            )
-            raise CycleError(f"Circular dependency detected: {chain}")
+            raise CycleError(format_cycles(cycles))
+
+
+def format_cycles(cycles: List[List[Any]]) -> str:
+    """Describe every cycle, e.g. ``Circular dependency detected: A → B → A``."""
+    chains = [
+        " → ".join(getattr(n, "__name__", repr(n)) for n in cycle) for cycle in cycles
+    ]
+    if len(chains) == 1:
+        return f"Circular dependency detected: {chains[0]}"
+    return "Circular dependencies detected:\n" + "\n".join(f"  {c}" for c in chains)
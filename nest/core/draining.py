@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+_logger = logging.getLogger("pynest.draining")
+
+_POLL_INTERVAL = 0.05
+
+
+class InFlightTracker:
+    """
+    Counts in-flight HTTP requests and open WebSocket connections.
+
+    Once ``draining`` is set, ``InFlightMiddleware`` turns new work away, so
+    the counters can only go down.
+    """
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections = 0
+        self.draining = False
+
+    @property
+    def in_flight(self) -> int:
+        return self.requests + self.connections
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Start draining and wait for in-flight work; False if the deadline passed."""
+        self.draining = True
+        if await self.wait_idle(timeout):
+            return True
+        _logger.warning(
+            f"Drain deadline of {timeout}s reached with {self.requests} requests "
+            f"and {self.connections} WebSocket connections in flight"
+        )
+        return False
+
+    async def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until nothing is in flight; False if ``timeout`` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.in_flight:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(_POLL_INTERVAL)
+        return True
+
+
+class InFlightMiddleware:
+    """
+    ASGI middleware feeding an InFlightTracker.
+
+    While the tracker is draining, new HTTP requests get a 503 response with
+    ``Connection: close`` and new WebSocket handshakes are rejected.
+    """
+
+    def __init__(self, app, tracker: InFlightTracker) -> None:
+        self.app = app
+        self.tracker = tracker
+
+    async def __call__(self, scope, receive, send) -> None:
+        kind = scope["type"]
+        if kind not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        if self.tracker.draining:
+            await self._reject(kind, receive, send)
+            return
+
+        if kind == "http":
+            self.tracker.requests += 1
+        else:
+            self.tracker.connections += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if kind == "http":
+                self.tracker.requests -= 1
+            else:
+                self.tracker.connections -= 1
+
+    @staticmethod
+    async def _reject(kind: str, receive, send) -> None:
+        if kind == "websocket":
+            await receive()
+            await send({"type": "websocket.close", "code": 1012})
+            return
+        body = json.dumps({"message": "Service is shutting down"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"connection", b"close"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
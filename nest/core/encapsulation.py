@@ -10,6 +10,8 @@ import inspect
 from typing import TYPE_CHECKING, Any, Dict, List, Set
 
 from nest.common.exceptions import ProviderNotExportedException
+from nest.common.module import DynamicModule
+from nest.core.dependency_graph import DependencyGraph
 
 if TYPE_CHECKING:
     from nest.core.pynest_container import ModuleRef
@@ -29,59 +31,40 @@ def validate_module_encapsulation(modules: Dict[str, "ModuleRef"]) -> None:
     if not modules:
         return
 
-    # Map every provider token (and controller class) to the module that owns it.
+    # Map every provider token (and controller class) to the module that owns it,
+    # and index class tokens by name for string forward references.
     provider_owner: Dict[Any, "ModuleRef"] = {}
+    providers_by_name: Dict[str, List[type]] = {}
+    own_tokens: Dict[str, Set[Any]] = {}
     for mref in modules.values():
+        own = own_tokens[mref.token] = set()
         for desc in mref.compiled.provider_descriptors:
             provider_owner[desc.provide] = mref
+            own.add(desc.provide)
         for ctrl in mref.compiled.controllers:
             provider_owner[ctrl] = mref
+            own.add(ctrl)
+    for token in provider_owner:
+        if isinstance(token, type):
+            providers_by_name.setdefault(token.__name__, []).append(token)
 
-    # Class → its ModuleRef (so we can look up imported modules by their metatype).
-    metatype_to_ref: Dict[type, "ModuleRef"] = {
-        mref.metatype: mref for mref in modules.values()
-    }
+    exports = _resolve_exports(modules)
 
-    def resolved_exports(mref: "ModuleRef", _seen: Set[str] = None) -> Set[Any]:
-        """Return the set of provider tokens that `mref` exposes to importers,
-        following module re-exports recursively."""
-        if _seen is None:
-            _seen = set()
-        if mref.token in _seen:
-            return set()
-        _seen = _seen | {mref.token}
-        result: Set[Any] = set()
-        for exp in mref.compiled.exports:
-            # If the export is a Module class, re-export everything it exports.
-            if isinstance(exp, type) and getattr(exp, "__is_module__", False):
-                child = metatype_to_ref.get(exp)
-                if child is not None:
-                    result |= resolved_exports(child, _seen)
-            else:
-                result.add(exp)
-        return result
-
-    # Anything provided by an @Module(is_global=True) module is visible everywhere.
+    # Anything provided by a global module is visible everywhere.
     global_providers: Set[Any] = set()
     for mref in modules.values():
-        if getattr(mref.metatype, "__is_global__", False):
+        if mref.compiled.is_global:
             for desc in mref.compiled.provider_descriptors:
                 global_providers.add(desc.provide)
 
-    # Per-module visibility set: own providers + imported exports + globals.
-    visible: Dict[str, Set[Any]] = {}
-    for mref in modules.values():
-        s: Set[Any] = set()
-        for desc in mref.compiled.provider_descriptors:
-            s.add(desc.provide)
-        for ctrl in mref.compiled.controllers:
-            s.add(ctrl)
-        for imp in mref.compiled.imports:
-            child = metatype_to_ref.get(imp)
-            if child is not None:
-                s |= resolved_exports(child)
-        s |= global_providers
-        visible[mref.token] = s
+    def is_visible(mref: "ModuleRef", token: Any) -> bool:
+        """Own providers, imported exports and globals are visible to `mref`."""
+        if token in own_tokens[mref.token] or token in global_providers:
+            return True
+        for child_token in mref.compiled.import_tokens:
+            if token in exports.get(child_token, ()):
+                return True
+        return False
 
     # Walk every consumer's __init__ signature and check each annotated dependency.
     errors: List[str] = []
@@ -106,10 +89,7 @@ def validate_module_encapsulation(modules: Dict[str, "ModuleRef"]) -> None:
 
                 # Resolve string forward refs against known providers (best effort).
                 if isinstance(ann, str):
-                    matches = [
-                        p for p in provider_owner
-                        if isinstance(p, type) and p.__name__ == ann
-                    ]
+                    matches = providers_by_name.get(ann, ())
                     if len(matches) != 1:
                         continue
                     ann = matches[0]
@@ -122,7 +102,7 @@ def validate_module_encapsulation(modules: Dict[str, "ModuleRef"]) -> None:
                 if ann not in provider_owner:
                     continue
 
-                if ann not in visible[mref.token]:
+                if not is_visible(mref, ann):
                     owner = provider_owner[ann]
                     errors.append(_format_violation(consumer_cls, mref, ann, owner))
 
@@ -133,6 +113,75 @@ def validate_module_encapsulation(modules: Dict[str, "ModuleRef"]) -> None:
         )
 
 
+def _resolve_exports(modules: Dict[str, "ModuleRef"]) -> Dict[str, Set[Any]]:
+    """Return, per module token, the provider tokens the module exposes to importers.
+
+    Module re-exports are followed transitively. Modules re-exporting each
+    other form a strongly connected component of the re-export graph; every
+    member of a component exposes the union of what the component exports.
+    """
+    # Class → its ModuleRef, for re-exports of modules that are not imported.
+    metatype_to_ref: Dict[type, "ModuleRef"] = {
+        mref.metatype: mref for mref in modules.values()
+    }
+    graph = DependencyGraph()
+    for mref in modules.values():
+        graph.add_node(mref.token)
+        for child in _re_exported_modules(mref, modules, metatype_to_ref):
+            graph.add_dependency(mref.token, child.token)
+
+    exports: Dict[str, Set[Any]] = {}
+    # Components come dependencies first, so re-exported modules outside a
+    # component are resolved before it.
+    for component in graph.strongly_connected_components():
+        members = set(component)
+        result: Set[Any] = set()
+        for token in component:
+            result.update(
+                exp for exp in modules[token].compiled.exports if not _is_module(exp)
+            )
+            for child_token in graph.dependencies_of(token):
+                if child_token not in members:
+                    result.update(exports[child_token])
+        for token in component:
+            exports[token] = result
+
+    return exports
+
+
+def _re_exported_modules(
+    mref: "ModuleRef",
+    modules: Dict[str, "ModuleRef"],
+    metatype_to_ref: Dict[type, "ModuleRef"],
+) -> List["ModuleRef"]:
+    """Modules listed in `mref`'s exports, matched against its imports first.
+
+    Exporting a module class re-exports whichever configuration of it was
+    imported, so a dynamic import can be re-exported by its class.
+    """
+    compiled = mref.compiled
+    children: List["ModuleRef"] = []
+    for exp in compiled.exports:
+        if not _is_module(exp):
+            continue
+        child = None
+        for imp, imp_token in zip(compiled.imports, compiled.import_tokens):
+            if imp == exp or (isinstance(imp, DynamicModule) and imp.module is exp):
+                child = modules.get(imp_token)
+                break
+        if child is None and isinstance(exp, type):
+            child = metatype_to_ref.get(exp)
+        if child is not None:
+            children.append(child)
+    return children
+
+
+def _is_module(obj: Any) -> bool:
+    return isinstance(obj, DynamicModule) or (
+        isinstance(obj, type) and getattr(obj, "__is_module__", False)
+    )
+
+
 def _format_violation(consumer_cls: type, consumer_module, dep, owner_module) -> str:
     consumer_name = consumer_cls.__name__
     consumer_mod = consumer_module.metatype.__name__
@@ -0,0 +1,154 @@
+"""On-disk cache of the validated provider graph.
+
+A container build validates the module graph (cycles, encapsulation) and
+inspects every provider constructor to wire the dependency graph. None of that
+changes unless the code does, so the result can be stored next to a
+fingerprint of the source files that define the modules and providers. A later
+build with a matching fingerprint loads the graph and skips the analysis.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+import nest
+from nest.common.provider import InjectionToken
+from nest.core.dependency_graph import DependencyGraph
+from nest.core.module_scope import ScopedToken
+
+_CACHE_FORMAT = 1
+
+_logger = logging.getLogger("pynest.graph_cache")
+
+
+class GraphCache:
+    """Reads and writes the validated provider graph of one application."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self, fingerprint: str, known: Iterable[Any]) -> Optional[DependencyGraph]:
+        """Return the cached graph, or None when it is missing, stale or unreadable."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != _CACHE_FORMAT or data.get("fingerprint") != fingerprint:
+            return None
+
+        lookup = {}
+        for key in known:
+            node_id = _node_id(key)
+            if node_id is not None:
+                lookup[node_id] = key
+        graph = DependencyGraph()
+        try:
+            for node_id, dep_ids in data["graph"].items():
+                node = _resolve_node(node_id, lookup)
+                graph.add_node(node)
+                for dep_id in dep_ids:
+                    graph.add_dependency(node, _resolve_node(dep_id, lookup))
+        except (KeyError, LookupError, ImportError, AttributeError, TypeError):
+            _logger.info(f"Ignoring graph cache {self.path}: it no longer matches the code")
+            return None
+        return graph
+
+    def save(self, fingerprint: str, graph: DependencyGraph) -> bool:
+        """
+        Write ``graph``; returns False when a node cannot be serialized or the
+        file cannot be written, so a cache never stops the application.
+        """
+        serialized: Dict[str, List[str]] = {}
+        for node in graph.nodes:
+            node_id = _node_id(node)
+            dep_ids = [_node_id(dep) for dep in graph.dependencies_of(node)]
+            if node_id is None or None in dep_ids:
+                _logger.info(f"Not caching the provider graph: {node!r} has no stable id")
+                return False
+            serialized[node_id] = sorted(dep_ids)
+
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(temporary, "w", encoding="utf-8") as cache_file:
+                json.dump(
+                    {"format": _CACHE_FORMAT, "fingerprint": fingerprint, "graph": serialized},
+                    cache_file,
+                )
+            os.replace(temporary, self.path)
+        except BaseException as error:
+            try:
+                os.unlink(temporary)
+            except OSError:
+                pass
+            if not isinstance(error, OSError):
+                raise
+            _logger.warning(f"Could not write the provider graph cache {self.path}: {error}")
+            return False
+        return True
+
+
+def source_fingerprint(objects: Iterable[Any], extra: Iterable[str] = ()) -> str:
+    """
+    Hash the source files defining ``objects`` (plus the PyNest and Python
+    versions and any ``extra`` strings, such as dynamic module tokens).
+    """
+    paths = set()
+    names = set(extra)
+    for obj in objects:
+        module_name = getattr(obj, "__module__", None)
+        if not module_name:
+            continue
+        names.add(f"{module_name}:{getattr(obj, '__qualname__', repr(obj))}")
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        if path:
+            paths.add(path)
+
+    digest = hashlib.sha256()
+    digest.update(f"{nest.__version__}|{sys.version}".encode())
+    for name in sorted(names):
+        digest.update(name.encode())
+    for path in sorted(paths):
+        digest.update(path.encode())
+        try:
+            with open(path, "rb") as source:
+                digest.update(source.read())
+        except OSError:
+            digest.update(b"<unreadable>")
+    return digest.hexdigest()
+
+
+def _node_id(node: Any) -> Optional[str]:
+    if isinstance(node, ScopedToken):
+        inner = _node_id(node.token)
+        return None if inner is None else f"scoped:{node.module_token}|{inner}"
+    if isinstance(node, str):
+        return f"str:{node}"
+    if isinstance(node, InjectionToken):
+        return f"token:{node.name}"
+    if isinstance(node, type):
+        return f"cls:{node.__module__}:{node.__qualname__}"
+    return None
+
+
+def _resolve_node(node_id: str, lookup: Dict[str, Any]) -> Any:
+    if node_id in lookup:
+        return lookup[node_id]
+    kind, _, rest = node_id.partition(":")
+    if kind == "str":
+        return rest
+    if kind == "token":
+        return InjectionToken(rest)
+    if kind == "cls":
+        module_name, _, qualname = rest.partition(":")
+        target: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            target = getattr(target, part)
+        return target
+    raise LookupError(node_id)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, Callable, Collection, List
 
-from injector import Injector, Module as InjectorModule, noscope, singleton
+from injector import Injector, Module as InjectorModule, Provider, noscope, singleton
 
 from nest.common.provider import InjectionToken, ProviderDescriptor, Scope
+from nest.core.request_scope import RequestScope
 
 
 def _injector_scope(scope: Scope):
     if scope == Scope.SINGLETON:
         return singleton
-    return noscope  # TRANSIENT and REQUEST both use noscope at this layer
+    if scope == Scope.REQUEST:
+        return RequestScope
+    return noscope
 
 
 def _to_key(token: Any) -> Any:
@@ -37,7 +40,7 @@ class PyNestInjectorModule(InjectorModule):
         ]
 
     def configure(self, binder) -> None:
-        from injector import InstanceProvider
+        from injector import CallableProvider, InstanceProvider
 
         for desc in self._descriptors:
             scope = _injector_scope(desc.scope)
@@ -45,25 +48,93 @@ class PyNestInjectorModule(InjectorModule):
 
             if desc.use_value is not None:
                 binder.bind(key, to=InstanceProvider(desc.use_value))
+            elif desc.use_class is not None and desc.dependencies is not None:
+                binder.bind(
+                    key,
+                    to=CallableProvider(_keyword_constructor(binder.injector, desc)),
+                    scope=scope,
+                )
             elif desc.use_class is not None:
                 binder.bind(key, to=desc.use_class, scope=scope)
 
 
-def build_injector(descriptors: List[ProviderDescriptor]) -> Injector:
+class PendingProvider(Provider):
+    """Placeholder for a provider whose async factory has not been awaited yet."""
+
+    def __init__(self, key: Any) -> None:
+        self._key = key
+
+    def get(self, injector) -> Any:
+        raise RuntimeError(
+            f"Provider {self._key!r} is created by an async factory and is not "
+            "available until the application has bootstrapped "
+            "(container.initialize_lifecycle())."
+        )
+
+
+class LazyProvider(Provider):
+    """Placeholder for a provider of a lazy module; loads the module on first use."""
+
+    def __init__(self, key: Any, load: Callable[[], None]) -> None:
+        self._key = key
+        self._load = load
+
+    def get(self, injector) -> Any:
+        self._load()
+        binding, _ = injector.binder.get_binding(self._key)
+        if binding.provider is self:
+            raise RuntimeError(f"Lazy module did not provide {self._key!r}")
+        return injector.get(self._key)
+
+
+def build_injector(
+    descriptors: List[ProviderDescriptor], deferred: Collection[Any] = ()
+) -> Injector:
     """
     Build and return a configured Injector from a list of ProviderDescriptors.
 
     use_factory and use_existing providers are resolved post-build so that
     their dependencies and aliased singletons are already in the injector.
+    Keys in ``deferred`` (async factories and what depends on them) are bound
+    to a PendingProvider until the container awaits them.
     """
-    from injector import InstanceProvider
-
     injector = Injector([PyNestInjectorModule(descriptors)])
+    _bind_resolved_providers(injector, descriptors, deferred)
+    return injector
+
+
+def bind_providers(
+    injector: Injector,
+    descriptors: List[ProviderDescriptor],
+    deferred: Collection[Any] = (),
+) -> None:
+    """Add ``descriptors`` to an injector that has already been built."""
+    PyNestInjectorModule(descriptors).configure(injector.binder)
+    _bind_resolved_providers(injector, descriptors, deferred)
+
+
+def _bind_resolved_providers(
+    injector: Injector,
+    descriptors: List[ProviderDescriptor],
+    deferred: Collection[Any],
+) -> None:
+    from injector import CallableProvider, InstanceProvider
 
     for desc in descriptors:
         key = _to_key(desc.provide)
 
-        if desc.use_factory is not None:
+        if key in deferred:
+            injector.binder.bind(key, to=PendingProvider(key))
+
+        elif desc.scope == Scope.REQUEST and (
+            desc.use_factory is not None or desc.use_existing is not None
+        ):
+            # Request-scoped factories and aliases resolve inside each request.
+            injector.binder.bind(
+                key, to=CallableProvider(_deferred(injector, desc)), scope=RequestScope
+            )
+
+        elif desc.use_factory is not None:
             deps = [injector.get(_to_key(t)) for t in desc.inject]
             instance = desc.use_factory(*deps)
             injector.binder.bind(key, to=InstanceProvider(instance))
@@ -73,4 +144,19 @@ def build_injector(descriptors: List[ProviderDescriptor]) -> Injector:
             existing_instance = injector.get(_to_key(desc.use_existing))
             injector.binder.bind(key, to=InstanceProvider(existing_instance))
 
-    return injector
+
+def _keyword_constructor(injector: Injector, desc: ProviderDescriptor):
+    """Build ``desc.use_class`` from its explicit ``dependencies`` keys."""
+    cls = desc.use_class
+    dependencies = tuple(desc.dependencies.items())
+    return lambda: cls(**{name: injector.get(key) for name, key in dependencies})
+
+
+def _deferred(injector: Injector, desc: ProviderDescriptor):
+    if desc.use_existing is not None:
+        existing = _to_key(desc.use_existing)
+        return lambda: injector.get(existing)
+
+    factory = desc.use_factory
+    inject = [_to_key(t) for t in desc.inject]
+    return lambda: factory(*[injector.get(t) for t in inject])
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from nest.core.pynest_container import ModuleRef, PyNestContainer
+
+
+class LazyModuleLoader:
+    """
+    Loads ``@Module(lazy=True)`` modules on demand.
+
+    Lazy modules imported by another module are not compiled or bound when the
+    application starts. They load the first time one of their providers is
+    resolved, or explicitly through this loader, which can be injected into
+    any provider:
+
+        @Injectable
+        class ReportsService:
+            def __init__(self, loader: LazyModuleLoader):
+                self.loader = loader
+
+            async def export(self):
+                await self.loader.load(ExportModule)
+    """
+
+    def __init__(self, container: "PyNestContainer") -> None:
+        self._container = container
+
+    async def load(self, module_class: Type) -> "ModuleRef":
+        return await self._container.load_lazy_module_async(module_class)
@@ -0,0 +1,367 @@
+"""Per-route request counters and latency histograms.
+
+``RouteMetrics`` is opt-in: pass one to ``PyNestFactory.create`` and every
+controller route counts its requests by status code and records its latency
+in a log-linear ("HDR-style") histogram, labelled by controller, HTTP method
+and route template. The totals are served in the Prometheus text format.
+
+Recording happens in the route handler, which runs on the serving event loop,
+so each process has a single writer and the hot path takes no lock. With
+``multiprocess_dir`` set, every process also writes a snapshot of its totals
+to that directory and the exposition endpoint adds up all of them, so any
+worker of a pre-fork server can answer a scrape for the whole server.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+
+_logger = logging.getLogger("pynest.metrics")
+
+# Latencies are recorded in microseconds. Each power of two is split into
+# 2 ** _SUB_BUCKET_BITS linear sub-buckets, which keeps the relative error of
+# any bucket bound under 1 / 2 ** _SUB_BUCKET_BITS (6.25%).
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_MAX_MICROSECONDS = (1 << 36) - 1
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_SNAPSHOT_PREFIX = "routes-"
+
+
+def _bucket_index(microseconds: int) -> int:
+    if microseconds > _MAX_MICROSECONDS:
+        microseconds = _MAX_MICROSECONDS
+    shift = microseconds.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return microseconds
+    return shift * _SUB_BUCKETS + (microseconds >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Exclusive upper bound, in microseconds, of histogram bucket ``index``."""
+    shift = max(0, index // _SUB_BUCKETS - 1)
+    return (index - shift * _SUB_BUCKETS + 1) << shift
+
+
+_BUCKET_COUNT = _bucket_index(_MAX_MICROSECONDS) + 1
+
+
+class RouteStats:
+    """Request counts by status code and the latency histogram of one route."""
+
+    __slots__ = ("controller", "method", "route", "statuses", "sum_ns", "buckets")
+
+    def __init__(self, controller: str, method: str, route: str) -> None:
+        self.controller = controller
+        self.method = method
+        self.route = route
+        self.statuses: Dict[int, int] = {}
+        self.sum_ns = 0
+        self.buckets = [0] * _BUCKET_COUNT
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return self.controller, self.method, self.route
+
+    @property
+    def count(self) -> int:
+        return sum(self.statuses.values())
+
+    def record(self, status: int, elapsed_ns: int) -> None:
+        statuses = self.statuses
+        statuses[status] = statuses.get(status, 0) + 1
+        self.sum_ns += elapsed_ns
+        self.buckets[_bucket_index(elapsed_ns // 1000)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Latency, in seconds, below which ``fraction`` of the requests fell."""
+        target = fraction * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= target:
+                return _bucket_upper_bound(index) / 1_000_000
+        return 0.0
+
+    def merge(self, other: "RouteStats") -> None:
+        for status, hits in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + hits
+        self.sum_ns += other.sum_ns
+        for index, hits in enumerate(other.buckets):
+            if hits:
+                self.buckets[index] += hits
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Copies are taken in single C calls, so a flush from another thread
+        # never iterates a dict the event loop is resizing.
+        buckets = list(self.buckets)
+        return {
+            "controller": self.controller,
+            "method": self.method,
+            "route": self.route,
+            "statuses": {str(status): hits for status, hits in dict(self.statuses).items()},
+            "sum_ns": self.sum_ns,
+            "buckets": {str(index): hits for index, hits in enumerate(buckets) if hits},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RouteStats":
+        stats = cls(data["controller"], data["method"], data["route"])
+        stats.statuses = {int(status): hits for status, hits in data["statuses"].items()}
+        stats.sum_ns = data["sum_ns"]
+        for index, hits in data["buckets"].items():
+            stats.buckets[int(index)] = hits
+        return stats
+
+
+class RouteMetrics:
+    """
+    Collects ``RouteStats`` for every controller route and renders them in
+    the Prometheus text exposition format on ``path``.
+
+    ``buckets`` are the histogram bounds, in seconds, that are exposed; the
+    recorded histogram is finer and maps onto any bounds. ``multiprocess_dir``
+    enables aggregation across worker processes: each process writes its
+    totals there every ``flush_interval`` seconds and on shutdown. Empty the
+    directory before the server starts.
+    """
+
+    def __init__(
+        self,
+        path: str = "/metrics",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        multiprocess_dir: Optional[str] = None,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.buckets = tuple(sorted(buckets))
+        self.multiprocess_dir = multiprocess_dir
+        self.flush_interval = flush_interval
+        self._routes: Dict[Tuple[str, str, str], RouteStats] = {}
+        self._bucket_cutoffs = tuple(
+            _cutoff_index(bound * 1_000_000) for bound in self.buckets
+        )
+        self._stop: Optional[threading.Event] = None
+        self._flusher: Optional[threading.Thread] = None
+
+    def route(self, controller: str, method: str, route: str) -> RouteStats:
+        """Return the stats of a route, registering it on first use."""
+        key = (controller, method, route)
+        stats = self._routes.get(key)
+        if stats is None:
+            stats = self._routes[key] = RouteStats(controller, method, route)
+        return stats
+
+    def stats(self) -> List[RouteStats]:
+        """
+        Stats of every route; in multiprocess mode, the sum over all the
+        processes that wrote a snapshot.
+        """
+        if self.multiprocess_dir is None:
+            return list(self._routes.values())
+        self.flush()
+        merged: Dict[Tuple[str, str, str], RouteStats] = {}
+        for snapshot in self._read_snapshots():
+            for entry in snapshot:
+                stats = RouteStats.from_dict(entry)
+                if stats.key in merged:
+                    merged[stats.key].merge(stats)
+                else:
+                    merged[stats.key] = stats
+        return list(merged.values())
+
+    def render(self) -> str:
+        """The current stats in the Prometheus text exposition format."""
+        routes = sorted(self.stats(), key=lambda stats: stats.key)
+        lines = [
+            "# HELP pynest_http_requests_total Requests handled, by route and status code.",
+            "# TYPE pynest_http_requests_total counter",
+        ]
+        for stats in routes:
+            labels = _labels(stats)
+            for status, hits in sorted(stats.statuses.items()):
+                lines.append(
+                    f'pynest_http_requests_total{{{labels},status="{status}"}} {hits}'
+                )
+
+        lines.extend(
+            [
+                "# HELP pynest_http_request_duration_seconds Time from routing a "
+                "request to its response, by route.",
+                "# TYPE pynest_http_request_duration_seconds histogram",
+            ]
+        )
+        for stats in routes:
+            labels = _labels(stats)
+            cumulative = 0
+            start = 0
+            for bound, cutoff in zip(self.buckets, self._bucket_cutoffs):
+                cumulative += sum(stats.buckets[start:cutoff])
+                start = max(start, cutoff)
+                lines.append(
+                    f"pynest_http_request_duration_seconds_bucket"
+                    f'{{{labels},le="{_format_float(bound)}"}} {cumulative}'
+                )
+            count = stats.count
+            lines.append(
+                f'pynest_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}'
+            )
+            lines.append(
+                f"pynest_http_request_duration_seconds_sum{{{labels}}} "
+                f"{_format_float(stats.sum_ns / 1e9)}"
+            )
+            lines.append(f"pynest_http_request_duration_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def endpoint(self) -> Response:
+        """Exposition endpoint; sync so that snapshot files are read off the loop."""
+        return Response(self.render(), media_type=_CONTENT_TYPE)
+
+    def start(self) -> None:
+        """In multiprocess mode, start flushing this process's totals periodically."""
+        if self.multiprocess_dir is None or self._flusher is not None:
+            return
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(self._stop,),
+            name="pynest-metrics-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def stop(self) -> None:
+        """Stop the periodic flush and write a last snapshot."""
+        if self._flusher is None:
+            return
+        self._stop.set()
+        self._flusher.join()
+        self._flusher = None
+        self._stop = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write this process's totals to ``multiprocess_dir``."""
+        if self.multiprocess_dir is None:
+            return
+        snapshot = [stats.to_dict() for stats in list(self._routes.values())]
+        path = os.path.join(self.multiprocess_dir, f"{_SNAPSHOT_PREFIX}{os.getpid()}.json")
+        # The scrape endpoint and the periodic flush may write at once.
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary, "w", encoding="utf-8") as snapshot_file:
+                json.dump(snapshot, snapshot_file)
+            os.replace(temporary, path)
+        except OSError as exc:
+            _logger.warning(f"Could not write route metrics to {path}: {exc}")
+
+    def _flush_periodically(self, stop: threading.Event) -> None:
+        while not stop.wait(self.flush_interval):
+            self.flush()
+
+    def _read_snapshots(self) -> Iterable[List[Dict[str, Any]]]:
+        try:
+            names = os.listdir(self.multiprocess_dir)
+        except OSError:
+            return
+        for name in sorted(names):
+            if not (name.startswith(_SNAPSHOT_PREFIX) and name.endswith(".json")):
+                continue
+            try:
+                with open(
+                    os.path.join(self.multiprocess_dir, name), "r", encoding="utf-8"
+                ) as snapshot_file:
+                    yield json.load(snapshot_file)
+            except (OSError, ValueError):
+                _logger.warning(f"Skipping unreadable route metrics snapshot {name}")
+
+
+class MeteredAPIRoute(APIRoute):
+    """
+    Route whose request handler records into a ``RouteStats``.
+
+    Like ``FilteredAPIRoute``, the stats are a class attribute so that they
+    survive ``include_router``; ``bind`` derives one subclass per route and
+    can stack on another route class.
+    """
+
+    route_stats: RouteStats
+
+    @classmethod
+    def bind(cls, stats: RouteStats, base: type = APIRoute) -> type:
+        bases = (cls,) if base is APIRoute else (cls, base)
+        return type(cls.__name__, bases, {"route_stats": stats})
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        record = self.route_stats.record
+        clock = time.perf_counter_ns
+
+        async def metered_handler(request: Request) -> Response:
+            start = clock()
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            except HTTPException as exc:
+                status = exc.status_code
+                raise
+            except RequestValidationError:
+                status = 422
+                raise
+            finally:
+                record(status, clock() - start)
+
+        return metered_handler
+
+
+def _cutoff_index(microseconds: float) -> int:
+    """Number of leading histogram buckets lying entirely at or below ``microseconds``."""
+    index = 0
+    while index < _BUCKET_COUNT and _bucket_upper_bound(index) <= microseconds:
+        index += 1
+    return index
+
+
+def _labels(stats: RouteStats) -> str:
+    return (
+        f'controller="{_escape(stats.controller)}",'
+        f'method="{_escape(stats.method)}",'
+        f'route="{_escape(stats.route)}"'
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
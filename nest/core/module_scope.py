@@ -0,0 +1,155 @@
+"""Per-configuration bindings for modules registered more than once.
+
+Every provider is bound in a single injector, keyed by its token. A module
+imported in several configurations (``DatabaseModule.for_root(url)`` per
+tenant shard, say) provides the same tokens once per configuration. The first
+configuration keeps the plain tokens; each later one binds the tokens it
+shares with an earlier configuration under a ``ScopedToken``.
+
+Consumers then get their dependencies the way encapsulation lets them see
+them: the module's own providers first, then the exports of its imports, then
+global modules. When that lands on a scoped binding, the consumer is bound
+with its constructor keys spelled out (``ProviderDescriptor.dependencies``).
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from nest.common.provider import ProviderDescriptor
+from nest.core.encapsulation import _re_exported_modules
+from nest.core.injector_module import _to_key
+from nest.core.resolution_plan import constructor_bindings
+
+if TYPE_CHECKING:
+    from nest.core.pynest_container import ModuleRef
+
+
+class ScopedToken:
+    """Binding key of a provider token within one module configuration."""
+
+    __slots__ = ("module_token", "token")
+
+    def __init__(self, module_token: str, token: Any) -> None:
+        self.module_token = module_token
+        self.token = token
+
+    def __repr__(self) -> str:
+        return f"ScopedToken({self.module_token!r}, {self.token!r})"
+
+    def __hash__(self) -> int:
+        return hash((self.module_token, self.token))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ScopedToken)
+            and self.module_token == other.module_token
+            and self.token == other.token
+        )
+
+
+def scoped_bindings(modules: Dict[str, "ModuleRef"]) -> Dict[str, Dict[Any, ScopedToken]]:
+    """
+    Per module token, the provider tokens it binds under a ScopedToken.
+
+    Modules are visited in registration order, so the result for a module
+    only depends on the modules registered before it.
+    """
+    provided: Dict[type, Set[Any]] = {}
+    bindings: Dict[str, Dict[Any, ScopedToken]] = {}
+    for mref in modules.values():
+        keys = {_to_key(desc.provide) for desc in mref.compiled.provider_descriptors}
+        earlier = provided.setdefault(mref.metatype, set())
+        shared = keys & earlier
+        if shared:
+            bindings[mref.token] = {key: ScopedToken(mref.token, key) for key in shared}
+        earlier |= keys
+    return bindings
+
+
+def scope_descriptors(
+    pairs: Iterable[Tuple["ModuleRef", ProviderDescriptor]],
+    modules: Dict[str, "ModuleRef"],
+    bindings: Dict[str, Dict[Any, ScopedToken]],
+) -> List[ProviderDescriptor]:
+    """Rewrite each (module, descriptor) pair to the keys seen from its module."""
+    if not bindings:
+        return [desc for _, desc in pairs]
+    visibility = _Visibility(modules, bindings)
+    return [visibility.scope(mref, desc) for mref, desc in pairs]
+
+
+class _Visibility:
+    """Finds which configuration's binding a module sees for a token."""
+
+    def __init__(
+        self,
+        modules: Dict[str, "ModuleRef"],
+        bindings: Dict[str, Dict[Any, ScopedToken]],
+    ) -> None:
+        self._modules = modules
+        self._bindings = bindings
+        self._scoped = {key for keys in bindings.values() for key in keys}
+        self._metatype_to_ref = {mref.metatype: mref for mref in modules.values()}
+        self._own = {
+            token: {_to_key(desc.provide) for desc in mref.compiled.provider_descriptors}
+            for token, mref in modules.items()
+        }
+        self._globals = [mref for mref in modules.values() if mref.compiled.is_global]
+
+    def scope(self, mref: "ModuleRef", desc: ProviderDescriptor) -> ProviderDescriptor:
+        changes: Dict[str, Any] = {}
+        provide = self._bindings.get(mref.token, {}).get(_to_key(desc.provide))
+        if provide is not None:
+            changes["provide"] = provide
+        if desc.use_class is not None:
+            keys = constructor_bindings(desc)
+            seen = {name: self.binding(mref, key) for name, key in keys.items()}
+            if seen != keys:
+                changes["dependencies"] = seen
+        elif desc.use_factory is not None:
+            keys = [_to_key(token) for token in desc.inject]
+            seen_keys = [self.binding(mref, key) for key in keys]
+            if seen_keys != keys:
+                changes["inject"] = seen_keys
+        elif desc.use_existing is not None:
+            key = _to_key(desc.use_existing)
+            seen_key = self.binding(mref, key)
+            if seen_key != key:
+                changes["use_existing"] = seen_key
+        return dataclasses.replace(desc, **changes) if changes else desc
+
+    def binding(self, mref: "ModuleRef", key: Any) -> Any:
+        """The key ``mref`` resolves ``key`` under."""
+        if key not in self._scoped:
+            return key
+        owner = self._owner(mref, key)
+        if owner is None:
+            return key
+        return self._bindings.get(owner.token, {}).get(key, key)
+
+    def _owner(self, mref: "ModuleRef", key: Any) -> Optional["ModuleRef"]:
+        if key in self._own[mref.token]:
+            return mref
+        for child_token in mref.compiled.import_tokens:
+            child = self._modules.get(child_token)
+            if child is not None:
+                owner = self._exporter(child, key, set())
+                if owner is not None:
+                    return owner
+        for global_ref in self._globals:
+            if key in self._own[global_ref.token]:
+                return global_ref
+        return None
+
+    def _exporter(self, mref: "ModuleRef", key: Any, seen: Set[str]) -> Optional["ModuleRef"]:
+        if mref.token in seen:
+            return None
+        seen.add(mref.token)
+        if key in self._own[mref.token] and key in mref.compiled.exports:
+            return mref
+        for child in _re_exported_modules(mref, self._modules, self._metatype_to_ref):
+            owner = self._exporter(child, key, seen)
+            if owner is not None:
+                return owner
+        return None
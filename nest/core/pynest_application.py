@@ -4,27 +4,103 @@ import asyncio
 import inspect
 import signal as signal_module
 from contextlib import asynccontextmanager
+from enum import Enum
 from typing import Any, Iterable, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
-from nest.common.route_resolver import RoutesResolver
+from nest.common.route_resolver import ExceptionFilterMode, RoutesResolver
+from nest.common.tracing import PhaseTracer
+from nest.core.draining import InFlightMiddleware, InFlightTracker
+from nest.core.metrics import RouteMetrics
 from nest.core.pynest_container import PyNestContainer
+from nest.core.request_scope import RequestScopeMiddleware
+
+
+class BootstrapMode(str, Enum):
+    """When ``PyNestFactory.create`` builds and bootstraps the container.
+
+    ``IMMEDIATE`` builds the injector, runs the lifecycle hooks and registers
+    the routes before ``create`` returns. ``LIFESPAN`` only compiles the
+    module metadata; the injector build, eager singletons, lifecycle hooks
+    and route registration run in the ASGI lifespan startup, on the serving
+    event loop.
+    """
+
+    IMMEDIATE = "immediate"
+    LIFESPAN = "lifespan"
+
+
+class StartupMiddleware:
+    """
+    ASGI middleware that starts the application before the first request or
+    WebSocket connection when the server did not run the lifespan startup.
+    """
+
+    def __init__(self, app, application: "PyNestApp") -> None:
+        self.app = app
+        self.application = application
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not self.application._started and scope["type"] in ("http", "websocket"):
+            await self.application._ensure_started()
+        await self.app(scope, receive, send)
 
 
 class PyNestApp:
     """
-    Main PyNest application. Wraps a built container and a FastAPI HTTP server.
+    Main PyNest application. Wraps a container and a FastAPI HTTP server.
+
+    When the container is not bootstrapped yet, building it, bootstrapping it
+    and registering the routes wait for the ASGI lifespan startup, or for the
+    first request or WebSocket connection if the server runs without one.
     """
 
-    def __init__(self, container: PyNestContainer, http_server: FastAPI) -> None:
+    def __init__(
+        self,
+        container: PyNestContainer,
+        http_server: FastAPI,
+        exception_filter_mode: ExceptionFilterMode = ExceptionFilterMode.ENDPOINT,
+        graph_cache: Optional[str] = None,
+        metrics: Optional[RouteMetrics] = None,
+        tracer: Optional[PhaseTracer] = None,
+    ) -> None:
         self.container = container
         self.http_server = http_server
         self._closed = False
         self._closing = False
+        self._exception_filter_mode = exception_filter_mode
+        self._graph_cache = graph_cache
+        self.metrics = metrics
+        self.tracer = tracer
+        self.drain_timeout: Optional[float] = 30.0
+        self.in_flight = InFlightTracker()
+        self._started = container.lifecycle_initialized
+        self._startup_lock: Optional[asyncio.Lock] = None
         self._install_lifespan_shutdown()
-        routes_resolver = RoutesResolver(self.container, self.http_server)
+        if not self._started:
+            self.http_server.add_middleware(StartupMiddleware, application=self)
+        self.http_server.add_middleware(InFlightMiddleware, tracker=self.in_flight)
+        # Middleware cannot be added once serving starts, so an unbuilt
+        # container gets the request scope whether it needs it or not.
+        if not self.container.is_built or self.container.has_request_scoped_providers:
+            self.http_server.add_middleware(RequestScopeMiddleware)
+        if metrics is not None:
+            self.http_server.add_api_route(
+                metrics.path, metrics.endpoint, methods=["GET"], include_in_schema=False
+            )
+        if self.container.is_built:
+            self._register_routes()
+
+    def _register_routes(self) -> None:
+        routes_resolver = RoutesResolver(
+            self.container,
+            self.http_server,
+            self._exception_filter_mode,
+            self.metrics,
+            self.tracer,
+        )
         routes_resolver.register_routes()
 
     def get_server(self) -> FastAPI:
@@ -40,9 +116,17 @@ class PyNestApp:
         return self
 
     def enable_shutdown_hooks(
-        self, signals: Optional[Iterable[signal_module.Signals]] = None
+        self,
+        signals: Optional[Iterable[signal_module.Signals]] = None,
+        drain_timeout: Optional[float] = 30.0,
     ) -> "PyNestApp":
-        """Register process signal handlers that trigger graceful shutdown."""
+        """
+        Register process signal handlers that trigger graceful shutdown.
+
+        Shutdown first drains the application (see ``drain``) for at most
+        ``drain_timeout`` seconds, then runs the shutdown lifecycle hooks.
+        """
+        self.drain_timeout = drain_timeout
         shutdown_signals = tuple(
             signals or (signal_module.SIGTERM, signal_module.SIGINT)
         )
@@ -52,13 +136,24 @@ class PyNestApp:
             )
         return self
 
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting new work and wait for in-flight work to finish.
+
+        New HTTP requests are answered with 503 and new WebSocket handshakes
+        are rejected. Returns once no request or WebSocket connection is in
+        flight, or False once ``timeout`` seconds have passed.
+        """
+        return await self.in_flight.drain(timeout)
+
     async def close(self, signal: Optional[str] = None) -> None:
-        """Run graceful application shutdown lifecycle hooks once."""
+        """Drain in-flight work, then run graceful shutdown lifecycle hooks once."""
         if self._closed or self._closing:
             return
 
         self._closing = True
         try:
+            await self.drain(self.drain_timeout)
             await self.container.shutdown_lifecycle(signal)
             self._closed = True
         finally:
@@ -127,15 +222,43 @@ class PyNestApp:
         except ValueError:
             return str(signum)
 
+    async def _startup(self) -> None:
+        if self.container.is_built:
+            await self.container.bootstrap()
+        else:
+            self.container.build(graph_cache=self._graph_cache)
+            await self.container.bootstrap()
+            self._register_routes()
+        self._started = True
+
+    async def _ensure_started(self) -> None:
+        # The lock is created on the serving loop, which only exists by now.
+        if self._startup_lock is None:
+            self._startup_lock = asyncio.Lock()
+        async with self._startup_lock:
+            if not self._started:
+                await self._startup()
+
     def _install_lifespan_shutdown(self) -> None:
+        """
+        Wrap the server lifespan: build and bootstrap the container on startup
+        if that has not happened yet, and close the application on shutdown.
+        """
         original_lifespan_context = self.http_server.router.lifespan_context
 
         @asynccontextmanager
         async def lifespan_context(app: FastAPI):
+            await self._startup()
+            if self.metrics is not None:
+                self.metrics.start()
             async with original_lifespan_context(app) as state:
                 try:
                     yield state
                 finally:
                     await self.close()
+                    if self.metrics is not None:
+                        self.metrics.stop()
+                    if self.tracer is not None:
+                        self.tracer.shutdown()
 
         self.http_server.router.lifespan_context = lifespan_context
@@ -1,22 +1,62 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
 import inspect
 import logging
-from typing import Any, Dict, List, Optional, Type, Union
-
-from nest.common.exceptions import CircularDependencyException
-from nest.common.interfaces import (
-    BeforeApplicationShutdown,
-    OnApplicationBootstrap,
-    OnApplicationShutdown,
-    OnModuleDestroy,
-    OnModuleInit,
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Type, Union
+
+from injector import InstanceProvider
+
+from nest.common.exceptions import (
+    CircularDependencyException,
+    LifecycleHookTimeoutException,
+)
+from nest.common.module import (
+    CompiledModule,
+    DynamicModule,
+    ModuleCompiler,
+    ModuleTokenFactory,
+)
+from nest.common.provider import (
+    InjectionToken,
+    ProviderDescriptor,
+    Scope,
+    normalize_provider,
 )
-from nest.common.module import CompiledModule, ModuleCompiler, ModuleTokenFactory
-from nest.common.provider import InjectionToken, ProviderDescriptor
-from nest.core.dependency_graph import DependencyGraph
+from nest.core.dependency_graph import DependencyGraph, format_cycles
 from nest.core.encapsulation import validate_module_encapsulation
-from nest.core.injector_module import build_injector, _to_key
+from nest.core.graph_cache import GraphCache, source_fingerprint
+from nest.core.async_utils import event_loop_running, run_sync
+from nest.core.injector_module import (
+    LazyProvider,
+    _to_key,
+    bind_providers,
+    build_injector,
+)
+from nest.core.lazy_module_loader import LazyModuleLoader
+from nest.core.module_scope import ScopedToken, scope_descriptors, scoped_bindings
+from nest.core.resolution_plan import (
+    Resolver,
+    build_provider_graph,
+    compile_resolvers,
+    provider_dependencies,
+)
+from nest.core.startup_report import (
+    HookTiming,
+    LifecycleReport,
+    ProviderTiming,
+    StartupReport,
+)
+
+_SHUTDOWN_HOOK_NAMES = (
+    "before_application_shutdown",
+    "on_module_destroy",
+    "on_application_shutdown",
+)
 
 _LIFECYCLE_METHOD_NAMES = (
     "on_module_init",
@@ -26,6 +66,13 @@ _LIFECYCLE_METHOD_NAMES = (
     "on_application_shutdown",
 )
 
+_NOT_STARTED = (
+    "Application not started: its providers are created when the server "
+    "starts because PyNestFactory.create was called inside a running event "
+    "loop. Serve the application first, or create it with "
+    "`await PyNestFactory.create_async(...)`."
+)
+
 
 class ModuleRef:
     """Internal container representation of a registered module."""
@@ -52,9 +99,31 @@ class PyNestContainer:
         self._modules: Dict[str, ModuleRef] = {}
         self._all_descriptors: List[ProviderDescriptor] = []
         self._controller_classes: List[Type] = []
+        # Per module token, the provider tokens bound under a ScopedToken
+        # because an earlier configuration of the same module provides them.
+        self._scoped_bindings: Dict[str, Dict[Any, ScopedToken]] = {}
         self._module_instances: Dict[str, Any] = {}
+        self._enhancer_instances: Dict[Type, Any] = {}
+        self._request_scoped: Set[Any] = set()
+        self._resolvers: Dict[Any, Resolver] = {}
+        self._bound_descriptors: List[ProviderDescriptor] = []
+        self._provider_graph: Optional[DependencyGraph] = None
+        self._startup_report: Optional[StartupReport] = None
+        self._deferred: Dict[Any, ProviderDescriptor] = {}
+        self._lazy_modules: Dict[Type, List[Any]] = {}
+        self._lazy_lock = threading.RLock()
         self._lifecycle_initialized = False
         self._lifecycle_shutdown = False
+        self._lifecycle_report = LifecycleReport()
+        self._lifecycle_candidates: Dict[str, List[Any]] = {}
+        self._lifecycle_instances: Dict[str, List[Any]] = {}
+        self._lifecycle_hooks: Dict[str, Dict[str, List[Any]]] = {}
+        self._all_lifecycle_hooks: Optional[Dict[str, List[Any]]] = None
+        self.lifecycle_hook_timeout: Optional[float] = None
+        self.eager_singletons = False
+        # Set when the bootstrap was left to the server; resolving a provider
+        # before ``bootstrap`` then raises instead of skipping hooks.
+        self.awaiting_startup = False
         self._module_token_factory = ModuleTokenFactory()
         self._module_compiler = ModuleCompiler(self._module_token_factory)
 
@@ -64,6 +133,16 @@ class PyNestContainer:
     def modules(self) -> Dict[str, ModuleRef]:
         return self._modules
 
+    @property
+    def startup_report(self) -> Optional[StartupReport]:
+        """Timings of the last ``instantiate_singletons`` run, if any."""
+        return self._startup_report
+
+    @property
+    def lifecycle_report(self) -> LifecycleReport:
+        """Per-phase and per-hook timings of the lifecycle hooks run so far."""
+        return self._lifecycle_report
+
     @property
     def module_token_factory(self):
         return self._module_token_factory
@@ -72,17 +151,26 @@ class PyNestContainer:
     def module_compiler(self):
         return self._module_compiler
 
-    def add_module(self, module_class: Type) -> dict:
-        """Compile and register a module and all its imports recursively."""
+    def add_module(self, module_class: Union[Type, DynamicModule]) -> dict:
+        """
+        Compile and register a module and all its imports recursively.
+
+        Dynamic modules are registered once per distinct configuration: an
+        equal DynamicModule returns the module registered first.
+        """
         compiled = self._module_compiler.compile(module_class)
         token = compiled.token
+        module_class = compiled.metatype
 
         if token in self._modules:
             return {"module_ref": self._modules[token], "inserted": False}
 
-        # Register imported modules first (depth-first)
+        # Register imported modules first (depth-first); lazy ones wait for first use
         for imported in compiled.imports:
-            self.add_module(imported)
+            if getattr(imported, "__is_lazy__", False):
+                self._register_lazy_module(imported)
+            else:
+                self.add_module(imported)
 
         module_ref = ModuleRef(token=token, metatype=module_class, compiled=compiled)
         self._modules[token] = module_ref
@@ -92,17 +180,49 @@ class PyNestContainer:
         self._logger.info(f"Module registered: {module_class.__name__}")
         return {"module_ref": module_ref, "inserted": True}
 
-    def build(self) -> None:
+    def build(self, graph_cache: Optional[str] = None) -> None:
         """
         Validate the dependency graph and build the injector.
         Must be called once after all add_module() calls, before any get() calls.
-        """
-        self._validate_dependency_graph()
-        validate_module_encapsulation(self._modules)
 
+        With ``graph_cache`` (a file path), the validated provider graph is
+        stored there, keyed by a fingerprint of the module and provider source
+        files. Later builds with unchanged source load it and skip validation.
+        """
         # Controller classes need singleton bindings too so the injector can resolve them
-        all_descriptors = self._all_descriptors + self._make_controller_descriptors()
-        self._injector = build_injector(all_descriptors)
+        self._scoped_bindings = scoped_bindings(self._modules)
+        all_descriptors = self._scope_descriptors(list(self._modules.values()))
+
+        cache = fingerprint = graph = None
+        if graph_cache is not None:
+            cache = GraphCache(graph_cache)
+            fingerprint = source_fingerprint(
+                self._fingerprint_objects(all_descriptors), extra=self._modules
+            )
+            graph = cache.load(fingerprint, self._graph_keys(all_descriptors))
+        if graph is None:
+            self._validate_dependency_graph()
+            validate_module_encapsulation(self._modules)
+            graph = build_provider_graph(all_descriptors)
+            if cache is not None:
+                cache.save(fingerprint, graph)
+        else:
+            self._logger.info(f"Loaded validated provider graph from {graph_cache}")
+        self._provider_graph = graph
+
+        all_descriptors = self._apply_request_scope(all_descriptors)
+        self._deferred = self._find_async_factories(all_descriptors)
+        self._injector = build_injector(all_descriptors, self._deferred)
+        self._injector.binder.bind(
+            LazyModuleLoader, to=InstanceProvider(LazyModuleLoader(self))
+        )
+        for module_class, tokens in self._lazy_modules.items():
+            self._bind_lazy_tokens(module_class, tokens)
+        self._bound_descriptors = all_descriptors
+        self._resolvers = compile_resolvers(
+            self._injector, all_descriptors, self._provider_graph
+        )
+        self._index_lifecycle_providers(list(self._modules.values()))
         self._logger.info("Container built successfully")
 
     def get(self, token: Union[Type, InjectionToken, str]) -> Any:
@@ -111,24 +231,261 @@ class PyNestContainer:
             raise RuntimeError(
                 "Container not built. Call container.build() before resolving providers."
             )
-        return self._injector.get(_to_key(token))
+        if self.awaiting_startup:
+            raise RuntimeError(_NOT_STARTED)
+        key = _to_key(token)
+        resolver = self._resolvers.get(key)
+        if resolver is not None:
+            return resolver()
+        return self._injector.get(key)
+
+    def get_resolver(self, token: Union[Type, InjectionToken, str]) -> Resolver:
+        """
+        Return the compiled zero-argument resolver for ``token``.
+
+        Hot paths that resolve the same token repeatedly (per request, per
+        guard call) can hold on to it instead of calling ``get`` each time.
+        Resolvers handed out before the lifecycle hooks have run also check
+        ``awaiting_startup``.
+        """
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before resolving providers."
+            )
+        key = _to_key(token)
+        resolver = self._resolvers.get(key)
+        if resolver is None:
+            resolver = functools.partial(self._injector_get, key)
+        if self._lifecycle_initialized:
+            return resolver
+
+        def resolve_after_startup():
+            if self.awaiting_startup:
+                raise RuntimeError(_NOT_STARTED)
+            return resolver()
+
+        return resolve_after_startup
+
+    def _injector_get(self, key: Any) -> Any:
+        return self._injector.get(key)
+
+    @property
+    def is_built(self) -> bool:
+        """Whether ``build`` has run."""
+        return self._injector is not None
+
+    @property
+    def lifecycle_initialized(self) -> bool:
+        """Whether ``initialize_lifecycle`` has completed."""
+        return self._lifecycle_initialized
+
+    @property
+    def has_request_scoped_providers(self) -> bool:
+        return bool(self._request_scoped)
+
+    def is_request_scoped(self, token: Union[Type, InjectionToken, str]) -> bool:
+        """Whether ``token`` resolves once per request, directly or via its dependencies."""
+        return _to_key(token) in self._request_scoped
 
     def get_controller_instance(self, controller_class: Type) -> Any:
         """Get a controller instance with all its service dependencies injected."""
         return self.get(controller_class)
 
+    def get_enhancer_factory(self, enhancer: Any) -> Callable[[], Any]:
+        """
+        Return a zero-argument callable producing the instance for a guard or filter.
+
+        Enhancer classes get their constructor dependencies from the injector.
+        They are created on the first call and reused unless marked
+        ``@Injectable(scope=Scope.TRANSIENT)``, in which case every call builds a
+        fresh instance. Routes are registered before the bootstrap in some
+        modes, so nothing is constructed here. Classes registered as providers
+        resolve through their binding, and pre-built instances are returned
+        as-is.
+        """
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before resolving enhancers."
+            )
+        if not inspect.isclass(enhancer):
+            return lambda: enhancer
+        if self._injector.binder.has_explicit_binding_for(enhancer):
+            return self.get_resolver(enhancer)
+
+        scope = getattr(enhancer, "__injectable_scope__", Scope.SINGLETON)
+        if scope != Scope.SINGLETON or any(
+            dep in self._request_scoped
+            for dep in provider_dependencies(normalize_provider(enhancer))
+        ):
+            return functools.partial(self._create_enhancer, enhancer)
+
+        instances = self._enhancer_instances
+
+        def resolve_enhancer() -> Any:
+            instance = instances.get(enhancer)
+            if instance is None:
+                instance = instances[enhancer] = self._create_enhancer(enhancer)
+            return instance
+
+        return resolve_enhancer
+
+    def _create_enhancer(self, enhancer: Type) -> Any:
+        if self.awaiting_startup:
+            raise RuntimeError(_NOT_STARTED)
+        return self._injector.create_object(enhancer)
+
+    async def resolve_async_providers(self) -> List[ProviderTiming]:
+        """
+        Await ``async def`` factory providers and bind their results as singletons.
+
+        Factories are started level by level in dependency order, so independent
+        ones (say, several connection pools warming up) run concurrently.
+        ``initialize_lifecycle`` calls this before any hook runs; until then,
+        resolving such a provider raises a RuntimeError.
+        """
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before resolving providers."
+            )
+        return await self._create_level_by_level(set(self._deferred))
+
+    async def instantiate_singletons(self) -> StartupReport:
+        """
+        Eagerly create every singleton instead of waiting for its first ``get``.
+
+        Providers are created level by level in dependency order; the providers
+        of one level are independent of each other and are started together,
+        so async factories of the same level overlap.
+        Returns (and logs) a report with the time spent on each provider.
+        """
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before resolving providers."
+            )
+        if self._startup_report is not None:
+            return self._startup_report
+
+        singletons = {
+            _to_key(desc.provide)
+            for desc in self._bound_descriptors
+            if desc.scope == Scope.SINGLETON
+            and (desc.use_class is not None or desc.use_factory is not None)
+        }
+        report = StartupReport()
+        started = time.perf_counter()
+        report.timings = await self._create_level_by_level(
+            singletons | set(self._deferred)
+        )
+        report.total_seconds = time.perf_counter() - started
+
+        self._startup_report = report
+        self._logger.info(report.format())
+        return report
+
+    def preload_singletons(self) -> List[Any]:
+        """
+        Synchronously create the singletons that do not wait for the async bootstrap.
+
+        Async factories and every provider depending on one are left for
+        ``initialize_lifecycle``. Used before forking workers, so that they
+        share these instances copy-on-write. Returns the created tokens.
+        """
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before resolving providers."
+            )
+        blocked = self._provider_graph.dependents_of(self._deferred)
+        singletons = {
+            _to_key(desc.provide)
+            for desc in self._bound_descriptors
+            if desc.scope == Scope.SINGLETON
+            and (desc.use_class is not None or desc.use_factory is not None)
+        }
+        created = []
+        for key in self._provider_graph.topological_sort():
+            if key in singletons and key not in blocked:
+                self.get(key)
+                created.append(key)
+        return created
+
+    def load_lazy_module(self, module_class: Type) -> ModuleRef:
+        """
+        Load a ``@Module(lazy=True)`` module and its imports into the built container.
+
+        Called automatically the first time one of the module's providers is
+        resolved. The module is compiled, validated and bound, its async
+        factories are awaited and, once the application has bootstrapped, its
+        ``on_module_init`` and ``on_application_bootstrap`` hooks run.
+
+        Inside a running event loop, initialization must run on that loop, so
+        the module has to be loaded beforehand with ``load_lazy_module_async``
+        or ``LazyModuleLoader.load``; loading it here raises RuntimeError.
+        """
+        if self._find_module_ref(module_class) is None and event_loop_running():
+            raise RuntimeError(
+                f"Lazy module {module_class.__name__} cannot be loaded "
+                "synchronously while an event loop is running. Load it first "
+                "with `await container.load_lazy_module_async(...)` or "
+                "`await LazyModuleLoader.load(...)`."
+            )
+        module_refs = self._register_lazy_load(module_class)
+        if module_refs:
+            run_sync(self._initialize_loaded_modules(module_refs))
+        return self._find_module_ref(module_class)
+
+    async def load_lazy_module_async(self, module_class: Type) -> ModuleRef:
+        """Like ``load_lazy_module``, but awaits initialization on the running loop."""
+        module_refs = self._register_lazy_load(module_class)
+        if module_refs:
+            await self._initialize_loaded_modules(module_refs)
+        return self._find_module_ref(module_class)
+
     def clear(self) -> None:
         """Reset container state. Useful in tests."""
         self._injector = None
         self._modules.clear()
         self._all_descriptors.clear()
         self._controller_classes.clear()
+        self._scoped_bindings = {}
         self._module_instances.clear()
+        self._enhancer_instances.clear()
+        self._request_scoped.clear()
+        self._resolvers.clear()
+        self._bound_descriptors = []
+        self._provider_graph = None
+        self._startup_report = None
+        self._deferred = {}
+        self._lazy_modules.clear()
         self._lifecycle_initialized = False
         self._lifecycle_shutdown = False
+        self._lifecycle_report = LifecycleReport()
+        self._lifecycle_candidates.clear()
+        self._lifecycle_instances.clear()
+        self._lifecycle_hooks.clear()
+        self._all_lifecycle_hooks = None
+
+    async def bootstrap(self) -> None:
+        """
+        Load the lazy modules that loaded providers inject, instantiate every
+        singleton when ``eager_singletons`` is set, then run
+        ``initialize_lifecycle``. Safe to call more than once.
+        """
+        self.awaiting_startup = False
+        await self._load_injected_lazy_modules()
+        if self.eager_singletons:
+            await self.instantiate_singletons()
+        await self.initialize_lifecycle()
 
     async def initialize_lifecycle(self) -> None:
-        """Run module init and application bootstrap hooks once."""
+        """
+        Run module init and application bootstrap hooks once.
+
+        ``on_module_init`` follows the module import graph: a module's hooks
+        run after those of the modules it imports, and unrelated modules run
+        concurrently. Async hooks exceeding ``lifecycle_hook_timeout`` seconds
+        raise LifecycleHookTimeoutException. Timings are recorded in
+        ``lifecycle_report``.
+        """
         if self._injector is None:
             raise RuntimeError(
                 "Container not built. Call container.build() before lifecycle hooks."
@@ -136,22 +493,32 @@ class PyNestContainer:
         if self._lifecycle_initialized:
             return
 
-        for module_ref in self._modules.values():
-            await self._call_hooks(
-                self._get_module_lifecycle_instances(module_ref),
-                OnModuleInit,
-                "on_module_init",
-            )
+        await self.resolve_async_providers()
 
+        modules = list(self._modules.values())
+        await self._run_module_phase(modules, "on_module_init")
+
+        started = time.perf_counter()
         await self._call_hooks(
-            self._get_all_lifecycle_instances(),
-            OnApplicationBootstrap,
+            self._get_all_lifecycle_hooks().get("on_application_bootstrap", []),
             "on_application_bootstrap",
         )
+        self._lifecycle_report.phases["on_application_bootstrap"] = (
+            time.perf_counter() - started
+        )
         self._lifecycle_initialized = True
+        self._logger.info(self._lifecycle_report.format())
 
     async def shutdown_lifecycle(self, signal: Optional[str] = None) -> None:
-        """Run application shutdown hooks once in graceful shutdown order."""
+        """
+        Run application shutdown hooks once in graceful shutdown order.
+
+        Each phase finishes before the next starts. Within a phase, a module's
+        hooks run after those of the modules importing it, and unrelated
+        modules run concurrently. Async hooks exceeding
+        ``lifecycle_hook_timeout`` seconds are logged and abandoned so shutdown
+        can complete.
+        """
         if self._injector is None:
             raise RuntimeError(
                 "Container not built. Call container.build() before lifecycle hooks."
@@ -160,40 +527,253 @@ class PyNestContainer:
             return
 
         modules = list(self._modules.values())
-        for module_ref in reversed(modules):
-            await self._call_hooks(
-                self._get_module_lifecycle_instances(module_ref),
-                BeforeApplicationShutdown,
-                "before_application_shutdown",
-                signal,
+        await self._run_module_phase(
+            modules, "before_application_shutdown", signal, reverse=True
+        )
+        await self._run_module_phase(modules, "on_module_destroy", reverse=True)
+        await self._run_module_phase(
+            modules, "on_application_shutdown", signal, reverse=True
+        )
+
+        self._lifecycle_shutdown = True
+        self._logger.info(self._lifecycle_report.format())
+
+    # ── Internal ───────────────────────────────────────────────────────────────
+
+    def _register_lazy_module(self, module_class: Type) -> None:
+        if module_class in self._lazy_modules or self._find_module_ref(module_class):
+            return
+        tokens = [
+            _to_key(normalize_provider(p).provide)
+            for p in getattr(module_class, "providers", []) or []
+        ]
+        self._lazy_modules[module_class] = tokens
+        if self._injector is not None:
+            self._bind_lazy_tokens(module_class, tokens)
+
+    def _bind_lazy_tokens(self, module_class: Type, tokens: List[Any]) -> None:
+        def load() -> None:
+            self.load_lazy_module(module_class)
+
+        for token in tokens:
+            if not self._injector.binder.has_explicit_binding_for(token):
+                self._injector.binder.bind(token, to=LazyProvider(token, load))
+
+    def _register_lazy_load(self, module_class: Type) -> List[ModuleRef]:
+        """Compile, validate and bind a lazy module; return the newly added modules."""
+        if self._injector is None:
+            raise RuntimeError(
+                "Container not built. Call container.build() before loading modules."
             )
+        with self._lazy_lock:
+            if self._find_module_ref(module_class) is not None:
+                return []
+            self._lazy_modules.pop(module_class, None)
+
+            started = time.perf_counter()
+            known = set(self._modules)
+            descriptor_count = len(self._all_descriptors)
+            controller_count = len(self._controller_classes)
+            self.add_module(module_class)
+            module_refs = [ref for token, ref in self._modules.items() if token not in known]
+            try:
+                for module_ref in module_refs:
+                    if module_ref.compiled.controllers:
+                        raise ValueError(
+                            f"Lazy module {module_class.__name__} cannot register "
+                            f"controllers (found in {module_ref.name})"
+                        )
+                self._validate_dependency_graph()
+                validate_module_encapsulation(self._modules)
+            except Exception:
+                for module_ref in module_refs:
+                    del self._modules[module_ref.token]
+                del self._all_descriptors[descriptor_count:]
+                del self._controller_classes[controller_count:]
+                self._lazy_modules[module_class] = []
+                raise
 
-        for module_ref in reversed(modules):
-            await self._call_hooks(
-                self._get_module_lifecycle_instances(module_ref),
-                OnModuleDestroy,
-                "on_module_destroy",
+            # Earlier modules keep their bindings: scoping only looks back.
+            self._scoped_bindings = scoped_bindings(self._modules)
+            new_descriptors = self._scope_descriptors(module_refs)
+            self._provider_graph = build_provider_graph(
+                new_descriptors, self._provider_graph
+            )
+            new_descriptors = self._apply_request_scope(new_descriptors)
+            deferred = self._find_async_factories(new_descriptors)
+            self._deferred.update(deferred)
+            bind_providers(self._injector, new_descriptors, deferred)
+            self._bound_descriptors.extend(new_descriptors)
+            compile_resolvers(
+                self._injector, new_descriptors, self._provider_graph, self._resolvers
             )
+            self._index_lifecycle_providers(module_refs)
+            self._logger.info(
+                f"Lazy module loaded: {module_class.__name__} "
+                f"({len(module_refs)} modules, "
+                f"{(time.perf_counter() - started) * 1000:.1f} ms)"
+            )
+            return module_refs
+
+    async def _load_injected_lazy_modules(self) -> None:
+        """
+        Load, on the running loop, every lazy module whose providers a loaded
+        provider or controller depends on: those consumers may be created by
+        the lifecycle hooks or inside a request, where a synchronous load is
+        not possible.
+        """
+        loaded = True
+        while loaded:
+            loaded = False
+            for module_class, tokens in list(self._lazy_modules.items()):
+                if self._provider_graph.dependents_of(tokens) - set(tokens):
+                    await self.load_lazy_module_async(module_class)
+                    loaded = True
+
+    async def _initialize_loaded_modules(self, module_refs: List[ModuleRef]) -> None:
+        await self.resolve_async_providers()
+        if not self._lifecycle_initialized:
+            return
+        await self._run_module_phase(module_refs, "on_module_init")
+        await self._run_module_phase(module_refs, "on_application_bootstrap")
 
-        for module_ref in reversed(modules):
-            await self._call_hooks(
-                self._get_module_lifecycle_instances(module_ref),
-                OnApplicationShutdown,
-                "on_application_shutdown",
-                signal,
+    def _find_module_ref(self, module_class: Type) -> Optional[ModuleRef]:
+        for module_ref in self._modules.values():
+            if module_ref.metatype is module_class:
+                return module_ref
+        return None
+
+    async def _create_level_by_level(self, keys: Set[Any]) -> List[ProviderTiming]:
+        timings: List[ProviderTiming] = []
+        if not keys:
+            return timings
+        for level, nodes in enumerate(self._provider_graph.levels()):
+            pending = [key for key in nodes if key in keys]
+            if pending:
+                timings.extend(
+                    await asyncio.gather(
+                        *(self._instantiate(key, level) for key in pending)
+                    )
+                )
+        return timings
+
+    async def _instantiate(self, key: Any, level: int) -> ProviderTiming:
+        started = time.perf_counter()
+        desc = self._deferred.pop(key, None)
+        if desc is None:
+            self.get(key)
+        elif desc.use_existing is not None:
+            self._bind_instance(key, self.get(desc.use_existing))
+        else:
+            instance = desc.use_factory(*[self.get(token) for token in desc.inject])
+            if inspect.isawaitable(instance):
+                instance = await instance
+            self._bind_instance(key, instance)
+        return ProviderTiming(token=key, level=level, seconds=time.perf_counter() - started)
+
+    def _bind_instance(self, key: Any, instance: Any) -> None:
+        self._injector.binder.bind(key, to=InstanceProvider(instance))
+        self._resolvers[key] = lambda: instance
+
+    def _fingerprint_objects(self, descriptors: List[ProviderDescriptor]) -> List[Any]:
+        objects: List[Any] = [ref.metatype for ref in self._modules.values()]
+        for desc in descriptors:
+            objects.extend(
+                value
+                for value in (desc.provide, desc.use_class, desc.use_factory, desc.use_existing)
+                if value is not None
             )
+        return objects
 
-        self._lifecycle_shutdown = True
+    @staticmethod
+    def _graph_keys(descriptors: List[ProviderDescriptor]) -> List[Any]:
+        keys: List[Any] = []
+        for desc in descriptors:
+            keys.append(_to_key(desc.provide))
+            if desc.use_class is not None:
+                keys.append(desc.use_class)
+        return keys
 
-    # ── Internal ───────────────────────────────────────────────────────────────
+    def _scope_descriptors(self, module_refs: List[ModuleRef]) -> List[ProviderDescriptor]:
+        """
+        The providers and controllers of ``module_refs`` to bind, each keyed as
+        seen from its module's configuration (see ``nest.core.module_scope``).
+        """
+        pairs = [
+            (module_ref, desc)
+            for module_ref in module_refs
+            for desc in module_ref.compiled.provider_descriptors
+        ]
+        pairs.extend(
+            (
+                module_ref,
+                ProviderDescriptor(
+                    provide=cls,
+                    use_class=cls,
+                    scope=getattr(cls, "__injectable_scope__", Scope.SINGLETON),
+                ),
+            )
+            for module_ref in module_refs
+            for cls in module_ref.compiled.controllers
+        )
+        return scope_descriptors(pairs, self._modules, self._scoped_bindings)
+
+    def _apply_request_scope(
+        self, descriptors: List[ProviderDescriptor]
+    ) -> List[ProviderDescriptor]:
+        """
+        Propagate Scope.REQUEST up the dependency chain.
 
-    def _make_controller_descriptors(self) -> List[ProviderDescriptor]:
-        from nest.common.provider import Scope
+        A singleton that (directly or through transient providers) depends on a
+        request-scoped provider would otherwise capture the first request's
+        instance, so it is bound per request as well.
+        """
+        affected = self._provider_graph.dependents_of(
+            _to_key(d.provide) for d in descriptors if d.scope == Scope.REQUEST
+        )
+
+        scoped: List[ProviderDescriptor] = []
+        request_scoped: Set[Any] = set()
+        for desc in descriptors:
+            key = _to_key(desc.provide)
+            if key in affected and desc.scope == Scope.SINGLETON:
+                self._logger.debug(
+                    f"{desc.provide!r} depends on a request-scoped provider; "
+                    "binding it per request"
+                )
+                desc = dataclasses.replace(desc, scope=Scope.REQUEST)
+            if desc.scope == Scope.REQUEST:
+                request_scoped.add(key)
+            scoped.append(desc)
 
-        return [
-            ProviderDescriptor(provide=cls, use_class=cls, scope=Scope.SINGLETON)
-            for cls in self._controller_classes
+        self._request_scoped |= request_scoped
+        return scoped
+
+    def _find_async_factories(
+        self, descriptors: List[ProviderDescriptor]
+    ) -> Dict[Any, ProviderDescriptor]:
+        """
+        Singleton factories that must wait for the async bootstrap: ``async def``
+        factories, plus factories and aliases that depend on one, directly or
+        through class providers.
+        """
+        roots = [
+            _to_key(d.provide)
+            for d in descriptors
+            if d.scope == Scope.SINGLETON
+            and d.use_factory is not None
+            and _is_async_callable(d.use_factory)
         ]
+        if not roots:
+            return {}
+        affected = self._provider_graph.dependents_of(roots)
+        return {
+            _to_key(d.provide): d
+            for d in descriptors
+            if d.scope == Scope.SINGLETON
+            and (d.use_factory is not None or d.use_existing is not None)
+            and _to_key(d.provide) in affected
+        }
 
     def _validate_dependency_graph(self) -> None:
         """Build a DAG from all class providers and raise CircularDependencyException on cycles."""
@@ -240,47 +820,89 @@ class PyNestContainer:
 
         cycles = graph.detect_cycles()
         if cycles:
-            chain = " → ".join(getattr(n, "__name__", repr(n)) for n in cycles[0])
-            raise CircularDependencyException(f"Circular dependency detected: {chain}")
+            raise CircularDependencyException(format_cycles(cycles))
 
-    def _get_all_lifecycle_instances(self) -> List[Any]:
-        instances: List[Any] = []
-        seen: set[int] = set()
-        for module_ref in self._modules.values():
-            for instance in self._get_module_lifecycle_instances(module_ref):
-                instance_id = id(instance)
-                if instance_id in seen:
+    def _index_lifecycle_providers(self, module_refs: List[ModuleRef]) -> None:
+        """
+        Record, per module, which providers can implement a lifecycle hook.
+
+        Class and value providers are checked by type, so providers without
+        hooks are never resolved for the lifecycle. Factories and aliases are
+        only known once resolved and stay candidates. Request-scoped
+        providers are skipped.
+        """
+        for module_ref in module_refs:
+            candidates: List[Any] = []
+            scoped = self._scoped_bindings.get(module_ref.token, {})
+            for desc in module_ref.compiled.provider_descriptors:
+                key = scoped.get(_to_key(desc.provide), desc.provide)
+                if self.is_request_scoped(key):
                     continue
-                seen.add(instance_id)
-                instances.append(instance)
-        return instances
+                if desc.use_class is not None and not _hook_methods(desc.use_class):
+                    continue
+                if desc.use_value is not None and not _hook_methods(type(desc.use_value)):
+                    continue
+                candidates.append(key)
+            self._lifecycle_candidates[module_ref.token] = candidates
+        self._all_lifecycle_hooks = None
+
+    def _get_all_lifecycle_hooks(self) -> Dict[str, List[Any]]:
+        """Instances per hook name across every module, each instance once."""
+        if self._all_lifecycle_hooks is None:
+            hooks: Dict[str, List[Any]] = {}
+            seen: Set[int] = set()
+            for module_ref in self._modules.values():
+                for instance in self._get_module_lifecycle_instances(module_ref):
+                    if id(instance) in seen:
+                        continue
+                    seen.add(id(instance))
+                    for method_name in _hook_methods(type(instance)):
+                        hooks.setdefault(method_name, []).append(instance)
+            self._all_lifecycle_hooks = hooks
+        return self._all_lifecycle_hooks
+
+    def _get_module_lifecycle_hooks(self, module_ref: ModuleRef) -> Dict[str, List[Any]]:
+        """The module's lifecycle instances grouped by the hooks they implement."""
+        hooks = self._lifecycle_hooks.get(module_ref.token)
+        if hooks is None:
+            hooks = {}
+            for instance in self._get_module_lifecycle_instances(module_ref):
+                for method_name in _hook_methods(type(instance)):
+                    hooks.setdefault(method_name, []).append(instance)
+            self._lifecycle_hooks[module_ref.token] = hooks
+        return hooks
 
     def _get_module_lifecycle_instances(self, module_ref: ModuleRef) -> List[Any]:
-        instances: List[Any] = []
-        seen: set[int] = set()
+        """Resolve the module's lifecycle instances once; later phases reuse them."""
+        instances = self._lifecycle_instances.get(module_ref.token)
+        if instances is not None:
+            return instances
+        instances = []
+        seen: Set[int] = set()
 
-        for desc in module_ref.compiled.provider_descriptors:
-            instance = self.get(desc.provide)
-            instance_id = id(instance)
-            if instance_id in seen:
+        candidates = self._lifecycle_candidates.get(module_ref.token)
+        if candidates is None:
+            self._index_lifecycle_providers([module_ref])
+            candidates = self._lifecycle_candidates[module_ref.token]
+        for token in candidates:
+            instance = self.get(token)
+            if id(instance) in seen or not _hook_methods(type(instance)):
                 continue
-            seen.add(instance_id)
+            seen.add(id(instance))
             instances.append(instance)
 
         module_instance = self._get_module_instance(module_ref)
         if module_instance is not None and id(module_instance) not in seen:
             instances.append(module_instance)
 
+        self._lifecycle_instances[module_ref.token] = instances
         return instances
 
     def _get_module_instance(self, module_ref: ModuleRef) -> Optional[Any]:
         if module_ref.token in self._module_instances:
             return self._module_instances[module_ref.token]
 
-        if not any(
-            callable(getattr(module_ref.metatype, name, None))
-            for name in _LIFECYCLE_METHOD_NAMES
-        ):
+        if not _hook_methods(module_ref.metatype):
             return None
 
         instance = self._instantiate_module(module_ref.metatype)
@@ -310,20 +932,119 @@ class PyNestContainer:
 
         return module_class(**kwargs)
 
+    async def _run_module_phase(
+        self,
+        module_refs: List[ModuleRef],
+        method_name: str,
+        *args: Any,
+        reverse: bool = False,
+    ) -> None:
+        """
+        Run one hook on every module, following the import graph.
+
+        A module's hooks start once the hooks of the modules it imports have
+        finished (or, with ``reverse``, once the modules importing it have), so
+        modules with no import relationship run concurrently.
+        """
+        started = time.perf_counter()
+        by_token = {ref.token: ref for ref in module_refs}
+        graph = DependencyGraph()
+        for module_ref in module_refs:
+            graph.add_node(module_ref.token)
+            for imported in module_ref.compiled.import_tokens:
+                if imported in by_token and imported != module_ref.token:
+                    graph.add_dependency(module_ref.token, imported)
+
+        order = graph.topological_sort()
+        if reverse:
+            order.reverse()
+            waits_for = {token: set() for token in order}
+            for token in order:
+                for imported in graph.dependencies_of(token):
+                    waits_for[imported].add(token)
+        else:
+            waits_for = {token: graph.dependencies_of(token) for token in order}
+
+        tasks: Dict[str, asyncio.Future] = {}
+        for token in order:
+            prerequisites = [tasks[t] for t in waits_for[token] if t in tasks]
+            tasks[token] = asyncio.ensure_future(
+                self._run_module_hooks(by_token[token], prerequisites, method_name, args)
+            )
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        self._lifecycle_report.phases[method_name] = time.perf_counter() - started
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _run_module_hooks(
+        self,
+        module_ref: ModuleRef,
+        prerequisites: List[asyncio.Future],
+        method_name: str,
+        args: tuple,
+    ) -> None:
+        if prerequisites:
+            await asyncio.gather(*prerequisites)
+        await self._call_hooks(
+            self._get_module_lifecycle_hooks(module_ref).get(method_name, []),
+            method_name,
+            *args,
+            module=module_ref.name,
+        )
+
     async def _call_hooks(
-        self, instances: List[Any], protocol: Type, method_name: str, *args: Any
+        self,
+        instances: List[Any],
+        method_name: str,
+        *args: Any,
+        module: Optional[str] = None,
     ) -> None:
-        calls = [
-            self._call_hook(instance, method_name, *args)
-            for instance in instances
-            if isinstance(instance, protocol)
-        ]
+        calls = [self._call_hook(instance, method_name, module, *args) for instance in instances]
         if calls:
-            import asyncio
-
             await asyncio.gather(*calls)
 
-    async def _call_hook(self, instance: Any, method_name: str, *args: Any) -> None:
-        result = getattr(instance, method_name)(*args)
-        if inspect.isawaitable(result):
-            await result
+    async def _call_hook(
+        self, instance: Any, method_name: str, module: Optional[str], *args: Any
+    ) -> None:
+        owner = type(instance).__name__
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            result = getattr(instance, method_name)(*args)
+            if inspect.isawaitable(result):
+                await asyncio.wait_for(result, self.lifecycle_hook_timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            message = (
+                f"{owner}.{method_name} did not finish within "
+                f"{self.lifecycle_hook_timeout}s"
+            )
+            if method_name not in _SHUTDOWN_HOOK_NAMES:
+                raise LifecycleHookTimeoutException(message) from None
+            self._logger.error(f"{message}; continuing shutdown")
+        finally:
+            self._lifecycle_report.timings.append(
+                HookTiming(
+                    hook=method_name,
+                    owner=owner,
+                    module=module,
+                    seconds=time.perf_counter() - started,
+                    timed_out=timed_out,
+                )
+            )
+
+
+@functools.lru_cache(maxsize=None)
+def _hook_methods(cls: type) -> FrozenSet[str]:
+    """Names of the lifecycle hooks ``cls`` implements."""
+    return frozenset(
+        name for name in _LIFECYCLE_METHOD_NAMES if callable(getattr(cls, name, None))
+    )
+
+
+def _is_async_callable(factory: Callable) -> bool:
+    return inspect.iscoroutinefunction(factory) or inspect.iscoroutinefunction(
+        getattr(factory, "__call__", None)
+    )
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import threading
 from abc import ABC, abstractmethod
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 
 from fastapi import FastAPI
 
-from nest.core.pynest_application import PyNestApp
+from nest.common.route_resolver import ExceptionFilterMode
+from nest.common.tracing import PhaseTracer
+from nest.core.async_utils import event_loop_running, run_sync
+from nest.core.metrics import RouteMetrics
+from nest.core.pynest_application import BootstrapMode, PyNestApp
 from nest.core.pynest_container import PyNestContainer
 
 ModuleType = TypeVar("ModuleType")
@@ -23,7 +26,18 @@ class PyNestFactory(AbstractPyNestFactory):
     """Factory that creates a fully-wired PyNest application from a root module."""
 
     @staticmethod
-    def create(main_module: Type[ModuleType], **kwargs) -> PyNestApp:
+    def create(
+        main_module: Type[ModuleType],
+        *,
+        exception_filter_mode: ExceptionFilterMode = ExceptionFilterMode.ENDPOINT,
+        eager_singletons: bool = False,
+        graph_cache: Optional[str] = None,
+        lifecycle_hook_timeout: Optional[float] = None,
+        bootstrap: BootstrapMode = BootstrapMode.IMMEDIATE,
+        metrics: Optional[RouteMetrics] = None,
+        tracer: Optional[PhaseTracer] = None,
+        **kwargs,
+    ) -> PyNestApp:
         """
         Build and return a PyNestApp.
 
@@ -32,14 +46,149 @@ class PyNestFactory(AbstractPyNestFactory):
         3. Validates the dependency graph and builds the injector
         4. Creates the FastAPI HTTP server
         5. Registers all routes via RoutesResolver
+
+        ``exception_filter_mode`` selects where route-scoped exception filters
+        run (see ``ExceptionFilterMode``). ``eager_singletons`` creates every
+        singleton before the lifecycle hooks run and records per-provider
+        timings in ``container.startup_report``. ``graph_cache`` is a file path
+        where the validated provider graph is cached between runs (see
+        ``PyNestContainer.build``). ``lifecycle_hook_timeout`` bounds each
+        async lifecycle hook, in seconds. ``bootstrap=BootstrapMode.LIFESPAN``
+        stops after step 2 and leaves the rest to the ASGI lifespan startup
+        (see ``BootstrapMode``). ``metrics`` records per-route request counts
+        and latencies and serves them on ``metrics.path`` (see
+        ``RouteMetrics``). ``tracer`` records spans for the guard, parameter,
+        handler and exception filter phases of sampled requests (see
+        ``PhaseTracer``). Remaining keyword arguments are passed to
+        ``FastAPI``.
+
+        Called while an event loop is running, ``create`` cannot wait for the
+        bootstrap without a helper thread and a throwaway loop, which would
+        leave pools and clients created by the hooks bound to a dead loop. It
+        leaves the bootstrap to the server instead, as ``build`` does: the
+        ASGI lifespan startup, or the first request or WebSocket connection
+        when the server runs without a lifespan. Resolving a provider before
+        then raises RuntimeError. Use ``await PyNestFactory.create_async(...)``
+        to bootstrap right away.
         """
-        container = PyNestContainer()
-        container.add_module(main_module)
-        container.build()
-        PyNestFactory._run_async(container.initialize_lifecycle())
+        if BootstrapMode(bootstrap) == BootstrapMode.LIFESPAN:
+            container = PyNestFactory._create_container(
+                main_module,
+                graph_cache,
+                lifecycle_hook_timeout,
+                eager_singletons,
+                build=False,
+            )
+            return PyNestApp(
+                container,
+                FastAPI(**kwargs),
+                exception_filter_mode,
+                graph_cache,
+                metrics=metrics,
+                tracer=tracer,
+            )
+
+        container = PyNestFactory._create_container(
+            main_module, graph_cache, lifecycle_hook_timeout, eager_singletons
+        )
+        if event_loop_running():
+            container._logger.warning(
+                "PyNestFactory.create was called inside a running event loop; "
+                "providers are created when the server starts. Use "
+                "`await PyNestFactory.create_async(...)` to bootstrap now."
+            )
+            container.awaiting_startup = True
+        else:
+            PyNestFactory._run_async(container.bootstrap())
 
         http_server = FastAPI(**kwargs)
-        return PyNestApp(container, http_server)
+        return PyNestApp(
+            container,
+            http_server,
+            exception_filter_mode,
+            metrics=metrics,
+            tracer=tracer,
+        )
+
+    @staticmethod
+    async def create_async(
+        main_module: Type[ModuleType],
+        *,
+        exception_filter_mode: ExceptionFilterMode = ExceptionFilterMode.ENDPOINT,
+        eager_singletons: bool = False,
+        graph_cache: Optional[str] = None,
+        lifecycle_hook_timeout: Optional[float] = None,
+        metrics: Optional[RouteMetrics] = None,
+        tracer: Optional[PhaseTracer] = None,
+        **kwargs,
+    ) -> PyNestApp:
+        """
+        Like ``create``, but bootstraps on the running event loop.
+
+        Async factories and lifecycle hooks run on the caller's loop, so the
+        resources they create stay usable when that loop serves the
+        application (an async ``main``, a test, a notebook).
+        """
+        container = PyNestFactory._create_container(
+            main_module, graph_cache, lifecycle_hook_timeout, eager_singletons
+        )
+        await container.bootstrap()
+
+        http_server = FastAPI(**kwargs)
+        return PyNestApp(
+            container,
+            http_server,
+            exception_filter_mode,
+            metrics=metrics,
+            tracer=tracer,
+        )
+
+    @staticmethod
+    def build(
+        main_module: Type[ModuleType],
+        *,
+        exception_filter_mode: ExceptionFilterMode = ExceptionFilterMode.ENDPOINT,
+        graph_cache: Optional[str] = None,
+        lifecycle_hook_timeout: Optional[float] = None,
+        metrics: Optional[RouteMetrics] = None,
+        tracer: Optional[PhaseTracer] = None,
+        **kwargs,
+    ) -> PyNestApp:
+        """
+        Build the container and register the routes without bootstrapping.
+
+        Async factory providers and lifecycle hooks are left for the ASGI
+        lifespan startup (or an explicit ``await container.bootstrap()``),
+        and controllers are resolved on their first request. This is the part
+        of ``create`` that is safe to share across forked worker processes.
+        """
+        container = PyNestFactory._create_container(
+            main_module, graph_cache, lifecycle_hook_timeout
+        )
+        http_server = FastAPI(**kwargs)
+        return PyNestApp(
+            container,
+            http_server,
+            exception_filter_mode,
+            metrics=metrics,
+            tracer=tracer,
+        )
+
+    @staticmethod
+    def _create_container(
+        main_module: Type[ModuleType],
+        graph_cache: Optional[str],
+        lifecycle_hook_timeout: Optional[float],
+        eager_singletons: bool = False,
+        build: bool = True,
+    ) -> PyNestContainer:
+        container = PyNestContainer()
+        container.lifecycle_hook_timeout = lifecycle_hook_timeout
+        container.eager_singletons = eager_singletons
+        container.add_module(main_module)
+        if build:
+            container.build(graph_cache=graph_cache)
+        return container
 
     @staticmethod
     def _create_server(**kwargs) -> FastAPI:
@@ -47,22 +196,5 @@ class PyNestFactory(AbstractPyNestFactory):
 
     @staticmethod
     def _run_async(coro):
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(coro)
-
-        result = {}
-
-        def runner():
-            try:
-                result["value"] = asyncio.run(coro)
-            except BaseException as exc:
-                result["error"] = exc
-
-        thread = threading.Thread(target=runner)
-        thread.start()
-        thread.join()
-        if "error" in result:
-            raise result["error"]
-        return result.get("value")
+        return run_sync(coro)
+
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import inspect
+import logging
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from injector import Provider, Scope as InjectorScope
+
+from nest.common.interfaces import OnRequestDestroy
+
+_logger = logging.getLogger("pynest.request_scope")
+
+_current_context: ContextVar[Optional["RequestContext"]] = ContextVar(
+    "pynest_request_context", default=None
+)
+
+
+class RequestContext:
+    """
+    Holds the request-scoped instances of one request.
+
+    Entering the context makes it current for the running task (and for the
+    threadpool calls FastAPI makes on its behalf); leaving it runs
+    ``on_request_destroy`` on the cached instances, newest first.
+
+    Usage:
+        async with RequestContext():
+            service = container.get(RequestService)
+    """
+
+    def __init__(self) -> None:
+        self._instances: Dict[Any, Any] = {}
+        self._token = None
+
+    @staticmethod
+    def current() -> Optional["RequestContext"]:
+        return _current_context.get()
+
+    def get_or_create(self, key: Any, factory: Callable[[], Any]) -> Any:
+        try:
+            return self._instances[key]
+        except KeyError:
+            instance = factory()
+            self._instances[key] = instance
+            return instance
+
+    async def close(self) -> None:
+        instances: List[Any] = list(reversed(self._instances.values()))
+        self._instances.clear()
+        for instance in instances:
+            if not isinstance(instance, OnRequestDestroy):
+                continue
+            try:
+                result = instance.on_request_destroy()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                _logger.exception(
+                    f"on_request_destroy failed for {type(instance).__name__}"
+                )
+
+    async def __aenter__(self) -> "RequestContext":
+        self._token = _current_context.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        try:
+            await self.close()
+        finally:
+            _current_context.reset(self._token)
+            self._token = None
+
+
+class _RequestScopedProvider(Provider):
+    def __init__(self, key: Any, provider: Provider) -> None:
+        self._key = key
+        self._provider = provider
+
+    def get(self, injector) -> Any:
+        context = _current_context.get()
+        if context is None:
+            # Outside a request every resolution builds a fresh instance.
+            return self._provider.get(injector)
+        return context.get_or_create(self._key, lambda: self._provider.get(injector))
+
+
+class RequestScope(InjectorScope):
+    """Injector scope caching one instance per key in the current RequestContext."""
+
+    def configure(self) -> None:
+        self._providers: Dict[Any, Provider] = {}
+
+    def get(self, key: Any, provider: Provider) -> Provider:
+        try:
+            return self._providers[key]
+        except KeyError:
+            scoped = _RequestScopedProvider(key, provider)
+            self._providers[key] = scoped
+            return scoped
+
+
+class RequestScopeMiddleware:
+    """ASGI middleware opening a RequestContext for every HTTP and WebSocket connection."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        async with RequestContext():
+            await self.app(scope, receive, send)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from injector import Injector, get_bindings
+
+from nest.common.provider import ProviderDescriptor, Scope
+from nest.core.dependency_graph import DependencyGraph
+from nest.core.injector_module import _to_key
+from nest.core.request_scope import RequestContext
+
+Resolver = Callable[[], Any]
+
+
+def provider_dependencies(desc: ProviderDescriptor) -> Iterable[Any]:
+    """Tokens ``desc`` needs before it can be built."""
+    if desc.use_class is not None:
+        return constructor_bindings(desc).values()
+    if desc.use_factory is not None:
+        return [_to_key(token) for token in desc.inject]
+    if desc.use_existing is not None:
+        return [_to_key(desc.use_existing)]
+    return ()
+
+
+def build_provider_graph(
+    descriptors: Iterable[ProviderDescriptor],
+    graph: Optional[DependencyGraph] = None,
+) -> DependencyGraph:
+    """Token-level dependency graph of the given providers, optionally extending ``graph``."""
+    if graph is None:
+        graph = DependencyGraph()
+    for desc in descriptors:
+        key = _to_key(desc.provide)
+        graph.add_node(key)
+        for dep in provider_dependencies(desc):
+            graph.add_dependency(key, dep)
+    return graph
+
+
+def compile_resolvers(
+    injector: Injector,
+    descriptors: Iterable[ProviderDescriptor],
+    graph: Optional[DependencyGraph] = None,
+    resolvers: Optional[Dict[Any, Resolver]] = None,
+) -> Dict[Any, Resolver]:
+    """
+    Build one zero-argument resolver per provider token.
+
+    New resolvers are added to ``resolvers`` when given, so providers added
+    later can close over the resolvers compiled before them.
+
+    Providers are visited in dependency order so each resolver closes over the
+    resolvers of its constructor dependencies directly:
+
+    - values return the bound value;
+    - singletons go through the injector once and then return the cached
+      instance, so they stay identical to what injected consumers receive;
+    - transient and request-scoped classes call the constructor with their
+      dependencies' resolvers, skipping the injector's per-call reflection,
+      scope lookup and locking. Request-scoped instances share the current
+      RequestContext cache with the injector's RequestScope.
+
+    Factories and aliases outside the singleton scope fall back to the injector.
+    """
+    by_key = {_to_key(desc.provide): desc for desc in descriptors}
+    if graph is None:
+        graph = build_provider_graph(by_key.values())
+
+    if resolvers is None:
+        resolvers = {}
+    for key in graph.topological_sort():
+        desc = by_key.get(key)
+        if desc is None:
+            continue
+        resolvers[key] = _compile(injector, key, desc, resolvers)
+    return resolvers
+
+
+def constructor_bindings(desc: ProviderDescriptor) -> Dict[str, Any]:
+    """Injection keys of ``desc``'s constructor parameters, by parameter name."""
+    if desc.use_class is None:
+        return {}
+    if desc.dependencies is not None:
+        return desc.dependencies
+    try:
+        return get_bindings(desc.use_class.__init__)
+    except Exception:
+        return {}
+
+
+def _compile(
+    injector: Injector,
+    key: Any,
+    desc: ProviderDescriptor,
+    resolvers: Dict[Any, Resolver],
+) -> Resolver:
+    if desc.use_value is not None:
+        value = desc.use_value
+        return lambda: value
+
+    if desc.scope == Scope.SINGLETON:
+        return _cached(lambda: injector.get(key))
+
+    if desc.use_class is None:
+        return lambda: injector.get(key)
+
+    construct = _constructor(injector, desc.use_class, constructor_bindings(desc), resolvers)
+    if desc.scope == Scope.REQUEST:
+
+        def resolve_request_scoped() -> Any:
+            context = RequestContext.current()
+            if context is None:
+                return construct()
+            return context.get_or_create(key, construct)
+
+        return resolve_request_scoped
+    return construct
+
+
+def _cached(create: Resolver) -> Resolver:
+    instance: List[Any] = []
+
+    def resolve() -> Any:
+        if not instance:
+            instance.append(create())
+        return instance[0]
+
+    return resolve
+
+
+def _constructor(
+    injector: Injector,
+    cls: type,
+    bindings: Dict[str, Any],
+    resolvers: Dict[Any, Resolver],
+) -> Resolver:
+    arguments = tuple(
+        (name, resolvers.get(dep) or _injector_lookup(injector, dep))
+        for name, dep in bindings.items()
+    )
+    if not arguments:
+        return cls
+
+    def construct() -> Any:
+        return cls(**{name: resolve() for name, resolve in arguments})
+
+    return construct
+
+
+def _injector_lookup(injector: Injector, key: Any) -> Resolver:
+    return lambda: injector.get(key)
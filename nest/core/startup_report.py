@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class ProviderTiming:
+    """Time spent creating one provider during eager instantiation."""
+
+    token: Any
+    level: int
+    seconds: float
+
+    @property
+    def name(self) -> str:
+        return getattr(self.token, "__name__", None) or repr(self.token)
+
+
+@dataclass
+class StartupReport:
+    """Per-provider timings collected by ``PyNestContainer.instantiate_singletons``."""
+
+    timings: List[ProviderTiming] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    def slowest(self, count: int = 10) -> List[ProviderTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:count]
+
+    def format(self, count: int = 10) -> str:
+        lines = [
+            f"Instantiated {len(self.timings)} providers in "
+            f"{self.total_seconds * 1000:.1f} ms"
+        ]
+        for timing in self.slowest(count):
+            lines.append(
+                f"  level {timing.level:<3} {timing.seconds * 1000:9.2f} ms  {timing.name}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
+
+
+@dataclass(frozen=True)
+class HookTiming:
+    """Time spent in one lifecycle hook call."""
+
+    hook: str
+    owner: str
+    module: Optional[str]
+    seconds: float
+    timed_out: bool = False
+
+
+@dataclass
+class LifecycleReport:
+    """Lifecycle hook timings collected by ``PyNestContainer``, per phase and per call."""
+
+    phases: Dict[str, float] = field(default_factory=dict)
+    timings: List[HookTiming] = field(default_factory=list)
+
+    def slowest(self, count: int = 10) -> List[HookTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:count]
+
+    def format(self, count: int = 10) -> str:
+        lines = [
+            "Lifecycle hooks: "
+            + ", ".join(
+                f"{hook} {seconds * 1000:.1f} ms" for hook, seconds in self.phases.items()
+            )
+        ]
+        for timing in self.slowest(count):
+            location = f" ({timing.module})" if timing.module else ""
+            suffix = "  TIMED OUT" if timing.timed_out else ""
+            lines.append(
+                f"  {timing.seconds * 1000:9.2f} ms  "
+                f"{timing.owner}.{timing.hook}{location}{suffix}"
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format()
@@ -0,0 +1,139 @@
+"""Pre-fork multi-process server.
+
+The parent process compiles the modules, validates and builds the container
+and registers the routes once, then forks the workers. Workers inherit all of
+that copy-on-write and only run what is unsafe to share across ``fork``: async
+factory providers and lifecycle hooks, which run in each worker's ASGI
+lifespan on its own event loop.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import time
+from typing import Any, Dict, Optional, Set, Type
+
+import uvicorn
+
+from nest.core.pynest_application import PyNestApp
+from nest.core.pynest_factory import PyNestFactory
+
+_logger = logging.getLogger("pynest.workers")
+
+# A worker exiting sooner than this after being forked failed during startup;
+# respawning it would only fail again.
+_MIN_WORKER_UPTIME = 1.0
+
+
+def run_workers(
+    main_module: Type,
+    *,
+    workers: Optional[int] = None,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    preload_singletons: bool = False,
+    uvicorn_options: Optional[Dict[str, Any]] = None,
+    **factory_options: Any,
+) -> None:
+    """
+    Serve ``main_module`` from ``workers`` forked processes (default: one per CPU).
+
+    ``preload_singletons`` also creates, in the parent, the singletons that do
+    not depend on async factories, so workers share them; their constructors
+    must not open connections, sockets or threads. ``uvicorn_options`` are
+    passed to ``uvicorn.Config`` and ``factory_options`` to
+    ``PyNestFactory.build``.
+
+    Workers that crash are replaced. SIGTERM and SIGINT are forwarded to the
+    workers, which drain and run their shutdown hooks before exiting. Only
+    available where ``os.fork`` exists.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("run_workers requires os.fork, which this platform lacks")
+
+    app = PyNestFactory.build(main_module, **factory_options)
+    if preload_singletons:
+        app.container.preload_singletons()
+
+    config = uvicorn.Config(
+        app.get_server(), host=host, port=port, lifespan="on", **(uvicorn_options or {})
+    )
+    _WorkerSupervisor(app, config, workers or os.cpu_count() or 1).run()
+
+
+class _WorkerSupervisor:
+    def __init__(self, app: PyNestApp, config: uvicorn.Config, workers: int) -> None:
+        self.app = app
+        self.config = config
+        self.workers = workers
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+
+    def run(self) -> None:
+        socket = self.config.bind_socket()
+        previous = {
+            signum: signal.signal(signum, self._forward_signal)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            for _ in range(self.workers):
+                self._spawn(socket)
+            _logger.info(
+                f"Serving on {self.config.host}:{self.config.port} "
+                f"with {self.workers} workers"
+            )
+            self._supervise(socket)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            socket.close()
+
+    def _spawn(self, socket) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+
+        exit_code = 1
+        try:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, signal.SIG_DFL)
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[socket])
+            exit_code = 0 if server.started else 3
+        except BaseException:
+            _logger.exception(f"Worker {os.getpid()} crashed")
+        finally:
+            os._exit(exit_code)
+
+    def _supervise(self, socket) -> None:
+        failed: Set[int] = set()
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+
+            code = os.waitstatus_to_exitcode(status)
+            if time.monotonic() - started < _MIN_WORKER_UPTIME:
+                failed.add(pid)
+                _logger.error(f"Worker {pid} failed during startup (exit code {code})")
+                self._forward_signal(signal.SIGTERM, None)
+                continue
+            _logger.warning(f"Worker {pid} exited with code {code}; starting a new one")
+            self._spawn(socket)
+
+        if failed:
+            raise RuntimeError(f"{len(failed)} worker(s) failed during startup")
+
+    def _forward_signal(self, signum, frame) -> None:
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
@@ -91,6 +91,35 @@ def test_different_modules_get_different_tokens():
     assert token_a != token_b
 
 
+def test_tokens_are_stable_across_factories():
+    token = ModuleTokenFactory().create(ModuleA)
+    assert token == ModuleTokenFactory().create(ModuleA)
+    assert token == f"{ModuleA.__module__}.{ModuleA.__qualname__}"
+    assert ModuleA.__dict__["__module_token__"] == token
+
+
+def test_dynamic_metadata_adds_a_fingerprint():
+    factory = ModuleTokenFactory()
+    static = factory.create(ModuleA)
+    first = factory.create(ModuleA, {"url": "sqlite://"})
+
+    assert first.startswith(f"{static}:")
+    assert first == ModuleTokenFactory().create(ModuleA, {"url": "sqlite://"})
+    assert first != factory.create(ModuleA, {"url": "postgres://"})
+
+
+def test_classes_sharing_a_qualified_name_get_distinct_tokens():
+    def make():
+        @Module(providers=[])
+        class Generated:
+            pass
+
+        return Generated
+
+    factory = ModuleTokenFactory()
+    assert factory.create(make()) != factory.create(make())
+
+
 def test_module_without_decorator_raises():
     class Bare:
         pass
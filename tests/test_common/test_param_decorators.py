@@ -1,6 +1,10 @@
+from typing import List
+
 from fastapi import FastAPI, Request, Response
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 
+from nest.common import decorators
 from nest.common.decorators import (
     Body,
     ExecutionContext,
@@ -168,3 +172,130 @@ def test_routes_without_param_decorators_keep_fastapi_binding():
 
     assert response.status_code == 200
     assert response.json() == {"item_id": 7, "q": "plain"}
+
+
+@Controller("/planned")
+class PlannedController:
+    @Get("/{item_id}")
+    def mixed(
+        self,
+        request: Request,
+        item_id: int = Param("item_id"),
+        first: str = Query("q"),
+        second: str = Query("q", UpperPipe),
+        token: str = Headers("x_token"),
+        ip: str = Ip(),
+    ):
+        return {
+            "path": request.url.path,
+            "item_id": item_id,
+            "first": first,
+            "second": second,
+            "token": token,
+            "ip": ip,
+        }
+
+
+def test_argument_plan_registers_no_per_parameter_dependencies():
+    client = build_client(PlannedController)
+
+    route = next(r for r in client.app.routes if r.path == "/planned/{item_id}")
+
+    assert route.dependant.dependencies == []
+    assert {p.alias for p in route.dependant.query_params} == {"q"}
+
+
+def test_argument_plan_shares_handler_request_and_repeated_sources():
+    client = build_client(PlannedController)
+
+    response = client.get("/planned/3?q=abc", headers={"x-token": "secret"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "path": "/planned/3",
+        "item_id": 3,
+        "first": "abc",
+        "second": "ABC",
+        "token": "secret",
+        "ip": "testclient",
+    }
+
+
+@Controller("/crossed")
+class CrossedNamesController:
+    @Get("/swapped")
+    def swapped(self, x: str = Query("a"), a: str = Query("x")):
+        return {"x": x, "a": a}
+
+    @Get("/mixed")
+    def mixed(self, value: str = Query("v"), agent: str = Headers("user-agent")):
+        return {"value": value, "agent": agent}
+
+
+def test_source_names_never_shadow_decorated_parameters():
+    client = build_client(CrossedNamesController)
+
+    assert client.get("/crossed/swapped?a=1&x=2").json() == {"x": "1", "a": "2"}
+    assert client.get(
+        "/crossed/mixed?v=query", headers={"user-agent": "agent"}
+    ).json() == {"value": "query", "agent": "agent"}
+
+
+class CountingPipe:
+    instances = 0
+
+    def __init__(self):
+        CountingPipe.instances += 1
+
+    def transform(self, value):
+        return value
+
+
+@Controller("/cached")
+class CachedController:
+    @Get("/")
+    def numbers(self, ids: List[int] = Query("ids", CountingPipe)):
+        return {"ids": ids}
+
+
+def test_pipes_and_type_adapters_are_built_at_registration(monkeypatch):
+    CountingPipe.instances = 0
+    client = build_client(CachedController)
+    assert CountingPipe.instances == 1
+
+    def fail_on_request(annotation):
+        raise AssertionError(f"TypeAdapter({annotation!r}) built per request")
+
+    monkeypatch.setattr(decorators, "TypeAdapter", fail_on_request)
+
+    for _ in range(3):
+        response = client.get("/cached/?ids=1&ids=2")
+        assert response.json() == {"ids": [1, 2]}
+
+    assert CountingPipe.instances == 1
+
+
+def test_compiled_coercion_builds_no_adapter_or_pipe_per_call(monkeypatch):
+    annotation = List[int]
+    value = ["1", "2", "3"]
+    step_pipes = decorators._compile_pipes((CountingPipe,), {})
+    coerce = decorators._compile_coercer(annotation)
+    instances = CountingPipe.instances
+
+    adapters = []
+
+    class CountingAdapter(TypeAdapter):
+        def __init__(self, *args, **kwargs):
+            adapters.append(args)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(decorators, "TypeAdapter", CountingAdapter)
+
+    for _ in range(50):
+        result = value
+        for pipe in step_pipes:
+            result = pipe(result)
+        assert coerce(result) == [1, 2, 3]
+
+    assert CountingPipe.instances == instances
+    assert adapters == []
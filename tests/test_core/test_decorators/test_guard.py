@@ -83,3 +83,276 @@ def test_controller_preserves_guard_metadata():
 
     assert hasattr(BearerController.root, "__guards__")
     assert BearerGuard in BearerController.root.__guards__
+
+
+def _build_guarded_client(*guards, providers=(), policy="sequential"):
+    from fastapi.testclient import TestClient
+
+    from nest.core import Module, PyNestFactory
+
+    @Controller("/reuse")
+    class ReuseController:
+        @Get("/")
+        @UseGuards(*guards, policy=policy)
+        def root(self):
+            return {"ok": True}
+
+    @Module(controllers=[ReuseController], providers=list(providers))
+    class ReuseModule:
+        pass
+
+    return TestClient(PyNestFactory.create(ReuseModule).get_server())
+
+
+def test_guard_is_resolved_once_with_injected_dependencies():
+    from nest.core import Injectable
+
+    @Injectable
+    class KeyStore:
+        def __init__(self):
+            self.keys = {"valid"}
+
+    @Injectable
+    class KeyGuard(BaseGuard):
+        instances = []
+
+        def __init__(self, store: KeyStore):
+            self.store = store
+            KeyGuard.instances.append(self)
+
+        def can_activate(self, request: Request, credentials=None) -> bool:
+            return request.headers.get("x-key") in self.store.keys
+
+    client = _build_guarded_client(KeyGuard, providers=[KeyStore])
+
+    assert client.get("/reuse/", headers={"x-key": "valid"}).status_code == 200
+    assert client.get("/reuse/", headers={"x-key": "nope"}).status_code == 403
+    assert len(KeyGuard.instances) == 1
+    assert isinstance(KeyGuard.instances[0].store, KeyStore)
+
+
+def test_transient_guard_is_built_per_request():
+    from nest.common.provider import Scope
+    from nest.core import Injectable
+
+    @Injectable(scope=Scope.TRANSIENT)
+    class StatefulGuard(BaseGuard):
+        instances = 0
+
+        def __init__(self):
+            StatefulGuard.instances += 1
+
+        def can_activate(self, request: Request, credentials=None) -> bool:
+            return True
+
+    client = _build_guarded_client(StatefulGuard)
+    StatefulGuard.instances = 0
+
+    client.get("/reuse/")
+    client.get("/reuse/")
+
+    assert StatefulGuard.instances == 2
+
+
+def test_guard_injecting_an_async_factory_waits_for_the_bootstrap():
+    from fastapi.testclient import TestClient
+
+    from nest.core import Injectable, Module, PyNestFactory
+
+    class ApiKeys(set):
+        pass
+
+    async def load_keys():
+        return ApiKeys({"valid"})
+
+    @Injectable
+    class AsyncKeyGuard(BaseGuard):
+        def __init__(self, keys: ApiKeys):
+            self.keys = keys
+
+        def can_activate(self, request: Request, credentials=None) -> bool:
+            return request.headers.get("x-key") in self.keys
+
+    @Controller("/async-keys")
+    class AsyncKeysController:
+        @Get("/")
+        @UseGuards(AsyncKeyGuard)
+        def root(self):
+            return {"ok": True}
+
+    @Module(
+        controllers=[AsyncKeysController],
+        providers=[{"provide": ApiKeys, "useFactory": load_keys}],
+    )
+    class AsyncKeysModule:
+        pass
+
+    app = PyNestFactory.build(AsyncKeysModule)
+    with TestClient(app.get_server()) as client:
+        assert client.get("/async-keys/", headers={"x-key": "valid"}).status_code == 200
+        assert client.get("/async-keys/", headers={"x-key": "nope"}).status_code == 403
+
+
+class _FakeRequest:
+    method = "GET"
+    scope = {}
+
+    class url:
+        path = "/cached"
+
+
+def test_decision_cache_memoizes_until_ttl_expires():
+    import asyncio
+
+    from nest.core.decorators.guards import GuardDecisionCache
+
+    now = [0.0]
+    cache = GuardDecisionCache(ttl=10, clock=lambda: now[0])
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return True
+
+    async def scenario():
+        assert await cache.get_or_compute("token", compute) is True
+        now[0] = 9.9
+        assert await cache.get_or_compute("token", compute) is True
+        now[0] = 10.0
+        assert await cache.get_or_compute("token", compute) is True
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_decision_cache_evicts_least_recently_used():
+    import asyncio
+
+    from nest.core.decorators.guards import GuardDecisionCache
+
+    cache = GuardDecisionCache(ttl=60, max_size=2)
+    calls = []
+
+    async def decide(key):
+        async def compute():
+            calls.append(key)
+            return True
+
+        return await cache.get_or_compute(key, compute)
+
+    async def scenario():
+        await decide("a")
+        await decide("b")
+        await decide("a")
+        await decide("c")  # evicts "b", the least recently used
+        await decide("a")
+        await decide("b")
+
+    asyncio.run(scenario())
+    assert calls == ["a", "b", "c", "b"]
+    assert len(cache) == 2
+
+
+def test_cached_guard_runs_concurrent_identical_checks_once():
+    import asyncio
+
+    from fastapi import HTTPException
+
+    class IntrospectionGuard(BaseGuard):
+        decision_cache_ttl = 30
+
+        def __init__(self):
+            self.calls = 0
+
+        async def can_activate(self, request, credentials=None) -> bool:
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return credentials == "good"
+
+    guard = IntrospectionGuard()
+    request = _FakeRequest()
+
+    async def scenario():
+        await asyncio.gather(*(guard(request, "good") for _ in range(20)))
+        for _ in range(2):
+            try:
+                await guard(request, "bad")
+            except HTTPException as exc:
+                assert exc.status_code == 403
+            else:
+                raise AssertionError("denied decision was not enforced")
+
+    asyncio.run(scenario())
+    assert guard.calls == 2
+
+
+def _slow_guard(name, allow, delay, events):
+    import asyncio
+
+    class SlowGuard(BaseGuard):
+        async def can_activate(self, request: Request, credentials=None) -> bool:
+            events.append(f"{name}:start")
+            await asyncio.sleep(delay)
+            events.append(f"{name}:end")
+            return allow
+
+    SlowGuard.__name__ = f"{name.title()}Guard"
+    return SlowGuard
+
+
+def test_all_policy_runs_guards_concurrently():
+    from nest.core import GuardPolicy
+
+    events = []
+    guards = [_slow_guard(n, True, 0.1, events) for n in ("a", "b", "c")]
+    client = _build_guarded_client(*guards, policy=GuardPolicy.ALL)
+
+    response = client.get("/reuse/")
+
+    assert response.status_code == 200
+    assert [e for e in events if e.endswith(":start")] == ["a:start", "b:start", "c:start"]
+    assert events.index("c:start") < events.index("a:end")
+
+
+def test_all_policy_denies_and_cancels_remaining_guards():
+    events = []
+    fast_deny = _slow_guard("deny", False, 0.0, events)
+    slow_allow = _slow_guard("slow", True, 0.5, events)
+    client = _build_guarded_client(slow_allow, fast_deny, policy="all")
+
+    assert client.get("/reuse/").status_code == 403
+    assert "slow:end" not in events
+
+
+def test_mixed_policies_leave_no_unretrieved_guard_failures(caplog):
+    import gc
+    import logging
+
+    events = []
+    first_deny = _slow_guard("first", False, 0.0, events)
+    second_deny = _slow_guard("second", False, 0.0, events)
+    allow = _slow_guard("allow", True, 0.0, events)
+    all_client = _build_guarded_client(first_deny, second_deny, policy="all")
+    any_client = _build_guarded_client(first_deny, allow, second_deny, policy="any")
+
+    with caplog.at_level(logging.ERROR, logger="asyncio"):
+        for _ in range(5):
+            assert all_client.get("/reuse/").status_code == 403
+            assert any_client.get("/reuse/").status_code == 200
+        gc.collect()
+
+    assert "never retrieved" not in caplog.text
+
+
+def test_any_policy_allows_on_first_passing_guard():
+    events = []
+    deny = _slow_guard("deny", False, 0.0, events)
+    allow = _slow_guard("allow", True, 0.0, events)
+    slow = _slow_guard("slow", False, 0.5, events)
+    client = _build_guarded_client(deny, allow, slow, policy="any")
+
+    assert client.get("/reuse/").status_code == 200
+    assert "slow:end" not in events
+
+    denied = _build_guarded_client(deny, deny, policy="any")
+    assert denied.get("/reuse/").status_code == 403
@@ -110,3 +110,73 @@ def test_validate_passes_for_valid_graph():
     g.add_dependency(A, B)
     g.add_dependency(B, C)
     g.validate()  # must not raise
+
+
+def test_levels_group_independent_nodes():
+    g = DependencyGraph()
+    g.add_dependency(A, B)
+    g.add_dependency(A, C)
+    g.add_dependency(B, D)
+    g.add_dependency(C, D)
+    levels = g.levels()
+    assert levels[0] == [D]
+    assert set(levels[1]) == {B, C}
+    assert levels[2] == [A]
+
+
+def test_strongly_connected_components_come_dependencies_first():
+    g = DependencyGraph()
+    g.add_dependency(A, B)
+    g.add_dependency(B, C)
+    g.add_dependency(C, B)
+    g.add_dependency(C, D)
+    components = g.strongly_connected_components()
+    assert [set(c) for c in components] == [{D}, {B, C}, {A}]
+
+
+def test_every_cyclic_component_is_reported_as_a_closed_path():
+    g = DependencyGraph()
+    g.add_dependency(A, B)
+    g.add_dependency(B, A)
+    g.add_dependency(C, D)
+    g.add_dependency(D, C)
+    g.add_dependency("self", "self")
+    cycles = g.detect_cycles()
+    assert len(cycles) == 3
+    for cycle in cycles:
+        assert cycle[0] == cycle[-1]
+    assert ["self", "self"] in cycles
+    with pytest.raises(CycleError, match="Circular dependencies detected"):
+        g.validate()
+
+
+def test_levels_keep_cycle_members_together():
+    g = DependencyGraph()
+    g.add_dependency(A, B)
+    g.add_dependency(B, C)
+    g.add_dependency(C, B)
+    levels = g.levels()
+    assert [set(level) for level in levels] == [{B, C}, {A}]
+
+
+def test_stress_deep_and_wide_graph():
+    # A 10k-deep chain would exceed the recursion limit of a recursive search.
+    chain = DependencyGraph()
+    for index in range(1, 10_000):
+        chain.add_dependency(index, index - 1)
+    assert chain.detect_cycles() == []
+    assert chain.topological_sort()[:3] == [0, 1, 2]
+    assert len(chain.levels()) == 10_000
+
+    # 10k nodes in 100 layers, each depending on three nodes of the layer below.
+    wide = DependencyGraph()
+    for index in range(100, 10_000):
+        for offset in (0, 37, 71):
+            wide.add_dependency(index, (index // 100 - 1) * 100 + (index + offset) % 100)
+    wide.add_dependency(0, 9_999)
+
+    cycles = wide.detect_cycles()
+    levels = wide.levels()
+
+    assert len(cycles) == 1 and cycles[0][0] == cycles[0][-1]
+    assert sum(len(level) for level in levels) == 10_000
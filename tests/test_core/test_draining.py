@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+
+from nest.common.interfaces import BeforeApplicationShutdown
+from nest.core import Controller, Get, Injectable, Module, PyNestFactory
+from nest.core.draining import InFlightMiddleware, InFlightTracker
+
+events = []
+
+
+@Injectable
+class ShutdownRecorder(BeforeApplicationShutdown):
+    def before_application_shutdown(self, signal):
+        events.append("before-shutdown")
+
+
+@Controller("/work")
+class WorkController:
+    @Get("/slow")
+    async def slow(self):
+        await asyncio.sleep(0.2)
+        events.append("slow-finished")
+        return {"done": True}
+
+    @Get("/stuck")
+    async def stuck(self):
+        await asyncio.sleep(10)
+
+    @Get("/fast")
+    def fast(self):
+        return {"done": True}
+
+
+@Module(controllers=[WorkController], providers=[ShutdownRecorder])
+class DrainModule:
+    pass
+
+
+def _client(app):
+    transport = httpx.ASGITransport(app=app.get_server())
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def _wait_for_in_flight(app):
+    while app.in_flight.requests == 0:
+        await asyncio.sleep(0.01)
+
+
+def test_close_waits_for_in_flight_requests_and_rejects_new_ones():
+    events.clear()
+    app = PyNestFactory.create(DrainModule)
+
+    async def run():
+        async with _client(app) as client:
+            slow = asyncio.ensure_future(client.get("/work/slow"))
+            await _wait_for_in_flight(app)
+            closing = asyncio.ensure_future(app.close())
+            await asyncio.sleep(0.05)
+            rejected = await client.get("/work/fast")
+            return await slow, rejected, await closing
+
+    slow, rejected, _ = asyncio.run(run())
+
+    assert slow.status_code == 200
+    assert rejected.status_code == 503
+    assert rejected.headers["connection"] == "close"
+    assert events == ["slow-finished", "before-shutdown"]
+
+
+def test_drain_deadline_lets_shutdown_proceed():
+    events.clear()
+    app = PyNestFactory.create(DrainModule)
+    app.drain_timeout = 0.1
+
+    async def run():
+        async with _client(app) as client:
+            stuck = asyncio.ensure_future(client.get("/work/stuck"))
+            await _wait_for_in_flight(app)
+            await app.close()
+            in_flight = app.in_flight.in_flight
+            stuck.cancel()
+            return in_flight
+
+    assert asyncio.run(run()) == 1
+    assert events == ["before-shutdown"]
+
+
+def test_websocket_handshake_is_rejected_while_draining():
+    tracker = InFlightTracker()
+    tracker.draining = True
+    sent = []
+
+    async def app(scope, receive, send):
+        raise AssertionError("draining middleware must not call the app")
+
+    async def receive():
+        return {"type": "websocket.connect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(InFlightMiddleware(app, tracker)({"type": "websocket"}, receive, send))
+    assert sent == [{"type": "websocket.close", "code": 1012}]
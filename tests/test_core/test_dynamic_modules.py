@@ -0,0 +1,288 @@
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from nest.common.exceptions import (
+    ModuleTokenCollisionException,
+    ProviderNotExportedException,
+)
+from nest.common.module import ModuleCompiler, ModuleTokenFactory
+from nest.common.provider import InjectionToken, ProviderDescriptor
+from nest.core import Controller, DynamicModule, Get, Injectable, Module, PyNestFactory
+from nest.core.pynest_container import PyNestContainer
+
+DB_URL = InjectionToken("DB_URL")
+
+
+@Injectable
+class Database:
+    def __init__(self, url: DB_URL):
+        self.url = url
+
+
+@Module(providers=[Database], exports=[Database])
+class DatabaseModule:
+    @staticmethod
+    def for_root(url: str, is_global: bool = False) -> DynamicModule:
+        return DynamicModule(
+            module=DatabaseModule,
+            providers=[ProviderDescriptor(provide=DB_URL, use_value=url)],
+            is_global=is_global,
+        )
+
+    @staticmethod
+    def for_feature(name: str) -> DynamicModule:
+        token = InjectionToken(f"{name}_TABLE")
+        return DynamicModule(
+            module=DatabaseModule,
+            providers=[ProviderDescriptor(provide=token, use_value=name)],
+            exports=[token],
+        )
+
+
+def _build(module):
+    container = PyNestContainer()
+    container.add_module(module)
+    container.build()
+    return container
+
+
+def test_equal_configurations_compile_once():
+    compiler = ModuleCompiler(ModuleTokenFactory())
+    first = compiler.compile(DatabaseModule.for_root("sqlite://"))
+
+    assert compiler.compile(DatabaseModule.for_root("sqlite://")) is first
+    assert compiler.compile(DatabaseModule.for_root("postgres://")).token != first.token
+    assert compiler.compile(DatabaseModule).token != first.token
+    assert first.metatype is DatabaseModule
+    assert Database in first.exports and len(first.provider_descriptors) == 2
+
+
+def test_configurations_sharing_a_repr_are_compiled_separately():
+    compiler = ModuleCompiler(ModuleTokenFactory())
+    shard_a = compiler.compile(DatabaseModule.for_root(SecretStr("postgres://shard-a")))
+    shard_b = compiler.compile(DatabaseModule.for_root(SecretStr("postgres://shard-b")))
+
+    assert shard_a.token != shard_b.token
+    urls = [
+        desc.use_value.get_secret_value()
+        for compiled in (shard_a, shard_b)
+        for desc in compiled.provider_descriptors
+        if desc.provide is DB_URL
+    ]
+    assert urls == ["postgres://shard-a", "postgres://shard-b"]
+    again = compiler.compile(DatabaseModule.for_root(SecretStr("postgres://shard-b")))
+    assert again is shard_b
+
+
+def test_uncomparable_metadata_falls_back_to_identity():
+    class Opaque:
+        def __eq__(self, other):
+            raise TypeError("not comparable")
+
+        def __repr__(self):
+            return "Opaque()"
+
+    factory = ModuleTokenFactory()
+    value = Opaque()
+    token = factory.create(DatabaseModule, {"providers": value})
+
+    assert factory.create(DatabaseModule, {"providers": value}) == token
+    assert factory.create(DatabaseModule, {"providers": Opaque()}) != token
+
+
+def test_fingerprint_collision_raises(monkeypatch):
+    factory = ModuleTokenFactory()
+    factory.create(DatabaseModule, {"url": "a"})
+    monkeypatch.setattr(
+        "nest.common.module.hashlib.sha256",
+        lambda data: type("Digest", (), {"hexdigest": lambda self: "0" * 64})(),
+    )
+    factory.create(DatabaseModule, {"url": "b"})
+
+    with pytest.raises(ModuleTokenCollisionException):
+        factory.create(DatabaseModule, {"url": "c"})
+
+
+def test_dynamic_module_is_registered_once_per_configuration():
+    @Module(imports=[DatabaseModule.for_feature("users")])
+    class UsersModule:
+        pass
+
+    @Module(imports=[DatabaseModule.for_feature("orders")])
+    class OrdersModule:
+        pass
+
+    @Module(
+        imports=[
+            DatabaseModule.for_root("sqlite://", is_global=True),
+            UsersModule,
+            OrdersModule,
+            DatabaseModule.for_feature("users"),
+        ]
+    )
+    class AppModule:
+        pass
+
+    container = _build(AppModule)
+
+    database_refs = [
+        ref for ref in container.modules.values() if ref.metatype is DatabaseModule
+    ]
+    assert len(database_refs) == 3
+    assert container.get(Database).url == "sqlite://"
+    assert container.get(InjectionToken("orders_TABLE")) == "orders"
+
+
+def test_exports_are_visible_through_the_dynamic_import():
+    @Injectable
+    class UsersService:
+        def __init__(self, db: Database):
+            self.db = db
+
+    @Controller("/users")
+    class UsersController:
+        def __init__(self, service: UsersService):
+            self.service = service
+
+        @Get("/")
+        def url(self):
+            return {"url": self.service.db.url}
+
+    @Module(
+        imports=[DatabaseModule.for_root("sqlite://")],
+        controllers=[UsersController],
+        providers=[UsersService],
+    )
+    class AppModule:
+        pass
+
+    client = TestClient(PyNestFactory.create(AppModule).get_server())
+    assert client.get("/users/").json() == {"url": "sqlite://"}
+
+
+def test_dynamic_module_can_be_re_exported_by_class():
+    @Module(
+        imports=[DatabaseModule.for_root("sqlite://")],
+        exports=[DatabaseModule],
+    )
+    class CoreModule:
+        pass
+
+    @Injectable
+    class Reporter:
+        def __init__(self, db: Database):
+            self.db = db
+
+    @Module(imports=[CoreModule], providers=[Reporter])
+    class AppModule:
+        pass
+
+    assert _build(AppModule).get(Reporter).db.url == "sqlite://"
+
+
+def _shard_application():
+    opened = []
+
+    @Injectable
+    class Pool:
+        def __init__(self, url: DB_URL):
+            self.url = url
+
+        def on_module_init(self):
+            opened.append(self.url)
+
+    @Module(providers=[Pool], exports=[Pool])
+    class ShardModule:
+        @staticmethod
+        def for_root(url: str) -> DynamicModule:
+            return DynamicModule(
+                module=ShardModule,
+                providers=[ProviderDescriptor(provide=DB_URL, use_value=url)],
+            )
+
+    @Injectable
+    class AccountsRepository:
+        def __init__(self, pool: Pool):
+            self.pool = pool
+
+    @Module(imports=[ShardModule.for_root("shard-a")], providers=[AccountsRepository])
+    class AccountsModule:
+        pass
+
+    @Injectable
+    class OrdersRepository:
+        def __init__(self, pool: Pool):
+            self.pool = pool
+
+    @Controller("/orders")
+    class OrdersController:
+        def __init__(self, pool: Pool):
+            self.pool = pool
+
+        @Get("/")
+        def url(self):
+            return {"url": self.pool.url}
+
+    @Module(
+        imports=[ShardModule.for_root("shard-b")],
+        controllers=[OrdersController],
+        providers=[OrdersRepository],
+    )
+    class OrdersModule:
+        pass
+
+    @Module(imports=[AccountsModule, OrdersModule])
+    class AppModule:
+        pass
+
+    return AppModule, AccountsRepository, OrdersRepository, opened
+
+
+def test_each_configuration_provides_its_own_instances():
+    app_module, accounts, orders, opened = _shard_application()
+    app = PyNestFactory.create(app_module)
+
+    assert app.container.get(accounts).pool.url == "shard-a"
+    assert app.container.get(orders).pool.url == "shard-b"
+    assert TestClient(app.get_server()).get("/orders/").json() == {"url": "shard-b"}
+    assert sorted(opened) == ["shard-a", "shard-b"]
+
+
+def test_module_scoped_bindings_survive_the_graph_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / "graph.json")
+    for cached in (False, True):
+        if cached:
+            monkeypatch.setattr(
+                PyNestContainer,
+                "_validate_dependency_graph",
+                lambda self: pytest.fail("the cached graph should be used"),
+            )
+        app_module, accounts, orders, _ = _shard_application()
+        container = PyNestContainer()
+        container.add_module(app_module)
+        container.build(graph_cache=path)
+        assert container.get(accounts).pool.url == "shard-a"
+        assert container.get(orders).pool.url == "shard-b"
+
+
+def test_compilers_do_not_share_a_token_factory():
+    assert (
+        ModuleCompiler().module_token_factory is not ModuleCompiler().module_token_factory
+    )
+
+
+def test_unexported_dynamic_provider_is_not_visible():
+    @Injectable
+    class Reporter:
+        def __init__(self, url: DB_URL):
+            self.url = url
+
+    @Module(imports=[DatabaseModule.for_root("sqlite://")], providers=[Reporter])
+    class AppModule:
+        pass
+
+    container = PyNestContainer()
+    container.add_module(AppModule)
+    with pytest.raises(ProviderNotExportedException):
+        container.build()
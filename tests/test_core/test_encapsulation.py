@@ -109,6 +109,58 @@ def test_re_exported_module_chains_through():
     container.build()  # no raise
 
 
+@pytest.mark.parametrize("root_first", [True, False])
+def test_cyclic_re_exports_expose_the_whole_cycle(root_first):
+    @Injectable
+    class AlphaRepo:
+        pass
+
+    @Injectable
+    class BetaRepo:
+        pass
+
+    @Module(providers=[AlphaRepo], exports=[AlphaRepo])
+    class AlphaMod:
+        pass
+
+    @Module(providers=[BetaRepo], imports=[AlphaMod], exports=[BetaRepo, AlphaMod])
+    class BetaMod:
+        pass
+
+    # Close the cycle: AlphaMod re-exports BetaMod, which re-exports AlphaMod.
+    AlphaMod.exports = [AlphaRepo, BetaMod]
+
+    @Injectable
+    class UsesBeta:
+        def __init__(self, repo: BetaRepo):
+            self.repo = repo
+
+    @Injectable
+    class UsesAlpha:
+        def __init__(self, repo: AlphaRepo):
+            self.repo = repo
+
+    @Module(providers=[UsesBeta], imports=[AlphaMod])
+    class AlphaConsumer:
+        pass
+
+    @Module(providers=[UsesAlpha], imports=[BetaMod])
+    class BetaConsumer:
+        pass
+
+    @Module(
+        imports=[AlphaConsumer, BetaConsumer, BetaMod]
+        if root_first
+        else [BetaMod, BetaConsumer, AlphaConsumer]
+    )
+    class Root:
+        pass
+
+    container = PyNestContainer()
+    container.add_module(Root)
+    container.build()  # no raise
+
+
 # ── Illegal scenarios (should raise) ────────────────────────────────────────
 
 
@@ -224,3 +276,52 @@ def test_unrelated_modules_do_not_share_providers():
     container.add_module(AppMod)
     with pytest.raises(ProviderNotExportedException):
         container.build()
+
+
+# ── Scale ────────────────────────────────────────────────────────────────────
+
+
+def _hub_application(feature_count: int):
+    """Feature modules importing a shared module that re-exports a large core."""
+    core_providers = [Injectable(type(f"Core{i}", (), {})) for i in range(feature_count)]
+    core = Module(providers=core_providers, exports=core_providers)(type("Core", (), {}))
+    shared = Module(imports=[core], exports=[core])(type("Shared", (), {}))
+
+    features = []
+    for i in range(feature_count):
+
+        def __init__(self, dep):
+            self.dep = dep
+
+        __init__.__annotations__ = {"dep": core_providers[i]}
+        service = Injectable(type(f"Feature{i}Service", (), {"__init__": __init__}))
+        features.append(
+            Module(imports=[shared], providers=[service])(type(f"Feature{i}", (), {}))
+        )
+    return Module(imports=features)(type("Root", (), {}))
+
+
+def test_hub_application_resolves_each_module_once(monkeypatch):
+    from nest.core import encapsulation
+
+    feature_count = 500
+    container = PyNestContainer()
+    container.add_module(_hub_application(feature_count))
+
+    walked = []
+    original = encapsulation._re_exported_modules
+
+    def counting(mref, modules, metatype_to_ref):
+        walked.append(mref.token)
+        return original(mref, modules, metatype_to_ref)
+
+    monkeypatch.setattr(encapsulation, "_re_exported_modules", counting)
+    exports = encapsulation._resolve_exports(container.modules)
+    encapsulation.validate_module_encapsulation(container.modules)
+
+    # Root, Shared, Core and the features, each walked once per validation.
+    module_count = feature_count + 3
+    assert len(container.modules) == module_count
+    assert len(walked) == 2 * module_count
+    # Only Core and Shared expose anything; features hold no visibility sets.
+    assert sum(len(tokens) for tokens in exports.values()) == 2 * feature_count
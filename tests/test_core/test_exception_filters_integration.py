@@ -1,7 +1,10 @@
 """Integration tests for exception filters using TestClient."""
+import inspect
+
 import pytest
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 from nest.common.exceptions import (
     ArgumentsHost,
@@ -11,11 +14,13 @@ from nest.common.exceptions import (
     BadRequestException,
     InternalServerErrorException,
 )
+from nest.common.decorators import Param
 from nest.core import (
     Controller,
     Get,
     Module,
     Injectable,
+    Post,
     PyNestFactory,
 )
 from nest.core.decorators.filters import Catch, UseFilters
@@ -377,3 +382,194 @@ def test_async_filter_is_awaited():
     resp = client.get("/t7/error")
     assert resp.status_code == 500
     assert resp.json()["source"] == "AsyncHttpFilter"
+
+
+# ---------------------------------------------------------------------------
+# Test 8: Filters are resolved once through the container and dispatched by type
+# ---------------------------------------------------------------------------
+
+@Injectable
+class ErrorReporter:
+    def __init__(self):
+        self.reported = []
+
+
+@Injectable
+@Catch(HttpException)
+class ReportingFilter(ExceptionFilter):
+    instances = 0
+
+    def __init__(self, reporter: ErrorReporter):
+        self.reporter = reporter
+        ReportingFilter.instances += 1
+
+    async def catch(self, exception: HttpException, host: ArgumentsHost):
+        self.reporter.reported.append(type(exception).__name__)
+        return JSONResponse(
+            status_code=exception.status_code,
+            content={"source": "ReportingFilter"},
+        )
+
+
+@Controller("/t8")
+@UseFilters(ValueErrorFilter, ReportingFilter)
+class T8Controller:
+    @Get("/not-found")
+    def raise_not_found(self):
+        raise NotFoundException("t8 missing")
+
+    @Get("/bad-request")
+    def raise_bad_request(self):
+        raise BadRequestException("t8 bad")
+
+
+@Module(controllers=[T8Controller], providers=[ErrorReporter])
+class T8Module:
+    pass
+
+
+def test_filters_are_built_once_with_injected_dependencies():
+    ReportingFilter.instances = 0
+    app = PyNestFactory.create(T8Module)
+    client = TestClient(app.get_server(), raise_server_exceptions=False)
+
+    for _ in range(3):
+        assert client.get("/t8/not-found").json()["source"] == "ReportingFilter"
+    assert client.get("/t8/bad-request").status_code == 400
+
+    assert ReportingFilter.instances == 1
+    reporter = app.container.get(ErrorReporter)
+    assert reporter.reported == ["NotFoundException"] * 3 + ["BadRequestException"]
+
+
+def test_filter_dispatcher_caches_first_matching_filter_per_type():
+    from nest.common.route_resolver import ExceptionFilterDispatcher
+
+    http_filter, value_filter, catch_all = object(), object(), object()
+    dispatcher = ExceptionFilterDispatcher(
+        [
+            (ValueErrorFilter, lambda: value_filter),
+            (HttpExceptionFilter, lambda: http_filter),
+            (AllExceptionsFilter, lambda: catch_all),
+        ]
+    )
+
+    assert dispatcher.resolve(NotFoundException)() is http_filter
+    assert dispatcher.resolve(ValueError)() is value_filter
+    assert dispatcher.resolve(KeyError)() is catch_all
+    assert dispatcher.resolve(NotFoundException) is dispatcher.resolve(
+        NotFoundException
+    )
+
+
+# ---------------------------------------------------------------------------
+# Test 9: Param decorators and filters share one wrapper; router filter mode
+# ---------------------------------------------------------------------------
+
+def parse_positive(value):
+    number = int(value)
+    if number <= 0:
+        raise BadRequestException("id must be positive")
+    return number
+
+
+@Catch(HttpException)
+class PathEchoFilter(ExceptionFilter):
+    async def catch(self, exception: HttpException, host: ArgumentsHost):
+        return JSONResponse(
+            status_code=exception.status_code,
+            content={"path": host.switch_to_http().get_request().url.path},
+        )
+
+
+@Controller("/t9")
+@UseFilters(PathEchoFilter)
+class T9Controller:
+    @Get("/items/{item_id}")
+    def get_item(self, item_id: int = Param("item_id", parse_positive)):
+        if item_id == 404:
+            raise NotFoundException("no item")
+        return {"id": item_id}
+
+    @Get("/plain/{item_id}")
+    def get_plain(self, item_id: int):
+        return {"id": item_id}
+
+
+@Module(controllers=[T9Controller])
+class T9Module:
+    pass
+
+
+def _t9_route(app, path):
+    return next(r for r in app.get_server().routes if getattr(r, "path", None) == path)
+
+
+def test_filters_cover_pipes_within_the_param_wrapper():
+    app = PyNestFactory.create(T9Module)
+    client = TestClient(app.get_server())
+
+    assert client.get("/t9/items/3").json() == {"id": 3}
+    assert client.get("/t9/items/404").json() == {"path": "/t9/items/404"}
+    response = client.get("/t9/items/-1")
+    assert response.status_code == 400
+    assert response.json() == {"path": "/t9/items/-1"}
+
+    endpoint = _t9_route(app, "/t9/items/{item_id}").endpoint
+    assert "pynest_request" in inspect.signature(endpoint).parameters
+
+
+def test_router_filter_mode_keeps_endpoint_unwrapped():
+    from nest.common.route_resolver import ExceptionFilterMode, FilteredAPIRoute
+
+    app = PyNestFactory.create(
+        T9Module, exception_filter_mode=ExceptionFilterMode.ROUTER
+    )
+    client = TestClient(app.get_server())
+
+    route = _t9_route(app, "/t9/plain/{item_id}")
+    assert isinstance(route, FilteredAPIRoute)
+    assert route.endpoint.__func__ is T9Controller.get_plain
+    assert client.get("/t9/plain/7").json() == {"id": 7}
+
+    assert client.get("/t9/items/404").json() == {"path": "/t9/items/404"}
+    assert client.get("/t9/items/-1").status_code == 400
+
+
+class T10Receipt(BaseModel):
+    id: int
+    status: str
+
+
+@Catch(LookupError)
+class ReceiptFilter(ExceptionFilter):
+    def catch(self, exception: LookupError, host: ArgumentsHost):
+        return {"id": 0, "status": "missing", "internal": str(exception)}
+
+
+@Controller("/t10")
+@UseFilters(ReceiptFilter)
+class T10Controller:
+    @Post("/orders", status_code=201, response_model=T10Receipt)
+    def create_order(self):
+        raise LookupError("no stock")
+
+
+@Module(controllers=[T10Controller])
+class T10Module:
+    pass
+
+
+def test_filter_results_are_serialized_alike_in_both_modes():
+    from nest.common.route_resolver import ExceptionFilterMode
+
+    responses = [
+        TestClient(
+            PyNestFactory.create(T10Module, exception_filter_mode=mode).get_server()
+        ).post("/t10/orders")
+        for mode in (ExceptionFilterMode.ENDPOINT, ExceptionFilterMode.ROUTER)
+    ]
+
+    for response in responses:
+        assert response.status_code == 201
+        assert response.json() == {"id": 0, "status": "missing"}
@@ -0,0 +1,140 @@
+import json
+import logging
+
+import pytest
+
+from nest.common.exceptions import CircularDependencyException
+from nest.core import Controller, Get, Injectable, Module
+from nest.core import pynest_container
+from nest.core.graph_cache import GraphCache, source_fingerprint
+from nest.core.pynest_container import PyNestContainer
+
+
+@Injectable
+class Settings:
+    pass
+
+
+@Injectable
+class Mailer:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+@Controller("/mail")
+class MailController:
+    def __init__(self, mailer: Mailer):
+        self.mailer = mailer
+
+    @Get("/")
+    def index(self):
+        return {}
+
+
+@Module(controllers=[MailController], providers=[Settings, Mailer, {"provide": "SENDER", "useValue": "noreply"}])
+class MailModule:
+    pass
+
+
+def _build(path):
+    container = PyNestContainer()
+    container.add_module(MailModule)
+    container.build(graph_cache=str(path))
+    return container
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("validation should have been skipped")
+
+
+def test_graph_cache_skips_validation_on_matching_source(tmp_path, monkeypatch):
+    path = tmp_path / "graph.json"
+    first = _build(path)
+    assert path.exists()
+
+    monkeypatch.setattr(pynest_container, "validate_module_encapsulation", _fail)
+    monkeypatch.setattr(PyNestContainer, "_validate_dependency_graph", _fail)
+    second = _build(path)
+
+    assert second.get(MailController).mailer.settings is second.get(Settings)
+    assert second.get("SENDER") == "noreply"
+    assert [set(level) for level in second._provider_graph.levels()] == [
+        set(level) for level in first._provider_graph.levels()
+    ]
+
+
+def test_stale_graph_cache_is_revalidated(tmp_path, monkeypatch):
+    path = tmp_path / "graph.json"
+    _build(path)
+    data = json.loads(path.read_text())
+    data["fingerprint"] = "changed"
+    path.write_text(json.dumps(data))
+
+    calls = []
+    original = PyNestContainer._validate_dependency_graph
+    monkeypatch.setattr(
+        PyNestContainer,
+        "_validate_dependency_graph",
+        lambda self: calls.append(1) or original(self),
+    )
+    _build(path)
+
+    assert calls == [1]
+    assert json.loads(path.read_text())["fingerprint"] != "changed"
+
+
+def test_graph_cache_ignores_unresolvable_nodes(tmp_path):
+    path = tmp_path / "graph.json"
+    fingerprint = source_fingerprint([Settings])
+    path.write_text(
+        json.dumps(
+            {"format": 1, "fingerprint": fingerprint, "graph": {"cls:missing.module:Gone": []}}
+        )
+    )
+    assert GraphCache(str(path)).load(fingerprint, [Settings]) is None
+
+
+def test_cycles_are_still_detected_without_a_cache(tmp_path):
+    @Injectable
+    class Left:
+        def __init__(self, right: "Right"):
+            pass
+
+    @Injectable
+    class Right:
+        def __init__(self, left: Left):
+            pass
+
+    @Module(providers=[Left, Right])
+    class CycleModule:
+        pass
+
+    container = PyNestContainer()
+    container.add_module(CycleModule)
+    with pytest.raises(CircularDependencyException):
+        container.build(graph_cache=str(tmp_path / "graph.json"))
+
+
+def test_failed_save_removes_its_temporary_file(tmp_path, monkeypatch):
+    from nest.core import graph_cache
+
+    def disk_full(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    graph = _build(tmp_path / "first.json")._provider_graph
+    monkeypatch.setattr(graph_cache.json, "dump", disk_full)
+    path = tmp_path / "graph.json"
+
+    assert GraphCache(str(path)).save("fingerprint", graph) is False
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["first.json"]
+
+
+def test_unwritable_cache_path_does_not_stop_the_build(tmp_path, caplog):
+    not_a_directory = tmp_path / "cache"
+    not_a_directory.write_text("")
+
+    with caplog.at_level(logging.WARNING, logger="pynest"):
+        container = _build(not_a_directory / "graph.json")
+
+    assert container.get(Mailer).settings is container.get(Settings)
+    assert "Could not write the provider graph cache" in caplog.text
@@ -0,0 +1,236 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from nest.core import BootstrapMode, Controller, Get, Injectable, Module, PyNestFactory
+from nest.core.lazy_module_loader import LazyModuleLoader
+
+
+@Injectable
+class ReportRenderer:
+    initialized = 0
+
+    def on_module_init(self):
+        ReportRenderer.initialized += 1
+
+
+@Module(providers=[ReportRenderer], exports=[ReportRenderer], lazy=True)
+class ReportsModule:
+    pass
+
+
+@Injectable
+class ExportService:
+    def __init__(self, loader: LazyModuleLoader):
+        self.loader = loader
+
+
+@Controller("/health")
+class HealthController:
+    @Get("/")
+    def health(self):
+        return {"ok": True}
+
+
+@Module(
+    imports=[ReportsModule],
+    controllers=[HealthController],
+    providers=[ExportService],
+)
+class LazyAppModule:
+    pass
+
+
+def _module_names(app):
+    return {ref.name for ref in app.container.modules.values()}
+
+
+def test_lazy_module_loads_on_first_access():
+    ReportRenderer.initialized = 0
+    app = PyNestFactory.create(LazyAppModule)
+    assert "ReportsModule" not in _module_names(app)
+    assert TestClient(app.get_server()).get("/health/").json() == {"ok": True}
+
+    renderer = app.container.get(ReportRenderer)
+
+    assert "ReportsModule" in _module_names(app)
+    assert app.container.get(ReportRenderer) is renderer
+    assert ReportRenderer.initialized == 1
+
+
+def test_lazy_module_loader_is_injectable():
+    @Injectable
+    class AuditLog:
+        pass
+
+    @Module(providers=[AuditLog])
+    class AuditModule:
+        pass
+
+    app = PyNestFactory.create(LazyAppModule)
+    loader = app.container.get(ExportService).loader
+
+    module_ref = asyncio.run(loader.load(AuditModule))
+    assert module_ref.metatype is AuditModule
+    assert isinstance(app.container.get(AuditLog), AuditLog)
+    assert asyncio.run(loader.load(AuditModule)) is module_ref
+
+
+def test_lazy_module_cannot_register_controllers():
+    @Module(controllers=[HealthController], lazy=True)
+    class LazyWithControllers:
+        pass
+
+    @Module(imports=[LazyWithControllers])
+    class Root:
+        pass
+
+    app = PyNestFactory.create(Root)
+    with pytest.raises(ValueError, match="cannot register controllers"):
+        app.container.load_lazy_module(LazyWithControllers)
+
+
+@Injectable
+class LoopBoundClient:
+    def __init__(self):
+        self.loop = None
+
+    async def on_module_init(self):
+        self.loop = asyncio.get_running_loop()
+
+
+@Module(providers=[LoopBoundClient], exports=[LoopBoundClient], lazy=True)
+class ClientModule:
+    pass
+
+
+@Controller("/clients")
+class ClientController:
+    def __init__(self, loader: LazyModuleLoader):
+        self.loader = loader
+
+    @Get("/sync-get")
+    async def sync_get(self):
+        self.loader._container.get(LoopBoundClient)
+        return {"loaded": True}
+
+    @Get("/load")
+    async def load(self):
+        await self.loader.load(ClientModule)
+        client = self.loader._container.get(LoopBoundClient)
+        return {"same_loop": client.loop is asyncio.get_running_loop()}
+
+
+@Module(imports=[ClientModule], controllers=[ClientController])
+class ClientAppModule:
+    pass
+
+
+def test_lazy_module_loads_on_the_serving_loop_from_an_async_route():
+    app = PyNestFactory.create(ClientAppModule)
+    client = TestClient(app.get_server())
+
+    with pytest.raises(RuntimeError, match="load_lazy_module_async"):
+        client.get("/clients/sync-get")
+    assert "ClientModule" not in _module_names(app)
+
+    assert client.get("/clients/load").json() == {"same_loop": True}
+    assert client.get("/clients/sync-get").json() == {"loaded": True}
+
+
+def _injected_lazy_application():
+    @Injectable
+    class Mailer:
+        def __init__(self):
+            self.loop = None
+
+        async def on_module_init(self):
+            self.loop = asyncio.get_running_loop()
+
+    @Module(providers=[Mailer], exports=[Mailer], lazy=True)
+    class MailModule:
+        pass
+
+    @Injectable
+    class Digest:
+        def __init__(self, mailer: Mailer):
+            self.mailer = mailer
+            self.mailer_ready = None
+
+        def on_module_init(self):
+            self.mailer_ready = self.mailer.loop is not None
+
+    @Controller("/mail")
+    class MailController:
+        def __init__(self, mailer: Mailer):
+            self.mailer = mailer
+
+        @Get("/")
+        async def status(self):
+            return {"same_loop": self.mailer.loop is asyncio.get_running_loop()}
+
+    @Module(imports=[MailModule], controllers=[MailController], providers=[Digest])
+    class MailAppModule:
+        pass
+
+    return MailAppModule, Digest
+
+
+def test_injected_lazy_module_is_loaded_during_bootstrap():
+    app_module, digest = _injected_lazy_application()
+    app = PyNestFactory.create(app_module)
+
+    assert "MailModule" in _module_names(app)
+    assert app.container.get(digest).mailer_ready is True
+    assert TestClient(app.get_server()).get("/mail/").status_code == 200
+
+
+@pytest.mark.parametrize("bootstrap", [BootstrapMode.LIFESPAN, "build"])
+def test_injected_lazy_module_loads_on_the_serving_loop(bootstrap):
+    app_module, digest = _injected_lazy_application()
+    if bootstrap == "build":
+        app = PyNestFactory.build(app_module)
+    else:
+        app = PyNestFactory.create(app_module, bootstrap=bootstrap)
+
+    with TestClient(app.get_server()) as client:
+        assert client.get("/mail/").json() == {"same_loop": True}
+        assert app.container.get(digest).mailer_ready is True
+
+
+def _synthetic_tree(feature_count: int, providers_per_feature: int, lazy: bool):
+    features = []
+    for index in range(feature_count):
+        chain = [Injectable(type(f"F{index}S0", (), {}))]
+        for depth in range(1, providers_per_feature):
+
+            def __init__(self, dep):
+                self.dep = dep
+
+            __init__.__annotations__ = {"dep": chain[-1]}
+            chain.append(
+                Injectable(type(f"F{index}S{depth}", (), {"__init__": __init__}))
+            )
+        module = Module(providers=chain, exports=chain[-1:], lazy=lazy)(
+            type(f"Feature{index}Module", (), {})
+        )
+        features.append((module, chain[-1]))
+
+    root = Module(imports=[m for m, _ in features])(type("SyntheticRoot", (), {}))
+    return root, features
+
+
+def test_lazy_modules_are_compiled_only_on_first_use():
+    eager_root, _ = _synthetic_tree(20, 8, lazy=False)
+    assert len(PyNestFactory.create(eager_root).container.modules) == 21
+
+    root, features = _synthetic_tree(20, 8, lazy=True)
+    app = PyNestFactory.create(root)
+
+    assert len(app.container.modules) == 1
+    assert set(app.container._lazy_modules) == {module for module, _ in features}
+    _, last_provider = features[-1]
+    assert app.container.get(last_provider).dep is not None
+    assert len(app.container.modules) == 2
+    assert len(app.container._lazy_modules) == 19
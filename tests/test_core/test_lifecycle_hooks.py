@@ -1,8 +1,10 @@
 import asyncio
 import signal
 
+import pytest
 from fastapi.testclient import TestClient
 
+from nest.common.exceptions import LifecycleHookTimeoutException
 from nest.common.interfaces import (
     BeforeApplicationShutdown,
     OnApplicationBootstrap,
@@ -10,6 +12,7 @@ from nest.common.interfaces import (
     OnModuleDestroy,
     OnModuleInit,
 )
+from nest.common.provider import Scope
 from nest.core import Injectable, Module, PyNestFactory
 
 
@@ -222,3 +225,131 @@ def test_enable_shutdown_hooks_wires_sigint_and_sigterm_to_app_close(monkeypatch
     sigterm_handler(signal.SIGTERM, None)
 
     assert events == ["closed"]
+
+
+def test_independent_modules_run_hooks_concurrently_after_their_imports():
+    events = []
+
+    def make_warmer(name):
+        @Injectable
+        class Warmer(OnModuleInit, OnModuleDestroy):
+            async def on_module_init(self):
+                events.append(f"{name}:init-start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:init")
+
+            async def on_module_destroy(self):
+                events.append(f"{name}:destroy-start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:destroy")
+
+        return Module(providers=[Warmer])(type(f"{name}Module", (), {}))
+
+    cache_module, consumers_module = make_warmer("cache"), make_warmer("consumers")
+
+    @Module(imports=[cache_module, consumers_module])
+    class AppModule(OnModuleInit, OnModuleDestroy):
+        def on_module_init(self):
+            events.append("app:init")
+
+        def on_module_destroy(self):
+            events.append("app:destroy")
+
+    app = PyNestFactory.create(AppModule)
+    # Both warmers start before either finishes, and the app waits for both.
+    assert set(events[:2]) == {"cache:init-start", "consumers:init-start"}
+    assert set(events[2:4]) == {"cache:init", "consumers:init"}
+    assert events[4:] == ["app:init"]
+
+    asyncio.run(app.close())
+    assert events[5] == "app:destroy"
+    assert set(events[6:8]) == {"cache:destroy-start", "consumers:destroy-start"}
+    assert set(events[8:]) == {"cache:destroy", "consumers:destroy"}
+
+    report = app.container.lifecycle_report
+    assert {t.module for t in report.timings if t.hook == "on_module_init"} == {
+        "cacheModule",
+        "consumersModule",
+        "AppModule",
+    }
+    assert "on_module_destroy" in report.format()
+
+
+def test_startup_hook_timeout_aborts_bootstrap():
+    @Injectable
+    class SlowService(OnModuleInit):
+        async def on_module_init(self):
+            await asyncio.sleep(1)
+
+    @Module(providers=[SlowService])
+    class SlowModule:
+        pass
+
+    with pytest.raises(LifecycleHookTimeoutException, match="SlowService.on_module_init"):
+        PyNestFactory.create(SlowModule, lifecycle_hook_timeout=0.05)
+
+
+def test_shutdown_hook_timeout_is_logged_and_shutdown_continues():
+    events = []
+
+    @Injectable
+    class StuckService(OnModuleDestroy, OnApplicationShutdown):
+        async def on_module_destroy(self):
+            await asyncio.sleep(1)
+            events.append("destroyed")
+
+        def on_application_shutdown(self, signal):
+            events.append("shutdown")
+
+    @Module(providers=[StuckService])
+    class StuckModule:
+        pass
+
+    app = PyNestFactory.create(StuckModule, lifecycle_hook_timeout=0.05)
+    asyncio.run(app.close())
+
+    assert events == ["shutdown"]
+    timed_out = [t for t in app.container.lifecycle_report.timings if t.timed_out]
+    assert [(t.owner, t.hook) for t in timed_out] == [("StuckService", "on_module_destroy")]
+
+
+def test_lifecycle_instances_are_resolved_once_across_phases():
+    created = []
+
+    @Injectable(scope=Scope.TRANSIENT)
+    class Plain:
+        def __init__(self):
+            created.append("plain")
+
+    @Injectable(scope=Scope.TRANSIENT)
+    class Worker(OnModuleInit, OnModuleDestroy, OnApplicationShutdown):
+        def __init__(self):
+            created.append("worker")
+            self.events = []
+
+        def on_module_init(self):
+            self.events.append("init")
+
+        def on_module_destroy(self):
+            self.events.append("destroy")
+
+        def on_application_shutdown(self, signal):
+            self.events.append("shutdown")
+
+    @Module(providers=[Plain, Worker])
+    class WorkerModule:
+        pass
+
+    app = PyNestFactory.create(WorkerModule)
+    worker = app.container._get_module_lifecycle_hooks(
+        next(iter(app.container.modules.values()))
+    )["on_module_init"][0]
+
+    resolved = []
+    original_get = app.container.get
+    app.container.get = lambda token: resolved.append(token) or original_get(token)
+    asyncio.run(app.close())
+
+    assert created == ["worker"]
+    assert worker.events == ["init", "destroy", "shutdown"]
+    assert resolved == []
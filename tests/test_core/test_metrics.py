@@ -0,0 +1,124 @@
+import json
+import os
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from nest.common.exceptions import ExceptionFilter
+from nest.common.route_resolver import ExceptionFilterMode
+from nest.core import (
+    Catch,
+    Controller,
+    Get,
+    Module,
+    Post,
+    PyNestFactory,
+    RouteMetrics,
+    UseFilters,
+)
+from nest.core.metrics import RouteStats, _bucket_index, _bucket_upper_bound
+
+
+class ItemMissing(Exception):
+    pass
+
+
+@Catch(ItemMissing)
+class ItemMissingFilter(ExceptionFilter):
+    def catch(self, exception, host):
+        return {"missing": True}
+
+
+@Controller("/items")
+class ItemsController:
+    @Get("/{item_id}")
+    def get_item(self, item_id: int):
+        return {"id": item_id}
+
+    @Post("/")
+    def create_item(self):
+        raise HTTPException(status_code=409, detail="exists")
+
+    @Get("/filtered/{item_id}")
+    @UseFilters(ItemMissingFilter)
+    def filtered(self, item_id: int):
+        raise ItemMissing()
+
+
+@Module(controllers=[ItemsController])
+class MetricsModule:
+    pass
+
+
+def _line(body: str, prefix: str) -> str:
+    return next(line for line in body.splitlines() if line.startswith(prefix))
+
+
+def test_histogram_buckets_bound_every_value_within_precision():
+    for value in list(range(0, 2000)) + [10**6, 123456789, 2**35 + 7]:
+        upper = _bucket_upper_bound(_bucket_index(value))
+        assert value < upper
+        assert upper - value <= max(1, upper / 16)
+
+
+def test_routes_are_counted_by_controller_method_template_and_status():
+    metrics = RouteMetrics(path="/internal/metrics")
+    app = PyNestFactory.create(
+        MetricsModule,
+        metrics=metrics,
+        exception_filter_mode=ExceptionFilterMode.ROUTER,
+    )
+    with TestClient(app.get_server()) as client:
+        assert client.get("/items/1").json() == {"id": 1}
+        client.get("/items/2")
+        client.get("/items/nope")
+        assert client.post("/items").status_code == 409
+        assert client.get("/items/filtered/3").json() == {"missing": True}
+        response = client.get("/internal/metrics")
+
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    labels = 'controller="ItemsController",method="GET",route="/items/{item_id}"'
+    assert f'pynest_http_requests_total{{{labels},status="200"}} 2' in body
+    assert f'pynest_http_requests_total{{{labels},status="422"}} 1' in body
+    assert (
+        'pynest_http_requests_total{controller="ItemsController",method="POST",'
+        'route="/items",status="409"} 1' in body
+    )
+    assert 'route="/items/filtered/{item_id}",status="200"} 1' in body
+    inf_bucket = f'pynest_http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'
+    assert _line(body, inf_bucket).endswith(" 3")
+    assert _line(body, f"pynest_http_request_duration_seconds_count{{{labels}}}").endswith(" 3")
+    assert "/internal/metrics" not in app.get_server().openapi()["paths"]
+
+
+def test_percentile_reads_the_recorded_histogram():
+    stats = RouteStats("C", "GET", "/")
+    for milliseconds in range(1, 101):
+        stats.record(200, milliseconds * 1_000_000)
+
+    assert stats.count == 100
+    assert 0.050 <= stats.percentile(0.5) <= 0.050 * 1.07
+    assert 0.099 <= stats.percentile(0.99) <= 0.099 * 1.07
+
+
+def test_multiprocess_mode_adds_up_worker_snapshots(tmp_path):
+    other_worker = RouteStats("ItemsController", "GET", "/items/{item_id}")
+    other_worker.record(200, 2_000_000)
+    other_worker.record(500, 3_000_000)
+    (tmp_path / "routes-999999.json").write_text(json.dumps([other_worker.to_dict()]))
+
+    metrics = RouteMetrics(multiprocess_dir=str(tmp_path), flush_interval=0.01)
+    app = PyNestFactory.create(MetricsModule, metrics=metrics)
+    with TestClient(app.get_server()) as client:
+        client.get("/items/1")
+        body = client.get("/metrics").text
+
+    labels = 'controller="ItemsController",method="GET",route="/items/{item_id}"'
+    assert f'pynest_http_requests_total{{{labels},status="200"}} 2' in body
+    assert f'pynest_http_requests_total{{{labels},status="500"}} 1' in body
+    assert _line(body, f"pynest_http_request_duration_seconds_count{{{labels}}}").endswith(" 3")
+
+    own_snapshot = tmp_path / f"routes-{os.getpid()}.json"
+    assert own_snapshot.exists()
+    assert metrics._flusher is None
@@ -150,3 +150,97 @@ def test_get_before_build_raises():
     container.add_module(AppModule)
     with pytest.raises(RuntimeError, match="build()"):
         container.get(AppService)
+
+
+# ── Eager instantiation ───────────────────────────────────────────────────────
+
+def test_instantiate_singletons_creates_providers_level_by_level():
+    import asyncio
+
+    created = []
+
+    @Injectable
+    class First:
+        def __init__(self):
+            created.append("First")
+
+    @Injectable
+    class Second:
+        def __init__(self, first: First):
+            created.append("Second")
+
+    @Module(providers=[Second, First])
+    class EagerModule:
+        pass
+
+    container = PyNestContainer()
+    container.add_module(EagerModule)
+    container.build()
+    assert created == []
+
+    report = asyncio.run(container.instantiate_singletons())
+    assert created == ["First", "Second"]
+    assert [(t.name, t.level) for t in report.timings] == [("First", 0), ("Second", 1)]
+    assert container.get(Second) is container.get(Second)
+    assert created == ["First", "Second"]
+
+
+# ── Async factories ───────────────────────────────────────────────────────────
+
+def test_async_factories_are_awaited_concurrently_before_lifecycle_hooks():
+    import asyncio
+
+    opening = {"now": 0, "peak": 0}
+
+    async def open_pool(name):
+        opening["now"] += 1
+        opening["peak"] = max(opening["peak"], opening["now"])
+        await asyncio.sleep(0.01)
+        opening["now"] -= 1
+        return f"{name}-pool"
+
+    async def postgres():
+        return await open_pool("postgres")
+
+    async def redis():
+        return await open_pool("redis")
+
+    async def mongo():
+        return await open_pool("mongo")
+
+    seen_at_init = []
+
+    @Injectable
+    class Warmup:
+        def on_module_init(self):
+            seen_at_init.append(container.get("PG_POOL"))
+
+    @Module(
+        providers=[
+            {"provide": "PG_POOL", "useFactory": postgres},
+            {"provide": "REDIS_POOL", "useFactory": redis},
+            {"provide": "MONGO_POOL", "useFactory": mongo},
+            {"provide": "POOLS", "useFactory": lambda *pools: list(pools),
+             "inject": ["PG_POOL", "REDIS_POOL", "MONGO_POOL"]},
+            {"provide": "PRIMARY", "useExisting": "PG_POOL"},
+            Warmup,
+        ]
+    )
+    class PoolModule:
+        pass
+
+    container = PyNestContainer()
+    container.add_module(PoolModule)
+    container.build()
+
+    with pytest.raises(RuntimeError, match="async factory"):
+        container.get("PG_POOL")
+    with pytest.raises(RuntimeError, match="async factory"):
+        container.get("POOLS")
+
+    asyncio.run(container.initialize_lifecycle())
+    assert opening["peak"] == 3
+
+    assert seen_at_init == ["postgres-pool"]
+    assert container.get("PG_POOL") is container.get("PRIMARY")
+    assert container.get("POOLS") == ["postgres-pool", "redis-pool", "mongo-pool"]
@@ -1,8 +1,13 @@
+import asyncio
+import logging
+import threading
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from nest.core import Module, Injectable, Controller, Get, PyNestFactory
+from nest.common.provider import Scope
+from nest.core import BootstrapMode, Module, Injectable, Controller, Get, PyNestFactory
 from nest.core.pynest_application import PyNestApp
 
 
@@ -70,3 +75,118 @@ def test_service_dep_is_instance_attribute_not_class():
     ctrl = app.container.get_controller_instance(TestController)
     assert "svc" in ctrl.__dict__
     assert "svc" not in TestController.__dict__
+
+
+def test_eager_singletons_records_startup_report():
+    app = PyNestFactory.create(TestModule, eager_singletons=True)
+    report = app.container.startup_report
+
+    levels = {timing.token: timing.level for timing in report.timings}
+    assert levels[MessageService] < levels[TestController]
+    assert "MessageService" in report.format()
+    assert PyNestFactory.create(TestModule).container.startup_report is None
+
+
+@Injectable
+class LoopBoundPool:
+    def __init__(self):
+        self.loop = None
+
+    async def on_module_init(self):
+        self.loop = asyncio.get_running_loop()
+
+
+@Module(controllers=[TestController], providers=[MessageService, LoopBoundPool])
+class LoopModule:
+    pass
+
+
+def test_create_async_bootstraps_on_the_running_loop(monkeypatch):
+    def no_threads(*args, **kwargs):
+        raise AssertionError("create_async must not start a thread")
+
+    monkeypatch.setattr(threading, "Thread", no_threads)
+
+    async def run():
+        app = await PyNestFactory.create_async(LoopModule, eager_singletons=True)
+        return app, asyncio.get_running_loop()
+
+    app, loop = asyncio.run(run())
+    assert app.container.get(LoopBoundPool).loop is loop
+    assert app.container.startup_report is not None
+
+
+def test_create_inside_a_running_loop_defers_bootstrap_to_the_lifespan(monkeypatch):
+    def no_threads(*args, **kwargs):
+        raise AssertionError("create must not start a thread inside a running loop")
+
+    async def run():
+        with monkeypatch.context() as patch:
+            patch.setattr(threading, "Thread", no_threads)
+            return PyNestFactory.create(LoopModule)
+
+    app = asyncio.run(run())
+    assert not app.container.lifecycle_initialized
+
+    with TestClient(app.get_server()) as client:
+        assert app.container.get(LoopBoundPool).loop is not None
+        assert client.get("/test").json() == {"message": "Hello, World!"}
+
+
+def test_create_inside_a_running_loop_starts_on_first_request_without_lifespan(caplog):
+    async def run():
+        return PyNestFactory.create(LoopModule)
+
+    with caplog.at_level(logging.WARNING, logger="pynest"):
+        app = asyncio.run(run())
+    assert any(
+        record.levelno == logging.WARNING and "create_async" in record.getMessage()
+        for record in caplog.records
+    )
+    with pytest.raises(RuntimeError, match="Application not started"):
+        app.container.get(LoopBoundPool)
+
+    # No `with`: the test client skips the lifespan, as `lifespan="off"` does.
+    client = TestClient(app.get_server())
+    assert client.get("/test").json() == {"message": "Hello, World!"}
+    assert app.container.lifecycle_initialized
+    assert app.container.get(LoopBoundPool).loop is not None
+
+
+def test_lifespan_bootstrap_only_compiles_metadata_in_create():
+    app = PyNestFactory.create(
+        LoopModule, bootstrap=BootstrapMode.LIFESPAN, eager_singletons=True
+    )
+    assert not app.container.is_built
+    assert not any(getattr(r, "path", "") == "/test/" for r in app.get_server().routes)
+
+    with TestClient(app.get_server()) as client:
+        assert app.container.lifecycle_initialized
+        assert app.container.startup_report is not None
+        assert app.container.get(LoopBoundPool).loop is not None
+        assert client.get("/test").json() == {"message": "Hello, World!"}
+
+
+def test_lifespan_bootstrap_supports_request_scoped_controllers():
+    @Injectable(scope=Scope.REQUEST)
+    class RequestCounter:
+        def __init__(self):
+            self.value = id(self)
+
+    @Controller("/scoped", scope=Scope.REQUEST)
+    class ScopedController:
+        def __init__(self, counter: RequestCounter):
+            self.counter = counter
+
+        @Get("/")
+        def index(self):
+            return {"id": self.counter.value}
+
+    @Module(controllers=[ScopedController], providers=[RequestCounter])
+    class ScopedModule:
+        pass
+
+    app = PyNestFactory.create(ScopedModule, bootstrap=BootstrapMode.LIFESPAN)
+    with TestClient(app.get_server()) as client:
+        first, second = client.get("/scoped").json(), client.get("/scoped").json()
+    assert first != second
@@ -0,0 +1,169 @@
+import asyncio
+import itertools
+
+from fastapi.testclient import TestClient
+
+from nest.common.provider import ProviderDescriptor, Scope
+from nest.core import Controller, Get, Injectable, Module, PyNestFactory
+from nest.core.injector_module import build_injector
+from nest.core.request_scope import RequestContext, RequestScopeMiddleware
+
+_ids = itertools.count(1)
+
+
+@Injectable(scope=Scope.REQUEST)
+class RequestSession:
+    destroyed = []
+
+    def __init__(self):
+        self.id = next(_ids)
+
+    async def on_request_destroy(self):
+        RequestSession.destroyed.append(self.id)
+
+
+@Injectable
+class SessionRepo:
+    def __init__(self, session: RequestSession):
+        self.session = session
+
+
+@Injectable
+class ReportService:
+    def __init__(self, session: RequestSession, repo: SessionRepo):
+        self.session = session
+        self.repo = repo
+
+
+@Controller("/scoped")
+class ScopedController:
+    def __init__(self, service: ReportService, session: RequestSession):
+        self.service = service
+        self.session = session
+
+    @Get("/")
+    def show(self):
+        return {
+            "controller": self.session.id,
+            "service": self.service.session.id,
+            "repo": self.service.repo.session.id,
+        }
+
+    @Get("/async")
+    async def show_async(self):
+        return {"controller": self.session.id}
+
+
+@Injectable
+class Counter:
+    created = 0
+
+    def __init__(self):
+        Counter.created += 1
+
+
+@Controller("/static")
+class StaticController:
+    def __init__(self, counter: Counter):
+        self.counter = counter
+
+    @Get("/")
+    def show(self):
+        return {"created": Counter.created}
+
+
+@Module(
+    controllers=[ScopedController, StaticController],
+    providers=[RequestSession, SessionRepo, ReportService, Counter],
+)
+class ScopedModule:
+    pass
+
+
+def test_request_scope_caches_per_context():
+    injector = build_injector(
+        [ProviderDescriptor(provide=RequestSession, use_class=RequestSession, scope=Scope.REQUEST)]
+    )
+
+    async def run():
+        async with RequestContext():
+            first = injector.get(RequestSession)
+            assert injector.get(RequestSession) is first
+        async with RequestContext():
+            second = injector.get(RequestSession)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is not second
+    assert injector.get(RequestSession) is not injector.get(RequestSession)
+
+
+def test_request_scoped_factory_runs_once_per_request():
+    calls = []
+    descriptors = [
+        ProviderDescriptor(
+            provide="TENANT",
+            use_factory=lambda: calls.append(1) or len(calls),
+            scope=Scope.REQUEST,
+        )
+    ]
+    injector = build_injector(descriptors)
+    assert calls == []
+
+    async def run():
+        async with RequestContext():
+            return injector.get("TENANT"), injector.get("TENANT")
+
+    assert asyncio.run(run()) == (1, 1)
+    assert asyncio.run(run()) == (2, 2)
+
+
+def test_scope_propagates_to_dependents():
+    app = PyNestFactory.create(ScopedModule)
+    container = app.container
+
+    assert container.is_request_scoped(RequestSession)
+    assert container.is_request_scoped(SessionRepo)
+    assert container.is_request_scoped(ReportService)
+    assert container.is_request_scoped(ScopedController)
+    assert not container.is_request_scoped(StaticController)
+    assert not container.is_request_scoped(Counter)
+    assert any(m.cls is RequestScopeMiddleware for m in app.get_server().user_middleware)
+
+
+def test_request_scoped_instances_are_shared_within_and_torn_down_after_a_request():
+    RequestSession.destroyed = []
+    client = TestClient(PyNestFactory.create(ScopedModule).get_server())
+
+    first = client.get("/scoped/").json()
+    second = client.get("/scoped/").json()
+    third = client.get("/scoped/async").json()
+
+    assert first["controller"] == first["service"] == first["repo"]
+    assert second["controller"] == second["service"] == second["repo"]
+    assert len({first["controller"], second["controller"], third["controller"]}) == 3
+    assert RequestSession.destroyed == [
+        first["controller"],
+        second["controller"],
+        third["controller"],
+    ]
+
+
+def test_singletons_are_unaffected_by_request_scope():
+    Counter.created = 0
+    client = TestClient(PyNestFactory.create(ScopedModule).get_server())
+
+    client.get("/static/")
+    assert client.get("/static/").json() == {"created": 1}
+
+
+def test_app_without_request_scoped_providers_has_no_middleware():
+    @Module(controllers=[StaticController], providers=[Counter])
+    class PlainModule:
+        pass
+
+    app = PyNestFactory.create(PlainModule)
+    assert not app.container.has_request_scoped_providers
+    assert not any(
+        m.cls is RequestScopeMiddleware for m in app.get_server().user_middleware
+    )
@@ -0,0 +1,121 @@
+import asyncio
+
+from nest.common.provider import InjectionToken, ProviderDescriptor, Scope
+from nest.core import Injectable, Module
+from nest.core.pynest_container import PyNestContainer
+from nest.core.request_scope import RequestContext
+
+
+@Injectable
+class Config:
+    pass
+
+
+@Injectable(scope=Scope.TRANSIENT)
+class Formatter:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+@Injectable(scope=Scope.REQUEST)
+class Session:
+    pass
+
+
+@Injectable(scope=Scope.TRANSIENT)
+class Handler:
+    def __init__(self, formatter: Formatter, session: Session):
+        self.formatter = formatter
+        self.session = session
+
+
+URL = InjectionToken("URL")
+
+
+@Module(
+    providers=[
+        Config,
+        Formatter,
+        Session,
+        Handler,
+        ProviderDescriptor(provide=URL, use_value="sqlite://"),
+    ]
+)
+class PlanModule:
+    pass
+
+
+def _build(module):
+    container = PyNestContainer()
+    container.add_module(module)
+    container.build()
+    return container
+
+
+def test_compiled_resolvers_honour_scopes():
+    container = _build(PlanModule)
+
+    assert container.get(Config) is container.get(Config)
+    assert container.get(Config) is container._injector.get(Config)
+    assert container.get(URL) == "sqlite://"
+
+    first, second = container.get(Formatter), container.get(Formatter)
+    assert first is not second
+    assert first.config is second.config is container.get(Config)
+
+
+def test_compiled_request_scope_shares_the_injector_cache():
+    container = _build(PlanModule)
+
+    async def run():
+        async with RequestContext():
+            handler = container.get(Handler)
+            return handler, container.get(Session), container._injector.get(Session)
+
+    handler, compiled, injected = asyncio.run(run())
+    assert handler.session is compiled is injected
+    assert container.get(Session) is not container.get(Session)
+
+
+def test_get_resolver_returns_the_compiled_closure():
+    container = _build(PlanModule)
+    assert isinstance(container.get_resolver(Formatter)(), Formatter)
+
+    asyncio.run(container.bootstrap())
+    resolve = container.get_resolver(Formatter)
+    assert isinstance(resolve(), Formatter)
+    assert container.get_resolver(Formatter) is resolve
+
+
+def _deep_chain_module(depth: int):
+    chain = [Injectable(scope=Scope.TRANSIENT)(type("Link0", (), {}))]
+    for index in range(1, depth):
+
+        def __init__(self, dep):
+            self.dep = dep
+
+        __init__.__annotations__ = {"dep": chain[-1]}
+        link = type(f"Link{index}", (), {"__init__": __init__})
+        chain.append(Injectable(scope=Scope.TRANSIENT)(link))
+
+    module = Module(providers=chain)(type("DeepChainModule", (), {}))
+    return module, chain[-1]
+
+
+def test_deep_transient_graph_resolves_without_the_injector():
+    module, top = _deep_chain_module(20)
+    container = _build(module)
+    calls = []
+    injector_get = container._injector.get
+
+    def counting_get(key, *args, **kwargs):
+        calls.append(key)
+        return injector_get(key, *args, **kwargs)
+
+    container._injector.get = counting_get
+
+    instance, depth = container.get(top), 1
+    while hasattr(instance, "dep"):
+        instance, depth = instance.dep, depth + 1
+    assert depth == 20
+    assert calls == []
@@ -0,0 +1,166 @@
+import json
+import threading
+
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from nest.common.decorators import Query
+from nest.common.exceptions import ArgumentsHost, ExceptionFilter
+from nest.common.tracing import Span
+from nest.core import (
+    BaseGuard,
+    Controller,
+    Get,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    Module,
+    PhaseTracer,
+    PyNestFactory,
+    UseGuards,
+)
+from nest.core.decorators.filters import Catch, UseFilters
+
+
+class AllowGuard(BaseGuard):
+    def can_activate(self, request: Request, credentials=None) -> bool:
+        return True
+
+
+@Catch(LookupError)
+class LookupFilter(ExceptionFilter):
+    def catch(self, exception: LookupError, host: ArgumentsHost):
+        return {"found": False}
+
+
+@Controller("/traced")
+class TracedController:
+    @Get("/guarded")
+    @UseGuards(AllowGuard)
+    def guarded(self, q: str = Query("q")):
+        return {"q": q}
+
+    @Get("/plain")
+    def plain(self):
+        return {"ok": True}
+
+    @Get("/missing")
+    @UseFilters(LookupFilter)
+    async def missing(self):
+        raise LookupError("nope")
+
+
+@Module(controllers=[TracedController])
+class TracedModule:
+    pass
+
+
+def _client(tracer: PhaseTracer) -> TestClient:
+    return TestClient(PyNestFactory.create(TracedModule, tracer=tracer).get_server())
+
+
+def test_sampled_request_records_a_span_per_phase_under_the_request_span():
+    exporter = InMemorySpanExporter()
+    client = _client(PhaseTracer(exporter))
+
+    assert client.get("/traced/guarded", params={"q": "x"}).json() == {"q": "x"}
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {"guard", "params", "handler", "request"}
+    root = spans["request"]
+    assert root.parent_span_id is None
+    assert root.attributes == {
+        "http.method": "GET",
+        "http.route": "/traced/guarded",
+        "pynest.controller": "TracedController",
+        "http.status_code": 200,
+    }
+    assert spans["guard"].attributes == {"pynest.guard": "AllowGuard"}
+    for name in ("guard", "params", "handler"):
+        span = spans[name]
+        assert span.trace_id == root.trace_id
+        assert span.parent_span_id == root.span_id
+        assert root.start_time_unix_nano <= span.start_time_unix_nano
+        assert span.end_time_unix_nano <= root.end_time_unix_nano
+
+
+def test_sync_handler_span_is_recorded_from_the_threadpool():
+    exporter = InMemorySpanExporter()
+    client = _client(PhaseTracer(exporter))
+
+    client.get("/traced/plain")
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["handler", "request"]
+
+
+def test_filter_span_and_traceparent_propagation():
+    exporter = InMemorySpanExporter()
+    client = _client(PhaseTracer(exporter))
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    response = client.get("/traced/missing", headers={"traceparent": traceparent})
+
+    assert response.json() == {"found": False}
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["handler"].error == "LookupError"
+    assert spans["filter"].attributes == {"pynest.exception": "LookupError"}
+    assert spans["filter"].error is None
+    assert spans["request"].trace_id == 0x4BF92F3577B34DA6A3CE929D0E0E4736
+    assert spans["request"].parent_span_id == 0x00F067AA0BA902B7
+
+
+def test_unsampled_requests_record_nothing():
+    exporter = InMemorySpanExporter()
+    client = _client(PhaseTracer(exporter, sample_rate=0.0))
+
+    client.get("/traced/guarded", params={"q": "x"})
+
+    assert exporter.get_finished_spans() == []
+
+
+def test_json_lines_exporter_writes_one_span_per_line(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = PhaseTracer(JsonLinesSpanExporter(str(path)))
+
+    with _client(tracer) as client:
+        client.get("/traced/plain")
+        client.get("/traced/plain")
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["handler", "request"] * 2
+    assert len(records[1]["trace_id"]) == 32
+    assert records[0]["parent_span_id"] == records[1]["span_id"]
+    assert records[1]["status"] == {"code": "OK"}
+
+
+def test_json_lines_exporter_writes_from_a_background_thread(tmp_path, monkeypatch):
+    path = tmp_path / "spans.jsonl"
+    exporter = JsonLinesSpanExporter(str(path))
+    writers = set()
+    to_dict = Span.to_dict
+
+    def recording_to_dict(span):
+        writers.add(threading.current_thread().name)
+        return to_dict(span)
+
+    monkeypatch.setattr(Span, "to_dict", recording_to_dict)
+    spans = [Span("handler", 1, index, None, 0, 1) for index in range(5)]
+    exporter.export(spans[:2])
+    exporter.export(spans[2:])
+    exporter.force_flush()
+
+    assert len(path.read_text().splitlines()) == 5
+    assert writers == {"pynest-span-writer"}
+
+    exporter.shutdown()
+    exporter.export(spans)
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_json_lines_exporter_drops_spans_beyond_its_queue(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = JsonLinesSpanExporter(str(path), max_queue_size=0)
+
+    exporter.export([Span("handler", 1, 1, None, 0, 1)])
+    exporter.shutdown()
+
+    assert path.read_text() == ""
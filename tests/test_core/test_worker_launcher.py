@@ -0,0 +1,160 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from nest.common.interfaces import OnModuleInit
+from nest.common.provider import InjectionToken, ProviderDescriptor
+from nest.core import Controller, Get, Injectable, Module, PyNestFactory
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+POOL = InjectionToken("POOL")
+
+
+async def create_pool():
+    return {"connected": True}
+
+
+@Injectable
+class Settings:
+    pass
+
+
+@Injectable
+class Repository(OnModuleInit):
+    def __init__(self, pool: POOL):
+        self.pool = pool
+        self.initialized = False
+
+    def on_module_init(self):
+        self.initialized = True
+
+
+@Controller("/repo")
+class RepositoryController:
+    def __init__(self, repository: Repository):
+        self.repository = repository
+
+    @Get("/")
+    def state(self):
+        return {"initialized": self.repository.initialized, **self.repository.pool}
+
+
+@Module(
+    controllers=[RepositoryController],
+    providers=[
+        Settings,
+        Repository,
+        ProviderDescriptor(provide=POOL, use_factory=create_pool),
+    ],
+)
+class WorkerAppModule:
+    pass
+
+
+def test_build_defers_bootstrap_to_the_lifespan():
+    app = PyNestFactory.build(WorkerAppModule)
+    assert not app.container.lifecycle_initialized
+
+    with TestClient(app.get_server()) as client:
+        assert app.container.lifecycle_initialized
+        assert client.get("/repo/").json() == {"initialized": True, "connected": True}
+
+
+def test_preload_singletons_skips_async_dependents():
+    app = PyNestFactory.build(WorkerAppModule)
+    created = app.container.preload_singletons()
+
+    assert Settings in created
+    assert Repository not in created and POOL not in created
+
+
+def _free_port():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_run_workers_serves_from_forked_workers(tmp_path):
+    port = _free_port()
+    events = tmp_path / "events.log"
+    script = tmp_path / "serve.py"
+    script.write_text(
+        textwrap.dedent(
+            f"""
+            import os
+
+            from nest.common.interfaces import OnApplicationShutdown, OnModuleInit
+            from nest.core import Controller, Get, Injectable, Module
+            from nest.core.worker_launcher import run_workers
+
+
+            @Injectable
+            class Recorder(OnModuleInit, OnApplicationShutdown):
+                def on_module_init(self):
+                    with open({str(events)!r}, "a") as log:
+                        log.write(f"init {{os.getpid()}}\\n")
+
+                def on_application_shutdown(self, signal):
+                    with open({str(events)!r}, "a") as log:
+                        log.write(f"shutdown {{os.getpid()}}\\n")
+
+
+            @Controller("/pid")
+            class PidController:
+                @Get("/")
+                def pid(self):
+                    return {{"pid": os.getpid()}}
+
+
+            @Module(controllers=[PidController], providers=[Recorder])
+            class AppModule:
+                pass
+
+
+            if __name__ == "__main__":
+                run_workers(
+                    AppModule,
+                    workers=2,
+                    port={port},
+                    uvicorn_options={{"log_level": "warning"}},
+                )
+            """
+        )
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    parent = subprocess.Popen([sys.executable, str(script)], env=env)
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/pid", trust_env=False)
+                break
+            except httpx.TransportError:
+                assert time.monotonic() < deadline, "workers did not start"
+                time.sleep(0.1)
+        assert response.json()["pid"] != parent.pid
+
+        while events.read_text().count("init") < 2:
+            assert time.monotonic() < deadline, "workers did not bootstrap"
+            time.sleep(0.1)
+    finally:
+        parent.send_signal(signal.SIGTERM)
+        parent.wait(timeout=20)
+
+    lines = events.read_text().split()
+    init_pids = {pid for kind, pid in zip(lines[::2], lines[1::2]) if kind == "init"}
+    shutdown_pids = {pid for kind, pid in zip(lines[::2], lines[1::2]) if kind == "shutdown"}
+    assert len(init_pids) == 2
+    assert shutdown_pids == init_pids
+    assert str(parent.pid) not in init_pids
+    assert parent.returncode == 0